@@ -9,5 +9,6 @@ __version__ = "0.1.0"
 
 # Main API
 from sqlstream.core.query import query
+from sqlstream.core.source_cache import clear_cache
 
-__all__ = ["__version__", "query"]
+__all__ = ["__version__", "query", "clear_cache"]
@@ -41,7 +41,7 @@ from textual.widgets import (
 from textual.widgets.text_area import Selection
 
 try:
-    from sqlstream.core.query import Query, parse, query
+    from sqlstream.core.query import Query, _parse, query
 except ImportError:
     # Fallback for development
     from sqlstream import query
@@ -1879,7 +1879,7 @@ class SQLShellApp(App):
             try:
                 _sources = result._discover_sources()
                 self.loaded_files.extend(
-                    [f for f in _sources.values() if f and f not in self.loaded_files]
+                    [t.source for t in _sources if t.source not in self.loaded_files]
                 )
             except Exception:
                 pass
@@ -2380,7 +2380,7 @@ class SQLShellApp(App):
 
         # Generate query plan
         try:
-            parsed = parse(self.last_query)
+            parsed = _parse(self.last_query)
 
             # Build explain plan text
             plan_lines = []
@@ -7,18 +7,58 @@ This backend bypasses SQLStream's parser and uses DuckDB's native SQL engine.
 
 from __future__ import annotations
 
+import importlib.util
+import os
 from collections.abc import Callable, Iterator
 from typing import Any
 
+from sqlstream.core.fragment_parser import SourceTable
 from sqlstream.readers.base import BaseReader
+from sqlstream.sql.lexer import substitute_tokens
 
-try:
-    import duckdb
+# Only probe for duckdb here; it is imported when an executor is created
+DUCKDB_AVAILABLE = importlib.util.find_spec("duckdb") is not None
 
-    DUCKDB_AVAILABLE = True
-except ImportError:
-    DUCKDB_AVAILABLE = False
-    duckdb = None
+# Rows pulled from DuckDB per fetch when yielding dicts
+# (bounds the Python-side buffer regardless of result size)
+FETCH_BATCH_ROWS = 2048
+
+
+# Local files DuckDB scans natively, with projection and filter pushdown
+# (cheaper than materializing them through a Reader into a DataFrame)
+_NATIVE_SCAN_SUFFIXES = (".parquet", ".pq")
+
+
+def _scans_natively(table: SourceTable) -> bool:
+    """
+    Whether DuckDB can read the source itself, exactly as its Reader would
+
+    Covers local Parquet files and globs, and directories of (possibly
+    Hive-partitioned) Parquet files, which no Reader handles.
+    """
+    return (
+        table.format in (None, "parquet")
+        and table.table_hint is None
+        and "://" not in table.path
+        and (table.path.lower().endswith(_NATIVE_SCAN_SUFFIXES) or os.path.isdir(table.path))
+    )
+
+
+def _is_local_csv(table: SourceTable) -> bool:
+    """Whether the source is a plain local CSV file (loadable via the source cache)"""
+    return (
+        table.format in (None, "csv")
+        and table.table_hint is None
+        and "://" not in table.path
+        and table.path.lower().endswith(".csv")
+    )
+
+
+def _as_source_tables(sources: dict[str, str] | list[SourceTable]) -> list[SourceTable]:
+    """Accept either discovered SourceTables or a plain {table_name: path} mapping"""
+    if isinstance(sources, dict):
+        return [SourceTable.from_source(path, name=name) for name, path in sources.items()]
+    return list(sources)
 
 
 class DuckDBExecutor:
@@ -32,8 +72,8 @@ class DuckDBExecutor:
     - Zero-copy data access where possible
 
     This executor:
-    1. Creates an in-memory DuckDB connection
-    2. Registers data files as tables
+    1. Opens an in-memory DuckDB database (once; each query runs on its own cursor)
+    2. Registers data files as tables (private to the query's cursor)
     3. Executes raw SQL query in DuckDB
     4. Returns results in SQLStream format
 
@@ -45,137 +85,376 @@ class DuckDBExecutor:
         ... )
     """
 
-    def __init__(self):
-        """Initialize DuckDB executor"""
+    def __init__(self, shared: bool = False):
+        """
+        Initialize DuckDB executor
+
+        Args:
+            shared: Whether the executor is shared by every query result in the
+                process, in which case close() leaves its connection open
+        """
         if not DUCKDB_AVAILABLE:
             raise ImportError(
                 "DuckDB backend requires duckdb library. Install with: pip install duckdb"
             )
 
+        import duckdb
+
         # Create in-memory DuckDB connection
+        # (opening a database takes milliseconds; per-query cursors are cheap,
+        # thread-safe to use side by side, and drop their registrations on close)
         self.conn = duckdb.connect(":memory:")
+        self.shared = shared
 
     def execute_raw(
         self,
         sql: str,
-        sources: dict[str, str],
+        sources: dict[str, str] | list[SourceTable],
         read_only: bool = True,
         use_dataframes: bool = True,
         reader_factory: Callable[[str], Any] | None = None,
+        batch_size: int = FETCH_BATCH_ROWS,
     ) -> Iterator[dict[str, Any]]:
         """
         Execute raw SQL query with DuckDB
 
+        Rows are pulled from DuckDB `batch_size` at a time, so at most one
+        batch of Python tuples is alive while the caller iterates.
+
+        Args:
+            sql: Raw SQL query string
+            sources: SourceTables, or a dict mapping table names to file paths
+            read_only: If True, uses read_csv/read_parquet for safety
+            use_dataframes: If True, loads files as pandas DataFrames first
+            reader_factory: Callable that takes a file path and returns a Reader object
+            batch_size: Number of rows fetched from DuckDB at a time
+
+        Yields:
+            Result rows as dictionaries
+        """
+        rows = self.execute_tuples(
+            sql, sources, read_only, use_dataframes, reader_factory, batch_size
+        )
+        columns = next(rows)
+        for row in rows:
+            yield dict(zip(columns, row, strict=False))
+
+    def execute_tuples(
+        self,
+        sql: str,
+        sources: dict[str, str] | list[SourceTable],
+        read_only: bool = True,
+        use_dataframes: bool = True,
+        reader_factory: Callable[[str], Any] | None = None,
+        batch_size: int = FETCH_BATCH_ROWS,
+    ) -> Iterator[tuple]:
+        """
+        Execute raw SQL query with DuckDB, yielding rows as tuples
+
+        DuckDB's own row tuples are passed through, without building a dict
+        per row. Like execute_raw(), rows are fetched `batch_size` at a time.
+
         Args:
             sql: Raw SQL query string
-            sources: Dict mapping table names to file paths
+            sources: SourceTables, or a dict mapping table names to file paths
             read_only: If True, uses read_csv/read_parquet for safety
             use_dataframes: If True, loads files as pandas DataFrames first
             reader_factory: Callable that takes a file path and returns a Reader object
+            batch_size: Number of rows fetched from DuckDB at a time
+
+        Yields:
+            A tuple of column names first, then one tuple of values per row
         """
+        conn = self.conn.cursor()
         try:
-            # Step 1: Register all data sources
-            if use_dataframes and reader_factory:
-                # Use existing Reader infrastructure to get DataFrames
-                self._register_sources_with_readers(sources, reader_factory)
-            elif use_dataframes:
-                # Fallback to internal logic if no factory provided (legacy/testing)
-                self._register_sources_as_dataframes(sources)
-            else:
-                # Let DuckDB read directly from files
-                for table_name, file_path in sources.items():
-                    self._register_source(table_name, file_path, read_only)
-
-            # Step 2: Replace file paths in SQL with table names
-            transformed_sql = self._replace_sources_in_sql(sql, sources)
+            # Steps 1-2: Register sources and point the SQL at them
+            transformed_sql = self._prepare(
+                conn, sql, sources, read_only, use_dataframes, reader_factory
+            )
 
             # Step 3: Execute transformed query
-            result = self.conn.execute(transformed_sql)
+            result = conn.execute(transformed_sql)
+
+            # Step 4: Column names
+            yield tuple(desc[0] for desc in result.description)
+
+            # Step 5: Yield rows, one fetched batch at a time
+            while rows := result.fetchmany(batch_size):
+                yield from rows
+
+        except Exception as e:
+            raise RuntimeError(f"DuckDB execution error: {e}") from e
+        finally:
+            conn.close()
+
+    def execute_arrow(
+        self,
+        sql: str,
+        sources: dict[str, str] | list[SourceTable],
+        batch_size: int = 2048,
+        read_only: bool = True,
+        use_dataframes: bool = True,
+        reader_factory: Callable[[str], Any] | None = None,
+    ):
+        """
+        Execute raw SQL query with DuckDB, yielding Arrow record batches
+
+        DuckDB hands its columnar result to Arrow directly, without building
+        a Python tuple or dict per row.
+
+        Args:
+            sql: Raw SQL query string
+            sources: SourceTables, or a dict mapping table names to file paths
+            batch_size: Maximum number of rows per batch
+            read_only: If True, uses read_csv/read_parquet for safety
+            use_dataframes: If True, loads files as pandas DataFrames first
+            reader_factory: Callable that takes a file path and returns a Reader object
+
+        Yields:
+            pyarrow RecordBatches
+        """
+        conn = self.conn.cursor()
+        try:
+            transformed_sql = self._prepare(
+                conn, sql, sources, read_only, use_dataframes, reader_factory
+            )
+            result = conn.execute(transformed_sql)
+
+            # to_arrow_reader() supersedes fetch_record_batch() in newer DuckDB releases
+            to_reader = getattr(result, "to_arrow_reader", None) or result.fetch_record_batch
+            yield from to_reader(batch_size)
+
+        except Exception as e:
+            raise RuntimeError(f"DuckDB execution error: {e}") from e
+        finally:
+            conn.close()
+
+    def execute_df(
+        self,
+        sql: str,
+        sources: dict[str, str] | list[SourceTable],
+        read_only: bool = True,
+        use_dataframes: bool = True,
+        reader_factory: Callable[[str], Any] | None = None,
+    ):
+        """
+        Execute raw SQL query with DuckDB, returning a pandas DataFrame
+
+        DuckDB builds the DataFrame from its columnar result directly.
+
+        Args:
+            sql: Raw SQL query string
+            sources: SourceTables, or a dict mapping table names to file paths
+            read_only: If True, uses read_csv/read_parquet for safety
+            use_dataframes: If True, loads files as pandas DataFrames first
+            reader_factory: Callable that takes a file path and returns a Reader object
+
+        Returns:
+            pandas DataFrame with the full result
+        """
+        return self._fetch_all(
+            sql, sources, lambda result: result.df(), read_only, use_dataframes, reader_factory
+        )
+
+    def execute_arrow_table(
+        self,
+        sql: str,
+        sources: dict[str, str] | list[SourceTable],
+        read_only: bool = True,
+        use_dataframes: bool = True,
+        reader_factory: Callable[[str], Any] | None = None,
+    ):
+        """
+        Execute raw SQL query with DuckDB, returning a pyarrow Table
+
+        Args:
+            sql: Raw SQL query string
+            sources: SourceTables, or a dict mapping table names to file paths
+            read_only: If True, uses read_csv/read_parquet for safety
+            use_dataframes: If True, loads files as pandas DataFrames first
+            reader_factory: Callable that takes a file path and returns a Reader object
+
+        Returns:
+            pyarrow Table with the full result
+        """
+
+        def fetch(result):
+            # to_arrow_table() supersedes fetch_arrow_table() in newer DuckDB releases
+            to_table = getattr(result, "to_arrow_table", None) or result.fetch_arrow_table
+            return to_table()
+
+        return self._fetch_all(sql, sources, fetch, read_only, use_dataframes, reader_factory)
+
+    def write_parquet(
+        self,
+        sql: str,
+        sources: dict[str, str] | list[SourceTable],
+        path: str,
+        read_only: bool = True,
+        use_dataframes: bool = True,
+        reader_factory: Callable[[str], Any] | None = None,
+    ) -> None:
+        """
+        Execute raw SQL query with DuckDB, writing the result to a Parquet file
+
+        Uses DuckDB's COPY, so rows never pass through Python.
+
+        Args:
+            sql: Raw SQL query string
+            sources: SourceTables, or a dict mapping table names to file paths
+            path: Parquet file to write
+            read_only: If True, uses read_csv/read_parquet for safety
+            use_dataframes: If True, loads files as pandas DataFrames first
+            reader_factory: Callable that takes a file path and returns a Reader object
+        """
+        conn = self.conn.cursor()
+        try:
+            transformed_sql = (
+                self._prepare(conn, sql, sources, read_only, use_dataframes, reader_factory)
+                .rstrip()
+                .rstrip(";")
+            )
+            target = str(path).replace("'", "''")
+            conn.execute(f"COPY ({transformed_sql}) TO '{target}' (FORMAT parquet)")
 
-            # Step 4: Fetch column names
-            columns = [desc[0] for desc in result.description]
+        except Exception as e:
+            raise RuntimeError(f"DuckDB execution error: {e}") from e
+        finally:
+            conn.close()
 
-            # Step 5: Yield results as dictionaries
-            for row in result.fetchall():
-                yield dict(zip(columns, row, strict=False))
+    def _fetch_all(
+        self,
+        sql: str,
+        sources: dict[str, str] | list[SourceTable],
+        fetch: Callable[[Any], Any],
+        read_only: bool,
+        use_dataframes: bool,
+        reader_factory: Callable[[str], Any] | None,
+    ):
+        """Run a query on its own cursor and return fetch(result)"""
+        conn = self.conn.cursor()
+        try:
+            transformed_sql = self._prepare(
+                conn, sql, sources, read_only, use_dataframes, reader_factory
+            )
+            return fetch(conn.execute(transformed_sql))
 
         except Exception as e:
             raise RuntimeError(f"DuckDB execution error: {e}") from e
+        finally:
+            conn.close()
 
-    def _replace_sources_in_sql(self, sql: str, sources: dict[str, str]) -> str:
+    def _prepare(
+        self,
+        conn,
+        sql: str,
+        sources: dict[str, str] | list[SourceTable],
+        read_only: bool,
+        use_dataframes: bool,
+        reader_factory: Callable[[str], Any] | None,
+    ) -> str:
+        """
+        Register all data sources on a cursor and rewrite the SQL to use them
+
+        Returns:
+            SQL with file paths replaced by the registered table names
+        """
+        sources = _as_source_tables(sources)
+
+        # Register all data sources
+        if use_dataframes and reader_factory:
+            # Use existing Reader infrastructure to get DataFrames
+            self._register_sources_with_readers(conn, sources, reader_factory)
+        elif use_dataframes:
+            # Fallback to internal logic if no factory provided (legacy/testing)
+            self._register_sources_as_dataframes(conn, sources)
+        else:
+            # Let DuckDB read directly from files
+            for table in sources:
+                self._register_source(conn, table.name, table.path, read_only)
+
+        # Replace file paths in SQL with table names
+        return self._replace_sources_in_sql(sql, sources)
+
+    def _replace_sources_in_sql(self, sql: str, sources: list[SourceTable]) -> str:
         """
         Replace file paths in SQL with registered table names
 
         Args:
             sql: Original SQL query with file paths
-            sources: Dict mapping table names to file paths
+            sources: Sources to replace (matched on the source as written)
 
         Returns:
             Transformed SQL with quoted table names instead of file paths
 
         Example:
             Input SQL: "SELECT * FROM 'https://example.com/data.csv#html:0'"
-            Input sources: {"data": "https://example.com/data.csv#html:0"}
+            Input sources: one SourceTable named "data" for that URL
             Output SQL: "SELECT * FROM \"data\""
 
         Note:
             Table names are quoted with double quotes to avoid conflicts with
             SQL keywords (e.g., 'right', 'left', 'order', etc.)
         """
-        import re
-
-        transformed_sql = sql
-
-        # Sort by length (longest first) to avoid partial replacements
-        for table_name, file_path in sorted(sources.items(), key=lambda x: len(x[1]), reverse=True):
-            # Quote table name to avoid conflicts with SQL keywords
-            # DuckDB uses double quotes for identifiers
-            quoted_table = f'"{table_name}"'
-
-            # Replace both quoted and unquoted versions of the file path
-            # Try single quotes first
-            if f"'{file_path}'" in transformed_sql:
-                transformed_sql = transformed_sql.replace(f"'{file_path}'", quoted_table)
-            # Try double quotes
-            if f'"{file_path}"' in transformed_sql:
-                transformed_sql = transformed_sql.replace(f'"{file_path}"', quoted_table)
-
-            # Try unquoted - use lookahead/lookbehind to ensure we don't match partial paths
-            # This handles cases like: FROM /path/to/file.csv or JOIN file.csv
-            if file_path in transformed_sql:
-                # Match file_path when preceded/followed by whitespace or keywords
-                # Use negative lookbehind/lookahead to avoid matching inside other paths
-                escaped_path = re.escape(file_path)
-                # Pattern: match file path when NOT surrounded by alphanumeric/underscore/dot/slash
-                # This ensures we match complete paths
-                pattern = "(?<![\\w/.])" + escaped_path + "(?![\\w/.])"
-                transformed_sql = re.sub(pattern, quoted_table, transformed_sql)
-
-        return transformed_sql
+        # Quote table names to avoid conflicts with SQL keywords
+        # (DuckDB uses double quotes for identifiers)
+        quoted_tables = {table.source: f'"{table.name}"' for table in sources}
+        if not quoted_tables:
+            return sql
+
+        def replace(kind: str, token: str) -> str:
+            if kind == "string":
+                return quoted_tables.get(token[1:-1], token)
+            if kind == "word":
+                return quoted_tables.get(token, token)
+            return token
+
+        # One pass over the SQL's tokens, each looked up by its exact text: a
+        # path is never replaced inside a longer path, a longer string
+        # literal (e.g. one with '' escapes) or a comment
+        return substitute_tokens(sql, replace)
 
     def _register_sources_with_readers(
-        self, sources: dict[str, str], reader_factory: Callable[[str], BaseReader]
+        self, conn, sources: list[SourceTable], reader_factory: Callable[[str], BaseReader]
     ):
         """
         Register sources using Reader objects to get DataFrames
+
+        Local Parquet files are registered as views over DuckDB's own reader
+        instead, so only the columns and row groups the query needs are read.
+        Local CSV files are registered as Arrow tables from the in-process
+        source cache, so repeated queries (on either backend) parse them once.
         """
-        for table_name, file_path in sources.items():
+        for table in sources:
+            if _scans_natively(table):
+                self._register_source(conn, table.name, table.path)
+                continue
+
+            if _is_local_csv(table):
+                try:
+                    from sqlstream.readers.csv_reader import load_csv_table
+
+                    conn.register(table.name, load_csv_table(table.path))
+                    continue
+                except ImportError:
+                    pass  # No pyarrow - load through the Reader below
+
             try:
                 # Create reader using the factory (handles format detection, S3, etc.)
-                reader = reader_factory(file_path)
+                reader = reader_factory(table.source)
 
                 # Convert to DataFrame (efficiently)
                 df = reader.to_dataframe()
 
                 # Register in DuckDB
-                self.conn.register(table_name, df)
+                conn.register(table.name, df)
 
             except Exception as e:
                 # Fallback to file-based if reader fails
-                print(f"Warning: Could not load {file_path} via Reader, using file-based: {e}")
-                self._register_source(table_name, file_path)
+                print(f"Warning: Could not load {table.source} via Reader, using file-based: {e}")
+                self._register_source(conn, table.name, table.path)
 
-    def _register_sources_as_dataframes(self, sources: dict[str, str]):
+    def _register_sources_as_dataframes(self, conn, sources: list[SourceTable]):
         """
         Legacy method: Load files as pandas DataFrames manually
         (Kept for backward compatibility or when no reader_factory provided)
@@ -184,13 +463,14 @@ class DuckDBExecutor:
             import pandas as pd
         except ImportError:
             # Fallback to file-based if pandas not available
-            for table_name, file_path in sources.items():
-                self._register_source(table_name, file_path)
+            for table in sources:
+                self._register_source(conn, table.name, table.path)
             return
 
-        for table_name, file_path in sources.items():
+        for table in sources:
+            table_name = table.name
             try:
-                file_path = file_path.strip("'\"")
+                file_path = table.path.strip("'\"")
 
                 # Load file as DataFrame
                 if file_path.endswith((".parquet", ".pq")):
@@ -211,111 +491,124 @@ class DuckDBExecutor:
 
                 # Register DataFrame in DuckDB
                 # DuckDB can query pandas DataFrames directly!
-                self.conn.register(table_name, df)
+                conn.register(table_name, df)
 
             except Exception:
-                self._register_source(table_name, file_path)
+                self._register_source(conn, table_name, table.path)
 
-    def _register_source(self, table_name: str, file_path: str, read_only: bool = True):
+    def _register_source(self, conn, table_name: str, file_path: str, read_only: bool = True):
         """
         Register a data source as a DuckDB table
 
         Args:
+            conn: DuckDB cursor the query runs on (views are temporary to it)
             table_name: Name to use for the table in SQL
             file_path: Path to data file (CSV, Parquet, JSON, etc.)
             read_only: If True, uses read_csv/read_parquet
 
         Supports:
             - CSV files (.csv)
-            - Parquet files (.parquet, .pq)
+            - Parquet files (.parquet, .pq), globs and directories (Hive-partitioned)
             - JSON files (.json)
             - S3 files (s3://...)
             - HTTP URLs (https://...)
         """
         file_path = file_path.strip("'\"")  # Remove quotes if present
 
+        # A directory is read as a (possibly Hive-partitioned) Parquet dataset
+        if os.path.isdir(file_path):
+            file_path = f"{file_path.rstrip('/')}/**/*.parquet"
+
         # Determine file type
         if file_path.endswith(".parquet") or file_path.endswith(".pq"):
-            # Use DuckDB's native Parquet reader
-            self.conn.execute(
-                f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_parquet('{file_path}')"
+            # Use DuckDB's native Parquet reader; partition columns come from
+            # key=value directories, and WHERE filters on them skip whole files
+            conn.execute(
+                f"CREATE OR REPLACE TEMP VIEW {table_name} AS SELECT * FROM "
+                f"read_parquet('{file_path}', hive_partitioning=true)"
             )
         elif file_path.endswith(".csv"):
             # Use DuckDB's CSV reader with auto-detection
-            self.conn.execute(
-                f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_csv('{file_path}', "
+            conn.execute(
+                f"CREATE OR REPLACE TEMP VIEW {table_name} AS SELECT * FROM read_csv('{file_path}', "
                 f"auto_detect=true, header=true)"
             )
         elif file_path.endswith(".json"):
             # Use DuckDB's JSON reader
-            self.conn.execute(
-                f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_json('{file_path}')"
+            conn.execute(
+                f"CREATE OR REPLACE TEMP VIEW {table_name} AS SELECT * FROM read_json('{file_path}')"
             )
         elif file_path.startswith("s3://"):
             # S3 support (requires httpfs extension)
-            self._ensure_httpfs()
+            self._ensure_httpfs(conn)
             if file_path.endswith(".parquet") or file_path.endswith(".pq"):
-                self.conn.execute(
-                    f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_parquet('{file_path}')"
+                conn.execute(
+                    f"CREATE OR REPLACE TEMP VIEW {table_name} AS SELECT * FROM read_parquet('{file_path}')"
                 )
             else:
-                self.conn.execute(
-                    f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_csv('{file_path}', auto_detect=true)"
+                conn.execute(
+                    f"CREATE OR REPLACE TEMP VIEW {table_name} AS SELECT * FROM read_csv('{file_path}', auto_detect=true)"
                 )
         elif file_path.startswith(("http://", "https://")):
             # HTTP support (requires httpfs extension)
-            self._ensure_httpfs()
+            self._ensure_httpfs(conn)
             if file_path.endswith(".parquet") or file_path.endswith(".pq"):
-                self.conn.execute(
-                    f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_parquet('{file_path}')"
+                conn.execute(
+                    f"CREATE OR REPLACE TEMP VIEW {table_name} AS SELECT * FROM read_parquet('{file_path}')"
                 )
             elif file_path.endswith(".csv"):
-                self.conn.execute(
-                    f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_csv('{file_path}', auto_detect=true)"
+                conn.execute(
+                    f"CREATE OR REPLACE TEMP VIEW {table_name} AS SELECT * FROM read_csv('{file_path}', auto_detect=true)"
                 )
             else:
                 # Try to auto-detect
-                self.conn.execute(
-                    f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM '{file_path}'"
+                conn.execute(
+                    f"CREATE OR REPLACE TEMP VIEW {table_name} AS SELECT * FROM '{file_path}'"
                 )
         else:
             # Generic - let DuckDB auto-detect
-            self.conn.execute(f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM '{file_path}'")
+            conn.execute(f"CREATE OR REPLACE TEMP VIEW {table_name} AS SELECT * FROM '{file_path}'")
 
-    def _ensure_httpfs(self):
+    def _ensure_httpfs(self, conn):
         """Ensure httpfs extension is loaded for S3/HTTP support"""
         try:
-            self.conn.execute("INSTALL httpfs")
-            self.conn.execute("LOAD httpfs")
+            conn.execute("INSTALL httpfs")
+            conn.execute("LOAD httpfs")
         except Exception:
             # httpfs might already be loaded or not needed
             pass
 
-    def explain(self, sql: str, sources: dict[str, str]) -> str:
+    def explain(self, sql: str, sources: dict[str, str] | list[SourceTable]) -> str:
         """
         Get DuckDB query execution plan
 
         Args:
             sql: SQL query
-            sources: Table name to file path mapping
+            sources: SourceTables, or a dict mapping table names to file paths
 
         Returns:
             DuckDB EXPLAIN output
         """
-        # Register sources
-        for table_name, file_path in sources.items():
-            self._register_source(table_name, file_path)
+        sources = _as_source_tables(sources)
+        conn = self.conn.cursor()
+        try:
+            # Register sources
+            for table in sources:
+                self._register_source(conn, table.name, table.path)
 
-        # Replace file paths in SQL with table names
-        transformed_sql = self._replace_sources_in_sql(sql, sources)
+            # Replace file paths in SQL with table names
+            transformed_sql = self._replace_sources_in_sql(sql, sources)
 
-        # Get explain plan
-        result = self.conn.execute(f"EXPLAIN {transformed_sql}")
-        return "\n".join([str(row[0]) for row in result.fetchall()])
+            # Get explain plan
+            result = conn.execute(f"EXPLAIN {transformed_sql}")
+            # Rows are (explain_key, explain_value); the plan text is the value
+            return "\n".join(str(row[1]) for row in result.fetchall())
+        finally:
+            conn.close()
 
     def close(self):
-        """Close DuckDB connection"""
-        if self.conn:
+        """Close DuckDB connection (a no-op on the shared executor)"""
+        if self.conn and not self.shared:
             self.conn.close()
 
     def __del__(self):
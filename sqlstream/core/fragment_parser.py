@@ -4,6 +4,13 @@ URL Fragment Parser - Parse source#format:table syntax
 Provides utilities to parse SQLstream URL fragments for format and table specification.
 """
 
+import functools
+import re
+from dataclasses import dataclass
+
+# Characters that aren't allowed in generated table names
+_SQL_UNSAFE_CHARS_RE = re.compile(r"[^a-zA-Z0-9_]")
+
 
 class FragmentParseError(Exception):
     """Raised when fragment parsing fails"""
@@ -11,6 +18,7 @@ class FragmentParseError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_source_fragment(source: str) -> tuple[str, str | None, int | str | None]:
     """
     Parse source URL with optional fragment
@@ -36,6 +44,10 @@ def parse_source_fragment(source: str) -> tuple[str, str | None, int | str | Non
 
     Raises:
         FragmentParseError: If fragment syntax is invalid
+
+    Note:
+        Results are memoized; the reader factory, source discovery and the
+        executors all parse the same source strings.
     """
     if "#" not in source:
         return (source, None, None)
@@ -123,3 +135,70 @@ def build_source_fragment(source: str, format: str | None = None, table: int | N
         return f"{source}#{format}"
     else:  # table only
         return f"{source}#:{table}"
+
+
+def _basename_noext(path: str) -> str:
+    """
+    File name without parent directories or extension
+
+    Same result as os.path.splitext(os.path.basename(path))[0] (leading dots
+    aren't an extension), but in one pass over the string, and splitting on
+    both / and \\ so URLs and Windows paths work on any platform.
+    """
+    start = max(path.rfind("/"), path.rfind("\\")) + 1
+    dot = path.rfind(".")
+    if dot > start and path[start:dot].lstrip("."):
+        return path[start:dot]
+    return path[start:]
+
+
+@functools.lru_cache(maxsize=1024)
+def _sql_safe_base_name(path: str) -> str:
+    """SQL-safe file name (cached: the same files are joined across queries)"""
+    return _SQL_UNSAFE_CHARS_RE.sub("_", _basename_noext(path))
+
+
+@dataclass(slots=True)
+class SourceTable:
+    """
+    A table source referenced by a query, with its fragment parsed once
+
+    Executors read the parsed fields directly instead of re-parsing the
+    source string for every use.
+    """
+
+    name: str  # SQL-safe table name the source is registered under
+    source: str  # Source as written in the query (may include #format:table)
+    path: str  # Path/URL without the fragment
+    format: str | None = None  # Format from the fragment, if any
+    table_hint: int | str | None = None  # Table index/key from the fragment, if any
+
+    @classmethod
+    def from_source(cls, source: str, name: str | None = None) -> "SourceTable":
+        """
+        Parse a source string into a SourceTable
+
+        Args:
+            source: Source path or URL, optionally with #format:table fragment
+            name: Table name to use (default: derived from the file name)
+        """
+        path, format, table_hint = parse_source_fragment(source)
+        table = cls(name or "", source, path, format, table_hint)
+        if name is None:
+            table.name = table.default_name()
+        return table
+
+    def base_name(self) -> str:
+        """File name without extension or parent directories, made SQL-safe"""
+        return _sql_safe_base_name(self.path)
+
+    def default_name(self) -> str:
+        """
+        Table name derived from the file name
+
+        Includes the table hint so several tables from the same file get
+        distinct names (complex.html#html:0, complex.html#html:1, ...).
+        """
+        if self.table_hint is not None:
+            return f"{self.base_name()}_{self.table_hint}"
+        return self.base_name()
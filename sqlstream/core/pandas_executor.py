@@ -7,18 +7,132 @@ Falls back gracefully if pandas is not available.
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 from collections.abc import Iterator
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
-try:
+from sqlstream.core.fragment_parser import parse_source_fragment
+from sqlstream.readers.registry import detect_format, sniff_format
+from sqlstream.sql.ast_nodes import Condition, SelectStatement
+
+if TYPE_CHECKING:
     import pandas as pd
 
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
-    pd = None
+# Only probe for pandas here; importing it (plus numpy, pytz, ...) is deferred
+# until the pandas backend is actually used, via _get_pd()
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
 
-from sqlstream.sql.ast_nodes import Condition, SelectStatement
+# Numba is optional; only check that it is installed (importing it is slow)
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Minimum row count before GROUP BY aggregations use numba's parallel kernels
+NUMBA_GROUPBY_THRESHOLD = 1_000_000
+NUMBA_ENGINE_KWARGS = {"nopython": True, "parallel": True}
+
+# Rows per chunk when streaming filter/project/limit scans
+STREAMING_CHUNK_ROWS = 256_000
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pd():
+    """Import pandas on first use"""
+    import pandas as pd
+
+    return pd
+
+
+def _arrow_types_mapper(arrow_type):
+    """
+    Map Arrow string columns to pyarrow-backed pandas strings
+
+    Strings stay in Arrow's packed offsets + UTF-8 buffers instead of one
+    Python object per value, so filters and GROUP BYs on them touch far less
+    memory. Other types keep their default (numpy / nullable) dtypes, which
+    support comparisons against string literals (e.g. datetime columns).
+    """
+    import pyarrow as pa
+
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return _get_pd().StringDtype("pyarrow")
+    return None
+
+
+def _csv_types_mapper(arrow_type):
+    """
+    Map CSV Arrow columns to the dtypes CSVReader.to_dataframe() produces
+
+    Tables parsed by DuckDB carry no pandas metadata, so integers and booleans
+    are mapped to pandas' nullable dtypes explicitly (a column with missing
+    values stays Int64 instead of turning into float64).
+    """
+    import pyarrow as pa
+
+    pd = _get_pd()
+    if pa.types.is_integer(arrow_type):
+        return pd.Int64Dtype()
+    if pa.types.is_boolean(arrow_type):
+        return pd.BooleanDtype()
+    return _arrow_types_mapper(arrow_type)
+
+
+# SQL aggregate function -> pandas aggregation name
+_PANDAS_AGG_FUNCS = {"count": "count", "sum": "sum", "avg": "mean", "min": "min", "max": "max"}
+
+
+@dataclass(frozen=True)
+class _GroupByPlan:
+    """Aggregation mappings derived from a SELECT's aggregates"""
+
+    agg_dict: dict[str, str]  # column -> pandas aggregation
+    rename_map: dict[str, str]  # column -> output alias
+    result_cols: list[str]  # group_by columns + aggregate aliases, in SELECT order
+
+
+def _build_groupby_plan(ast: SelectStatement, count_star_column: str) -> _GroupByPlan:
+    """
+    Map a statement's aggregates to pandas aggregations
+
+    Aggregates are mapped in SELECT order, so a later aggregate on a column
+    replaces an earlier one on the same column.
+
+    Args:
+        ast: Statement being executed
+        count_star_column: Column COUNT(*) counts (the frame's first column)
+
+    Returns:
+        GROUP BY plan
+    """
+    agg_dict = {}
+    rename_map = {}
+    result_cols = ast.group_by.copy() if ast.group_by else []
+
+    for agg in ast.aggregates or []:
+        func = agg.function.lower()
+        col = agg.column
+
+        # Determine the target alias
+        alias = agg.alias if agg.alias else f"{func}_{col}"
+        result_cols.append(alias)
+
+        if func not in _PANDAS_AGG_FUNCS:
+            continue
+
+        if func == "count" and col == "*":
+            # COUNT(*) - count any column
+            col = count_star_column
+        agg_dict[col] = _PANDAS_AGG_FUNCS[func]
+        rename_map[col] = alias
+
+    return _GroupByPlan(agg_dict, rename_map, result_cols)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_thread_pool() -> ThreadPoolExecutor:
+    """Shared worker pool for loading JOIN inputs concurrently"""
+    return ThreadPoolExecutor(thread_name_prefix="sqlstream-pandas")
 
 
 class PandasExecutor:
@@ -36,6 +150,17 @@ class PandasExecutor:
     10-100x faster than pure Python Volcano model for most queries.
     """
 
+    # Format name -> DataFrame loader method
+    _FORMAT_LOADERS = {
+        "csv": "_read_csv",
+        "parquet": "_read_parquet",
+        "html": "_read_html",
+        "markdown": "_read_markdown",
+        "json": "_read_json",
+        "jsonl": "_read_jsonl",
+        "xml": "_read_xml",
+    }
+
     def __init__(self):
         """Initialize pandas executor"""
         if not PANDAS_AVAILABLE:
@@ -55,37 +180,211 @@ class PandasExecutor:
         Yields:
             Result rows as dictionaries
         """
-        # Step 1: Load data into DataFrame
-        df = self._load_dataframe(source)
+        for df in self.execute_frames(ast, source, right_source):
+            yield from df.to_dict("records")
 
-        # Step 2: Apply JOIN if present
+    def execute_tuples(
+        self, ast: SelectStatement, source: str, right_source: str | None = None
+    ) -> Iterator[tuple]:
+        """
+        Execute query using pandas, yielding rows as tuples
+
+        Values are the same (native Python) objects execute() puts in its dicts.
+
+        Args:
+            ast: Parsed SELECT statement
+            source: Path to data file (left table)
+            right_source: Optional path to right table for JOINs
+
+        Yields:
+            One tuple of values per row, in column order
+        """
+        for df in self.execute_frames(ast, source, right_source):
+            yield from map(tuple, df.to_dict("split", index=False)["data"])
+
+    def execute_arrow(
+        self,
+        ast: SelectStatement,
+        source: str,
+        right_source: str | None = None,
+        batch_size: int = 2048,
+    ):
+        """
+        Execute query using pandas, yielding Arrow record batches
+
+        Skips converting every row into a Python dict; pandas columns are
+        handed to Arrow as whole arrays.
+
+        Args:
+            ast: Parsed SELECT statement
+            source: Path to data file (left table)
+            right_source: Optional path to right table for JOINs
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            pyarrow RecordBatches
+        """
+        import pyarrow as pa
+
+        for df in self.execute_frames(ast, source, right_source):
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            yield from table.to_batches(max_chunksize=batch_size)
+
+    def execute_df(
+        self, ast: SelectStatement, source: str, right_source: str | None = None
+    ) -> pd.DataFrame:
+        """
+        Execute query using pandas, returning the result as one DataFrame
+
+        Args:
+            ast: Parsed SELECT statement
+            source: Path to data file (left table)
+            right_source: Optional path to right table for JOINs
+
+        Returns:
+            Result DataFrame with a fresh 0..n-1 index
+        """
+        pd = _get_pd()
+        frames = list(self.execute_frames(ast, source, right_source))
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0].reset_index(drop=True)
+        return pd.concat(frames, ignore_index=True)
+
+    def execute_frames(
+        self, ast: SelectStatement, source: str, right_source: str | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Execute query using pandas, yielding result DataFrames
+
+        Most queries produce a single DataFrame; streamed scans yield one per chunk.
+
+        Args:
+            ast: Parsed SELECT statement
+            source: Path to data file (left table)
+            right_source: Optional path to right table for JOINs
+
+        Yields:
+            Result DataFrames
+        """
+        # Plain scans with a LIMIT stream the source chunk by chunk and stop
+        # as soon as enough rows match, instead of loading the whole file
+        if self._can_stream(ast):
+            chunks = self._iter_chunks(source)
+            if chunks is not None:
+                yield from self._execute_streaming(ast, chunks)
+                return
+
+        # Step 1: Load data into DataFrame
+        # (the right side of a JOIN loads concurrently on a worker thread;
+        # file parsing and pandas I/O release the GIL for most of their work)
+        right_future = None
         if ast.join:
             if not right_source:
                 right_source = ast.join.right_source
-            df = self._apply_join(df, ast, right_source)
+            right_future = _get_thread_pool().submit(self._load_dataframe, right_source)
 
-        # Step 3: Apply WHERE filter
-        if ast.where:
-            df = self._apply_filter(df, ast.where.conditions)
+        df = self._load_dataframe(source)
+
+        # Step 2: Apply JOIN if present
+        # (WHERE conditions touching only one side are applied before the merge)
+        conditions = ast.where.conditions if ast.where else []
+        if right_future is not None:
+            df, conditions = self._apply_join(df, ast, right_future.result(), conditions)
+
+        # Step 3: Apply remaining WHERE filter
+        # (fused with the column selection into one indexing pass when possible)
+        project_early = self._can_project_early(ast)
+        if conditions or project_early:
+            mask = self._compute_mask(df, conditions)
+            columns = ast.columns if project_early else ["*"]
+            df = self._apply_mask_and_project(df, mask, columns)
 
         # Step 4: Apply GROUP BY + aggregation
         if ast.group_by or ast.aggregates:
             df = self._apply_groupby(df, ast)
 
-        # Step 5: Apply ORDER BY
+        # Step 5: Apply ORDER BY (LIMIT is pushed into the sort as a top-K selection)
         if ast.order_by:
-            df = self._apply_orderby(df, ast)
+            df = self._apply_orderby(df, ast, limit=ast.limit)
 
         # Step 6: Apply column selection (PROJECT)
-        if not ast.group_by:  # GroupBy already handled columns
+        # GroupBy already handled columns; skip if projected together with WHERE
+        if not ast.group_by and not project_early:
             df = self._apply_projection(df, ast.columns)
 
-        # Step 7: Apply LIMIT
-        if ast.limit is not None:
+        # Step 7: Apply LIMIT (already applied by ORDER BY when both are present)
+        if ast.limit is not None and not ast.order_by:
             df = df.head(ast.limit)
 
-        # Step 8: Convert to dictionaries and yield
-        yield from df.to_dict("records")
+        yield df
+
+    def _can_stream(self, ast: SelectStatement) -> bool:
+        """
+        Check if a query can be answered chunk by chunk
+
+        Only filter + project + limit queries qualify: every chunk can be
+        processed independently and LIMIT allows stopping early.
+        """
+        if ast.limit is None:
+            return False
+        return not (ast.group_by or ast.aggregates or ast.order_by or ast.join)
+
+    def _iter_chunks(self, source: str) -> Iterator[pd.DataFrame] | None:
+        """
+        Open a source as a stream of DataFrame chunks
+
+        Returns:
+            Iterator of chunks, or None if the source can't be streamed
+            (remote files, or formats other than local CSV and Parquet)
+        """
+        source_path, format_hint, _ = parse_source_fragment(source)
+        if "://" in source_path:
+            return None
+
+        format = detect_format(source_path, format_hint)
+        if format == "csv":
+            from sqlstream.readers.csv_reader import CSVReader
+
+            return CSVReader(source_path).iter_dataframes(STREAMING_CHUNK_ROWS)
+
+        if format == "parquet":
+            import pyarrow.parquet as pq
+
+            batches = pq.ParquetFile(source_path).iter_batches(batch_size=STREAMING_CHUNK_ROWS)
+            return (batch.to_pandas(types_mapper=_arrow_types_mapper) for batch in batches)
+
+        return None
+
+    def _execute_streaming(
+        self, ast: SelectStatement, chunks: Iterator[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run WHERE + SELECT on each chunk, stopping once LIMIT rows are produced
+
+        Args:
+            ast: Parsed SELECT statement (no GROUP BY, ORDER BY or JOIN)
+            chunks: DataFrame chunks of the source
+
+        Yields:
+            Result DataFrames, one per chunk
+        """
+        conditions = ast.where.conditions if ast.where else []
+        limit_left = ast.limit
+
+        if limit_left <= 0:
+            return
+
+        for chunk in chunks:
+            mask = self._compute_mask(chunk, conditions)
+            chunk = self._apply_mask_and_project(chunk, mask, ast.columns).head(limit_left)
+            limit_left -= len(chunk)
+
+            yield chunk
+
+            if limit_left <= 0:
+                break
 
     def _load_dataframe(self, source: str, format: str | None = None) -> pd.DataFrame:
         """
@@ -98,8 +397,6 @@ class PandasExecutor:
             format: Optional explicit format (csv, parquet, json, jsonl, xml, html, markdown)
         """
         # Parse URL fragment if present (e.g., "data.html#html:1")
-        from sqlstream.core.fragment_parser import parse_source_fragment
-
         source_path, format_hint, table_hint = parse_source_fragment(source)
 
         # Use format hint from fragment if not explicitly provided
@@ -118,129 +415,108 @@ class PandasExecutor:
                 reader = HTTPReader(source_path)
             source_path = str(reader.local_path)
 
-            # If format not specified, detect from reader
-            if not format:
-                delegate_type = type(reader.delegate_reader).__name__
-                if "HTML" in delegate_type:
-                    format = "html"
-                elif "Markdown" in delegate_type:
-                    format = "markdown"
-                elif "Parquet" in delegate_type:
-                    format = "parquet"
-                elif "JSON" in delegate_type and "JSONL" not in delegate_type:
-                    format = "json"
-                elif "JSONL" in delegate_type:
-                    format = "jsonl"
-                elif "XML" in delegate_type:
-                    format = "xml"
-                else:
-                    format = "csv"
-
-        # If format explicitly specified, use it
-        if format:
-            if format == "parquet":
-                return pd.read_parquet(source_path)
-            elif format == "html":
-                # read_html returns a list, take table at table_hint index (default 0)
-                tables = pd.read_html(source_path)
-                if not tables:
-                    raise ValueError(f"No tables found in HTML: {source_path}")
-                table_index = table_hint if table_hint is not None else 0
-                if table_index >= len(tables):
-                    raise ValueError(
-                        f"Table index {table_index} out of range. "
-                        f"HTML contains {len(tables)} table(s)."
-                    )
-                return tables[table_index]
-            elif format == "markdown":
-                # Use our markdown reader with table selection
-                from sqlstream.readers.markdown_reader import MarkdownReader
-
-                table_index = table_hint if table_hint is not None else 0
-                reader = MarkdownReader(source_path, table=table_index)
-                # Convert to DataFrame
-                return pd.DataFrame(reader.rows)
-            elif format == "json":
-                # Use our JSON reader with records key support
-                from sqlstream.readers.json_reader import JSONReader
-
-                key = str(table_hint) if table_hint is not None else None
-                reader = JSONReader(source_path, records_key=key)
-                return reader.to_dataframe()
-            elif format == "jsonl":
-                # Use our JSONL reader
-                from sqlstream.readers.jsonl_reader import JSONLReader
-
-                reader = JSONLReader(source_path)
-                return reader.to_dataframe()
-            elif format == "xml":
-                # Use our XML reader with element selection
-                from sqlstream.readers.xml_reader import XMLReader
-
-                element = str(table_hint) if table_hint is not None else None
-                reader = XMLReader(source_path, element=element)
-                return reader.to_dataframe()
-            else:  # csv
-                from sqlstream.readers.csv_reader import CSVReader
-
-                return CSVReader(source_path).to_dataframe()
-
-        # Auto-detect from extension
-        source_lower = source_path.lower()
-        if source_lower.endswith(".parquet"):
-            return pd.read_parquet(source_path)
-        elif source_lower.endswith((".html", ".htm")):
-            tables = pd.read_html(source_path)
-            if not tables:
-                raise ValueError(f"No tables found in HTML: {source_path}")
-            table_index = table_hint if table_hint is not None else 0
-            if table_index >= len(tables):
-                raise ValueError(
-                    f"Table index {table_index} out of range. HTML contains {len(tables)} table(s)."
-                )
-            return tables[table_index]
-        elif source_lower.endswith((".md", ".markdown")):
-            from sqlstream.readers.markdown_reader import MarkdownReader
-
-            table_index = table_hint if table_hint is not None else 0
-            reader = MarkdownReader(source_path, table=table_index)
-            return pd.DataFrame(reader.rows)
-        elif source_lower.endswith(".json"):
-            from sqlstream.readers.json_reader import JSONReader
-
-            key = str(table_hint) if table_hint is not None else None
-            reader = JSONReader(source_path, records_key=key)
-            return reader.to_dataframe()
-        elif source_lower.endswith(".jsonl"):
-            from sqlstream.readers.jsonl_reader import JSONLReader
-
-            reader = JSONLReader(source_path)
-            return reader.to_dataframe()
-        elif source_lower.endswith(".xml"):
-            from sqlstream.readers.xml_reader import XMLReader
-
-            element = str(table_hint) if table_hint is not None else None
-            reader = XMLReader(source_path, element=element)
-            return reader.to_dataframe()
-        elif source_lower.endswith(".csv"):
-            from sqlstream.readers.csv_reader import CSVReader
+            # The given format, or the one the reader detected
+            format = reader.format
 
-            return CSVReader(source_path).to_dataframe()
-        else:
+        # Unknown extensions are identified from the file's first bytes
+        format = detect_format(source_path, format) or sniff_format(source_path)
+        if format is None:
             # Try CSV as default
             try:
-                from sqlstream.readers.csv_reader import CSVReader
-
-                return CSVReader(source_path).to_dataframe()
+                return self._read_csv(source_path, table_hint)
             except Exception as e:
                 raise ValueError(f"Unsupported file format: {source_path}") from e
 
+        loader = getattr(self, self._FORMAT_LOADERS.get(format, "_read_csv"))
+        return loader(source_path, table_hint)
+
+    def _read_parquet(self, path: str, table_hint: int | str | None = None) -> pd.DataFrame:
+        """Read a Parquet file, reusing the in-process source cache"""
+        import pyarrow.parquet as pq
+
+        from sqlstream.core.source_cache import load_table
+
+        table = load_table(path, lambda: pq.read_table(path))
+        return table.to_pandas(types_mapper=_arrow_types_mapper)
+
+    def _read_csv(self, path: str, table_hint: int | str | None = None) -> pd.DataFrame:
+        """Read a CSV file, reusing the in-process source cache"""
+        from sqlstream.readers.csv_reader import load_csv_table
+
+        return load_csv_table(path).to_pandas(types_mapper=_csv_types_mapper)
+
+    def _read_html(self, path: str, table_hint: int | str | None = None) -> pd.DataFrame:
+        """Read a table from an HTML file (table_hint selects it, default 0)"""
+        pd = _get_pd()
+
+        # read_html returns a list, take table at table_hint index (default 0)
+        tables = pd.read_html(path)
+        if not tables:
+            raise ValueError(f"No tables found in HTML: {path}")
+        table_index = table_hint if table_hint is not None else 0
+        if table_index >= len(tables):
+            raise ValueError(
+                f"Table index {table_index} out of range. HTML contains {len(tables)} table(s)."
+            )
+        return tables[table_index]
+
+    def _read_markdown(self, path: str, table_hint: int | str | None = None) -> pd.DataFrame:
+        """Read a table from a Markdown file using our markdown reader"""
+        from sqlstream.readers.markdown_reader import MarkdownReader
+
+        table_index = table_hint if table_hint is not None else 0
+        reader = MarkdownReader(path, table=table_index)
+        return _get_pd().DataFrame(reader.rows)
+
+    def _read_json(self, path: str, table_hint: int | str | None = None) -> pd.DataFrame:
+        """Read a JSON file using our JSON reader with records key support"""
+        from sqlstream.readers.json_reader import JSONReader
+
+        key = str(table_hint) if table_hint is not None else None
+        return JSONReader(path, records_key=key).to_dataframe()
+
+    def _read_jsonl(self, path: str, table_hint: int | str | None = None) -> pd.DataFrame:
+        """Read a JSONL file using our JSONL reader"""
+        from sqlstream.readers.jsonl_reader import JSONLReader
+
+        return JSONLReader(path).to_dataframe()
+
+    def _read_xml(self, path: str, table_hint: int | str | None = None) -> pd.DataFrame:
+        """Read an XML file using our XML reader with element selection"""
+        from sqlstream.readers.xml_reader import XMLReader
+
+        element = str(table_hint) if table_hint is not None else None
+        return XMLReader(path, element=element).to_dataframe()
+
     def _apply_join(
-        self, df: pd.DataFrame, ast: SelectStatement, right_source: str
-    ) -> pd.DataFrame:
-        """Apply JOIN operation"""
-        # Load right table
-        right_df = self._load_dataframe(right_source)
+        self,
+        df: pd.DataFrame,
+        ast: SelectStatement,
+        right_df: pd.DataFrame,
+        conditions: list[Condition] | None = None,
+    ) -> tuple[pd.DataFrame, list[Condition]]:
+        """
+        Apply JOIN operation
+
+        WHERE conditions that reference only one side of the join are applied
+        to that side before the merge, so the merge only processes surviving rows.
+
+        Args:
+            df: Left DataFrame
+            ast: Parsed SELECT statement
+            right_df: Right DataFrame
+            conditions: WHERE conditions to push below the merge where possible
+
+        Returns:
+            Tuple of (merged DataFrame, conditions still to apply after the merge)
+        """
+        left_conds, right_conds, post_conds = self._split_conditions_by_side(
+            conditions or [], df.columns, right_df.columns, ast.join.join_type
+        )
+        if left_conds:
+            df = self._apply_filter(df, left_conds)
+        if right_conds:
+            right_df = self._apply_filter(right_df, right_conds)
 
         # Map SQL join types to pandas
         join_type_map = {
@@ -260,11 +536,65 @@ class PandasExecutor:
             suffixes=("", "_right"),
         )
 
-        return result
+        return result, post_conds
+
+    def _split_conditions_by_side(
+        self, conditions: list[Condition], left_cols, right_cols, join_type: str
+    ) -> tuple[list[Condition], list[Condition], list[Condition]]:
+        """
+        Assign WHERE conditions to the join side they can be evaluated on
+
+        A condition is only pushed to a side if filtering that side before the
+        merge gives the same result as filtering after it: the left side of
+        INNER/LEFT joins and the right side of INNER/RIGHT joins. Columns present
+        in both tables resolve to the left one (the right copy gets a suffix).
+
+        Args:
+            conditions: WHERE conditions
+            left_cols: Columns of the left DataFrame
+            right_cols: Columns of the right DataFrame
+            join_type: 'INNER', 'LEFT', or 'RIGHT'
+
+        Returns:
+            Tuple of (left_conditions, right_conditions, post_join_conditions)
+        """
+        from sqlstream.optimizers.predicate_pushdown import PredicatePushdownOptimizer
+
+        pushable = PredicatePushdownOptimizer()._extract_pushable_conditions(conditions)
+        pushable_ids = {id(c) for c in pushable}
+
+        left_conds = []
+        right_conds = []
+        post_conds = []
+
+        for condition in conditions:
+            col = condition.column
+            if id(condition) not in pushable_ids:
+                post_conds.append(condition)
+            elif col in left_cols:
+                if join_type in ("INNER", "LEFT"):
+                    left_conds.append(condition)
+                else:
+                    post_conds.append(condition)
+            elif col in right_cols and join_type in ("INNER", "RIGHT"):
+                right_conds.append(condition)
+            else:
+                post_conds.append(condition)
+
+        return left_conds, right_conds, post_conds
 
     def _apply_filter(self, df: pd.DataFrame, conditions: list[Condition]) -> pd.DataFrame:
         """Apply WHERE conditions"""
-        mask = pd.Series([True] * len(df), index=df.index)
+        return self._apply_mask_and_project(df, self._compute_mask(df, conditions), ["*"])
+
+    def _compute_mask(self, df: pd.DataFrame, conditions: list[Condition]) -> pd.Series | None:
+        """
+        Build the boolean row mask for WHERE conditions
+
+        Returns:
+            Mask Series, or None if no condition applies (keep all rows)
+        """
+        mask = None
 
         for condition in conditions:
             col = condition.column
@@ -277,59 +607,95 @@ class PandasExecutor:
 
             # Build condition mask
             if op == "=":
-                mask &= df[col] == value
+                cond_mask = df[col] == value
             elif op == ">":
-                mask &= df[col] > value
+                cond_mask = df[col] > value
             elif op == "<":
-                mask &= df[col] < value
+                cond_mask = df[col] < value
             elif op == ">=":
-                mask &= df[col] >= value
+                cond_mask = df[col] >= value
             elif op == "<=":
-                mask &= df[col] <= value
+                cond_mask = df[col] <= value
             elif op == "!=":
-                mask &= df[col] != value
+                cond_mask = df[col] != value
+            else:
+                continue
 
-        return df[mask]
+            # The first condition's mask seeds the result (no all-True initializer)
+            mask = cond_mask if mask is None else mask & cond_mask
 
-    def _apply_groupby(self, df: pd.DataFrame, ast: SelectStatement) -> pd.DataFrame:
-        """Apply GROUP BY with aggregations"""
-        # Build aggregation dictionary and track rename mapping
-        agg_dict = {}
-        rename_map = {}
+        return mask
+
+    def _apply_mask_and_project(
+        self, df: pd.DataFrame, mask: pd.Series | None, columns: list[str]
+    ) -> pd.DataFrame:
+        """
+        Apply a row mask and column selection in a single indexing pass
 
-        for agg in ast.aggregates:
-            func = agg.function.lower()
-            col = agg.column
+        Avoids materializing a full-width filtered DataFrame that is then sliced again.
+        """
+        if columns == ["*"]:
+            return df if mask is None else df[mask]
 
-            # Determine the target alias
-            alias = agg.alias if agg.alias else f"{func}_{col}"
+        # Select only available columns
+        available_cols = [c for c in columns if c in df.columns]
 
-            # Map SQL aggregate functions to pandas
-            if func == "count":
-                if col == "*":
-                    # COUNT(*) - count any column
-                    agg_col = df.columns[0]
-                    agg_dict[agg_col] = "count"
-                    rename_map[agg_col] = alias
-                else:
-                    agg_dict[col] = "count"
-                    rename_map[col] = alias
-            elif func == "sum":
-                agg_dict[col] = "sum"
-                rename_map[col] = alias
-            elif func == "avg":
-                agg_dict[col] = "mean"  # pandas uses 'mean' for average
-                rename_map[col] = alias
-            elif func == "min":
-                agg_dict[col] = "min"
-                rename_map[col] = alias
-            elif func == "max":
-                agg_dict[col] = "max"
-                rename_map[col] = alias
+        if not available_cols:
+            # No columns match, return empty DataFrame
+            return df.iloc[:0]
+
+        if mask is None:
+            return df[available_cols]
+
+        return df.loc[mask, available_cols]
+
+    def _can_project_early(self, ast: SelectStatement) -> bool:
+        """
+        Check if the column selection can be applied together with WHERE
+
+        Only safe when no later step needs columns outside the SELECT list:
+        no aggregation, and every ORDER BY column is selected.
+        """
+        if ast.group_by or ast.aggregates or ast.columns == ["*"]:
+            return False
+
+        if ast.order_by:
+            return all(o.column in ast.columns for o in ast.order_by)
+
+        return True
+
+    def _apply_groupby(self, df: pd.DataFrame, ast: SelectStatement) -> pd.DataFrame:
+        """Apply GROUP BY with aggregations"""
+        pd = _get_pd()
+
+        # Aggregation dictionary and rename mapping
+        plan = _build_groupby_plan(ast, df.columns[0])
+        agg_dict = plan.agg_dict
+        rename_map = plan.rename_map
 
         # Perform groupby or global aggregation
         if ast.group_by:
-            grouped = df.groupby(ast.group_by, as_index=False).agg(agg_dict)
+            # Group on categorical codes instead of hashing string objects per row.
+            # Keys that are also aggregated (e.g. the column COUNT(*) counts) are
+            # left alone: their output column holds the aggregate, not the key
+            key_dtypes = {
+                col: df[col].dtype
+                for col in ast.group_by
+                if col in df.columns
+                and col not in agg_dict
+                and pd.api.types.is_string_dtype(df[col])
+            }
+            if key_dtypes:
+                df = df.astype(dict.fromkeys(key_dtypes, "category"))
+
+            if self._can_use_numba(df, ast.group_by, agg_dict):
+                grouped = self._groupby_numba(df, ast.group_by, agg_dict)
+            else:
+                grouped = df.groupby(ast.group_by, as_index=False, observed=True).agg(agg_dict)
+
+            # Restore original key dtypes on the (small) aggregated result
+            if key_dtypes:
+                grouped = grouped.astype(key_dtypes)
         else:
             # Global aggregation
             # Create a single-row DataFrame with aggregated values
@@ -355,20 +721,73 @@ class PandasExecutor:
         grouped = grouped.rename(columns=rename_map)
 
         # Select only the columns specified in SELECT (group_by cols + aggregates)
-        result_cols = ast.group_by.copy() if ast.group_by else []
-        for agg in ast.aggregates:
-            alias = agg.alias if agg.alias else f"{agg.function.lower()}_{agg.column}"
-            result_cols.append(alias)
-
         # Try to select columns, use what's available
-        available_cols = [c for c in result_cols if c in grouped.columns]
+        available_cols = [c for c in plan.result_cols if c in grouped.columns]
         if available_cols:
             grouped = grouped[available_cols]
 
         return grouped
 
-    def _apply_orderby(self, df: pd.DataFrame, ast: SelectStatement) -> pd.DataFrame:
-        """Apply ORDER BY"""
+    def _can_use_numba(
+        self, df: pd.DataFrame, group_by: list[str], agg_dict: dict[str, str]
+    ) -> bool:
+        """
+        Check if a GROUP BY aggregation can run on numba's parallel kernels
+
+        Requires numba, a large enough frame, and plain numpy numeric columns
+        for every non-COUNT aggregate (numba can't handle nullable/object dtypes).
+        """
+        if not NUMBA_AVAILABLE or len(df) < NUMBA_GROUPBY_THRESHOLD:
+            return False
+
+        import numpy as np
+
+        numeric_aggs = [col for col, func in agg_dict.items() if func != "count"]
+        if not numeric_aggs:
+            return False
+
+        for col in agg_dict:
+            if col in group_by:
+                return False
+
+        for col in numeric_aggs:
+            dtype = df[col].dtype
+            if not isinstance(dtype, np.dtype) or dtype.kind not in "iuf":
+                return False
+
+        return True
+
+    def _groupby_numba(
+        self, df: pd.DataFrame, group_by: list[str], agg_dict: dict[str, str]
+    ) -> pd.DataFrame:
+        """
+        Run GROUP BY aggregations with pandas' numba engine
+
+        Each aggregate is computed separately (COUNT stays on the Cython path,
+        numba has no count kernel) and the results are joined on the group keys.
+        """
+        grouped = df.groupby(group_by, observed=True)
+
+        results = []
+        for col, func in agg_dict.items():
+            if func == "count":
+                results.append(grouped[col].count())
+            else:
+                agg_method = getattr(grouped[col], func)
+                results.append(agg_method(engine="numba", engine_kwargs=NUMBA_ENGINE_KWARGS))
+
+        return _get_pd().concat(results, axis=1).reset_index()
+
+    def _apply_orderby(
+        self, df: pd.DataFrame, ast: SelectStatement, limit: int | None = None
+    ) -> pd.DataFrame:
+        """
+        Apply ORDER BY, optionally fused with LIMIT
+
+        When a limit is given and all sort directions agree, uses a partial
+        top-K selection instead of a full sort: O(n) partitioning for a single
+        numeric column, otherwise heap-based O(n log k) rather than O(n log n).
+        """
         # Build column list and ascending flags
         by_cols = []
         ascending = []
@@ -377,22 +796,88 @@ class PandasExecutor:
             by_cols.append(order_col.column)
             ascending.append(order_col.direction == "ASC")
 
+        if limit is not None and len(by_cols) == 1:
+            top_k = self._top_k_numeric(df, by_cols[0], ascending[0], limit)
+            if top_k is not None:
+                return top_k
+
+        if limit is not None and len(set(ascending)) == 1:
+            top_k = self._top_k(df, by_cols, ascending[0], limit)
+            if top_k is not None:
+                return top_k
+
         # Sort (na_position='last' to match SQL NULL behavior)
-        return df.sort_values(by=by_cols, ascending=ascending, na_position="last")
+        result = df.sort_values(by=by_cols, ascending=ascending, na_position="last")
+        if limit is not None:
+            result = result.head(limit)
+        return result
 
-    def _apply_projection(self, df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
-        """Apply column selection (PROJECT)"""
-        if columns == ["*"]:
-            return df
+    def _top_k_numeric(
+        self, df: pd.DataFrame, column: str, ascending: bool, limit: int
+    ) -> pd.DataFrame | None:
+        """
+        Select the first ``limit`` rows ordered by one numeric column in O(n)
 
-        # Select only available columns
-        available_cols = [c for c in columns if c in df.columns]
+        Partitions the column's numpy array around the k-th value, then sorts
+        only the k selected rows. Ties at the boundary keep the earliest rows,
+        matching nsmallest/nlargest.
 
-        if not available_cols:
-            # No columns match, return empty DataFrame
-            return df.iloc[:0]
+        Returns:
+            Top-K DataFrame, or None if the column isn't a plain numeric array
+        """
+        import numpy as np
+
+        if column not in df.columns or not 0 < limit < len(df):
+            return None
+
+        dtype = df[column].dtype
+        if not isinstance(dtype, np.dtype) or dtype.kind not in "iufb":
+            return None
 
-        return df[available_cols]
+        values = df[column].to_numpy()
+        if dtype.kind == "f" and np.isnan(values).any():
+            # NaNs partition as largest, but SQL sorts NULLs last either way
+            return None
+
+        if ascending:
+            kth = np.partition(values, limit - 1)[limit - 1]
+            selected = values < kth
+        else:
+            kth = np.partition(values, len(values) - limit)[len(values) - limit]
+            selected = values > kth
+
+        ties = np.flatnonzero(values == kth)[: limit - int(selected.sum())]
+        positions = np.sort(np.concatenate([np.flatnonzero(selected), ties]))
+
+        return df.iloc[positions].sort_values(column, ascending=ascending, kind="stable")
+
+    def _top_k(
+        self, df: pd.DataFrame, by_cols: list[str], ascending: bool, limit: int
+    ) -> pd.DataFrame | None:
+        """
+        Select the first ``limit`` rows in sort order without a full sort
+
+        Returns:
+            Top-K DataFrame, or None if the caller should fall back to a full sort
+        """
+        try:
+            if ascending:
+                result = df.nsmallest(limit, by_cols)
+            else:
+                result = df.nlargest(limit, by_cols)
+        except (TypeError, ValueError, KeyError):
+            # nsmallest/nlargest only support numeric and datetime columns
+            return None
+
+        # NULLs are dropped by nsmallest/nlargest, but SQL sorts them last
+        if len(result) < min(limit, len(df)):
+            return None
+
+        return result
+
+    def _apply_projection(self, df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+        """Apply column selection (PROJECT)"""
+        return self._apply_mask_and_project(df, None, columns)
 
     def explain(self, ast: SelectStatement, source: str) -> str:
         """
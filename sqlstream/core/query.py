@@ -11,37 +11,146 @@ Example:
     ...     print(row)
 """
 
-import os
+import copy
+import functools
+import importlib.util
+import itertools
 import re
 from collections.abc import Callable, Iterator
-from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from sqlstream.core.executor import Executor
-from sqlstream.core.fragment_parser import parse_source_fragment
+from sqlstream.core.fragment_parser import SourceTable
 from sqlstream.core.types import Schema
 from sqlstream.readers.base import BaseReader
-from sqlstream.readers.csv_reader import CSVReader
+from sqlstream.readers.registry import create_reader
 from sqlstream.sql.ast_nodes import SelectStatement
+from sqlstream.sql.lexer import find_table_sources
 from sqlstream.sql.parser import parse
 
-# Try to import pandas executor
-try:
-    from sqlstream.core.pandas_executor import PANDAS_AVAILABLE, PandasExecutor
-except ImportError:
-    PANDAS_AVAILABLE = False
-    PandasExecutor = None
+if TYPE_CHECKING:
+    from sqlstream.core.duckdb_executor import DuckDBExecutor
+    from sqlstream.core.pandas_executor import PandasExecutor
+
+# Only probe for the optional backends here; their executor modules are
+# imported when a query first needs one (see _get_pandas_executor)
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+DUCKDB_AVAILABLE = importlib.util.find_spec("duckdb") is not None
+
+# Accepted backend names. QueryResult normalizes its backend argument to one
+# of these strings once, so later comparisons are against the same constants
+_BACKENDS = {name: name for name in ("auto", "pandas", "python", "duckdb")}
+
+# Backends picked by backend="auto" (installed libraries can't change at runtime):
+# queries the custom parser handles prefer pandas > python, and the last-resort
+# default prefers pandas > duckdb > python
+_SIMPLE_QUERY_BACKEND = "pandas" if PANDAS_AVAILABLE else "python"
+_FALLBACK_BACKEND = "pandas" if PANDAS_AVAILABLE else "duckdb" if DUCKDB_AVAILABLE else "python"
+
+# Characters without which a query can't name a file source itself
+_SOURCE_CHARS_RE = re.compile(r"['\"/.#]")
+
+# Join keywords the lexer can report where an unquoted source is expected
+_JOIN_KEYWORDS = frozenset({"INNER", "LEFT", "RIGHT", "OUTER", "CROSS"})
+
+# SQL features the custom parser doesn't support, matched against the query's
+# words (so columns like `overall` or `lead_time` don't count): CTEs, window
+# functions, HAVING, set operations and complex expressions
+_ADVANCED_SQL_WORDS = frozenset(
+    {
+        "WITH",
+        "OVER",
+        "WINDOW",
+        "ROW_NUMBER",
+        "RANK",
+        "DENSE_RANK",
+        "LAG",
+        "LEAD",
+        "HAVING",
+        "UNION",
+        "INTERSECT",
+        "EXCEPT",
+        "CASE",
+        "CAST",
+        "EXTRACT",
+    }
+)
+
+# Maps ASCII punctuation and whitespace to spaces, so split() yields the words
+_NON_WORD_TO_SPACE = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")}
+)
+
+# PARTITION only counts when followed by BY (it is a common column name)
+_PARTITION_BY_RE = re.compile(r"\bPARTITION\s+BY\b", re.IGNORECASE)
+
+# SELECT inside parentheses (a subquery)
+_SUBQUERY_RE = re.compile(r"\([^)]*\bSELECT\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(sql: str) -> SelectStatement:
+    """Parse SQL, memoizing the AST so repeated query strings skip the parser"""
+    return parse(sql)
+
+
+def _normalize_backend(backend: str | None) -> str:
+    """
+    Map a backend argument to its canonical name (None means "auto")
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if backend is None:
+        return "auto"
+    try:
+        return _BACKENDS[backend.lower()]
+    except (KeyError, AttributeError):
+        raise ValueError(
+            f"Unknown backend {backend!r}. Choose from: {', '.join(_BACKENDS)}"
+        ) from None
+
+
+def _parse(sql: str) -> SelectStatement:
+    """
+    Parse SQL using the AST cache
+
+    Each caller gets its own top-level statement (a shallow copy), since
+    optimizers may reassign its attributes (e.g. partition pruning replaces
+    the WHERE clause). Nested nodes are shared and must not be mutated.
+    """
+    return copy.copy(_parse_cached(sql))
+
+
+# Pandas and DuckDB executors hold no per-query state, so all QueryResults
+# share one of each (the DuckDB database in particular is slow to open).
+# The Python Executor's planner records per-query optimizations, so it isn't shared.
+@functools.lru_cache(maxsize=1)
+def _get_pandas_executor() -> "PandasExecutor":
+    """Shared pandas executor"""
+    from sqlstream.core.pandas_executor import PandasExecutor
+
+    return PandasExecutor()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_duckdb_executor() -> "DuckDBExecutor":
+    """Shared DuckDB executor (each query runs on its own cursor)"""
+    from sqlstream.core.duckdb_executor import DuckDBExecutor
 
-# Try to import duckdb executor
-try:
-    from sqlstream.core.duckdb_executor import DuckDBExecutor, is_duckdb_available
+    # Closing it (e.g. `with result.executor:`) mustn't break later queries
+    return DuckDBExecutor(shared=True)
 
-    DUCKDB_AVAILABLE = is_duckdb_available()
-except ImportError:
-    DUCKDB_AVAILABLE = False
-    DuckDBExecutor = None
 
+# Executor factory and (use_pandas, use_duckdb) flags for each resolved backend
+_EXECUTORS = {
+    "duckdb": (_get_duckdb_executor, False, True),
+    "pandas": (_get_pandas_executor, True, False),
+    "python": (Executor, False, False),
+}
 
+
+@functools.lru_cache(maxsize=512)
 def _can_parse_with_custom_parser(sql: str) -> bool:
     """
     Determine if SQL can be handled by the custom parser (Python/Pandas backends)
@@ -64,44 +173,51 @@ def _can_parse_with_custom_parser(sql: str) -> bool:
     Returns:
         True if custom parser can handle it, False if DuckDB is needed
     """
-    sql_upper = sql.upper()
-
-    # Check for advanced SQL features that require DuckDB
-    advanced_keywords = [
-        "WITH",  # CTEs
-        "OVER",  # Window functions
-        "PARTITION BY",  # Window functions
-        "WINDOW",  # Window functions
-        "HAVING",  # HAVING clause
-        "UNION",  # Set operations
-        "INTERSECT",  # Set operations
-        "EXCEPT",  # Set operations
-        "CASE",  # CASE expressions
-        "CAST",  # Type casting
-        "EXTRACT",  # Date extraction
-        "ROW_NUMBER",  # Window functions
-        "RANK",  # Window functions
-        "DENSE_RANK",  # Window functions
-        "LAG",  # Window functions
-        "LEAD",  # Window functions
-    ]
-
-    for keyword in advanced_keywords:
-        if keyword in sql_upper:
-            return False  # Needs DuckDB
-
-    # Check for subqueries - look for SELECT inside parentheses
-    # This is a simple heuristic
-    if "(" in sql:
-        # Extract content inside parentheses
-        import re
-
-        paren_content = re.findall(r"\(([^)]+)\)", sql_upper)
-        for content in paren_content:
-            if "SELECT" in content:
-                return False  # Has subquery, needs DuckDB
-
-    return True  # Can use custom parser
+    # Needs DuckDB if it uses an advanced feature or has a subquery. The words
+    # come from one pass of C-level string methods, however many keywords there are
+    words = set(sql.upper().translate(_NON_WORD_TO_SPACE).split())
+    if not _ADVANCED_SQL_WORDS.isdisjoint(words):
+        return False
+    if "PARTITION" in words and _PARTITION_BY_RE.search(sql):
+        return False
+    return not _SUBQUERY_RE.search(sql)
+
+
+def _unify_batches(batches: list[Any]) -> list[Any]:
+    """
+    Give Arrow record batches whose types were inferred separately one schema
+
+    Each column takes the widest of its types across the batches (a column
+    that is all null in one batch takes its type from the others, integers
+    widen to floats); columns a batch lacks are filled with nulls.
+
+    Args:
+        batches: pyarrow RecordBatches
+
+    Returns:
+        The batches, cast to a shared schema where they differ
+    """
+    import pyarrow as pa
+
+    if len({batch.schema for batch in batches}) <= 1:
+        return batches
+
+    schema = pa.unify_schemas([batch.schema for batch in batches], promote_options="permissive")
+    unified = []
+    for batch in batches:
+        if batch.schema != schema:
+            names = set(batch.schema.names)
+            batch = pa.RecordBatch.from_arrays(
+                [
+                    batch.column(field.name).cast(field.type)
+                    if field.name in names
+                    else pa.nulls(batch.num_rows, field.type)
+                    for field in schema
+                ],
+                schema=schema,
+            )
+        unified.append(batch)
+    return unified
 
 
 class Query:
@@ -111,6 +227,12 @@ class Query:
     Provides a fluent API for building and executing queries.
     """
 
+    __slots__ = ("source", "_reader", "_schema")
+
+    # Auto-detect source type and create appropriate reader (source#format:table
+    # fragments supported); shared with the pandas executor via the registry
+    _create_reader = staticmethod(create_reader)
+
     def __init__(self, source: str | None = None):
         """
         Initialize query with an optional data source
@@ -130,93 +252,20 @@ class Query:
             >>> query.sql("SELECT * FROM 'data.csv' WHERE age > 25")
         """
         self.source = source
-        self.reader = self._create_reader(source) if source else None
+        self._reader: BaseReader | None = None
+        self._schema: Schema | None = None
 
-    def _create_reader(self, source: str) -> BaseReader:
+    @property
+    def reader(self) -> BaseReader | None:
         """
-        Auto-detect source type and create appropriate reader
+        Reader for the source (None without one)
 
-        Supports URL fragments: source#format:table
-
-        Args:
-            source: Path to data file or URL, optionally with #format:table fragment
-
-        Returns:
-            Reader instance for the source
-
-        Raises:
-            ValueError: If file format is not supported
+        Created on first use, so building a Query doesn't open the file;
+        queries on the DuckDB or pandas backend never need it.
         """
-        from sqlstream.core.fragment_parser import parse_source_fragment
-
-        # Parse URL fragment if present
-        source_path, format_hint, table_hint = parse_source_fragment(source)
-
-        # Check if source is HTTP/HTTPS URL
-        if source_path.startswith(("http://", "https://")):
-            from sqlstream.readers.http_reader import HTTPReader
-
-            kwargs = {}
-            if format_hint:
-                kwargs["format"] = format_hint
-            if table_hint is not None:
-                kwargs["table"] = table_hint
-            return HTTPReader(source_path, **kwargs)
-
-        path = Path(source_path)
-
-        # Check file extension to determine format
-        suffix = path.suffix.lower()
-
-        # Explicit format from fragment takes precedence
-        if format_hint == "html" or (not format_hint and suffix in [".html", ".htm"]):
-            from sqlstream.readers.html_reader import HTMLReader
-
-            table = table_hint if table_hint is not None else 0
-            return HTMLReader(source_path, table=table)
-
-        elif format_hint == "markdown" or (not format_hint and suffix in [".md", ".markdown"]):
-            from sqlstream.readers.markdown_reader import MarkdownReader
-
-            table = table_hint if table_hint is not None else 0
-            return MarkdownReader(source_path, table=table)
-
-        elif format_hint == "xml" or (not format_hint and suffix == ".xml"):
-            from sqlstream.readers.xml_reader import XMLReader
-
-            # For XML, table_hint is used as element name/path
-            element = str(table_hint) if table_hint is not None else None
-            return XMLReader(source_path, element=element)
-
-        elif format_hint == "parquet" or (not format_hint and suffix == ".parquet"):
-            from sqlstream.readers.parquet_reader import ParquetReader
-
-            return ParquetReader(source_path)
-
-        elif format_hint == "json" or (not format_hint and suffix == ".json"):
-            from sqlstream.readers.json_reader import JSONReader
-
-            # Ensure key is a string for JSON lookups
-            key = str(table_hint) if table_hint is not None else None
-            return JSONReader(source_path, records_key=key)
-
-        elif format_hint == "jsonl" or (not format_hint and suffix == ".jsonl"):
-            from sqlstream.readers.jsonl_reader import JSONLReader
-
-            return JSONLReader(source_path)
-
-        elif format_hint == "csv" or (not format_hint and suffix == ".csv"):
-            return CSVReader(source_path)
-
-        else:
-            # Try CSV as default
-            try:
-                return CSVReader(source_path)
-            except Exception as e:
-                raise ValueError(
-                    f"Unsupported file format: {suffix}. "
-                    f"Supported formats: .csv, .parquet, .json, .jsonl, .html, .md, .xml"
-                ) from e
+        if self._reader is None and self.source:
+            self._reader = self._create_reader(self.source)
+        return self._reader
 
     def sql(
         self, query: str, backend: Literal["auto", "pandas", "python", "duckdb"] | None = "auto"
@@ -252,26 +301,14 @@ class Query:
             ...     backend="duckdb"
             ... )
         """
-        # Note: Backend selection is now handled in QueryResult._select_backend()
-        # to preserve the 'auto' value while still doing smart selection
-
-        # If query can be parsed with custom parser
-        if _can_parse_with_custom_parser(query):
-            # Try to parse with custom parser
-            try:
-                ast = parse(query)
-            except Exception:
-                # Cannot be parsed with custom parser, need DuckDB
-                ast = None
-        else:
-            # Cannot be parsed with custom parser, need DuckDB
-            ast = None
-
+        # Backend selection - and parsing, which only the pandas and python
+        # backends need - is handled in QueryResult._select_backend(), so a
+        # query bound for DuckDB is never run through the custom parser
         # Create QueryResult with reader factory for JOIN support
         return QueryResult(
-            ast=ast,
-            reader=self.reader,
-            reader_factory=self._create_reader,
+            ast=None,
+            reader=self._reader,
+            reader_factory=create_reader,
             source=self.source,
             backend=backend,
             raw_sql=query,
@@ -281,6 +318,9 @@ class Query:
         """
         Get schema information for the data source
 
+        The schema is inferred on the first call and reused afterwards; create
+        a new Query to pick up changes to the file.
+
         Returns:
             Schema object with inferred types, or None if schema cannot be inferred
 
@@ -293,7 +333,9 @@ class Query:
             raise ValueError(
                 "Cannot get schema without a source. Provide a source when creating the Query object."
             )
-        return self.reader.get_schema()
+        if self._schema is None:
+            self._schema = self.reader.get_schema()
+        return self._schema
 
 
 class QueryResult:
@@ -304,10 +346,22 @@ class QueryResult:
     a lazy iterator over the results.
     """
 
+    __slots__ = (
+        "ast",
+        "_reader",
+        "reader_factory",
+        "source",
+        "backend",
+        "raw_sql",
+        "executor",
+        "use_pandas",
+        "use_duckdb",
+    )
+
     def __init__(
         self,
         ast: SelectStatement,
-        reader: BaseReader,
+        reader: BaseReader | None,
         reader_factory: Callable[[str], BaseReader],
         source: str,
         backend: str = "auto",
@@ -318,22 +372,33 @@ class QueryResult:
 
         Args:
             ast: Parsed SQL AST (None for DuckDB backend)
-            reader: Data source reader
+            reader: Data source reader (None to create it from source when needed)
             reader_factory: Factory function to create readers for JOIN tables
             source: Path to data source file
-            backend: Execution backend ("auto", "pandas", "python", or "duckdb")
+            backend: Execution backend ("auto", "pandas", "python", or "duckdb";
+                case-insensitive, None means "auto")
             raw_sql: Original SQL query string (required for DuckDB)
+
+        Raises:
+            ValueError: If the backend name is unknown
         """
         self.ast = ast
-        self.reader = reader
+        self._reader = reader
         self.reader_factory = reader_factory
         self.source = source
-        self.backend = backend
+        self.backend = _normalize_backend(backend)
         self.raw_sql = raw_sql
 
         # Select executor based on backend
         self._select_backend()
 
+    @property
+    def reader(self) -> BaseReader | None:
+        """Reader for the source, created on first use (None without a source)"""
+        if self._reader is None and self.source:
+            self._reader = self.reader_factory(self.source)
+        return self._reader
+
     def _select_backend(self):
         """Select appropriate backend based on configuration"""
 
@@ -346,99 +411,53 @@ class QueryResult:
             # Case 1: AST already present
             # This means custom parser already succeeded
             if self.ast:
-                if PANDAS_AVAILABLE:
-                    target_backend = "pandas"
-                else:
-                    target_backend = "python"
-
-            # Case 2: No AST, analyze raw SQL
-            elif self.raw_sql:
-                if _can_parse_with_custom_parser(self.raw_sql):
-                    # Simple query - prefer pandas > python
-                    if PANDAS_AVAILABLE:
-                        target_backend = "pandas"
-                    else:
-                        target_backend = "python"
-                elif DUCKDB_AVAILABLE:
-                    # Complex query - use DuckDB
-                    target_backend = "duckdb"
-                else:
-                    # Complex query but no DuckDB
-                    raise ImportError(
-                        "This query requires advanced SQL features not supported by the basic parser. "
-                        "Install `sqlstream[duckdb]`"
-                    )
-
-            # Case 3: Fallback (shouldn't happen in normal usage)
+                target_backend = _SIMPLE_QUERY_BACKEND
+
+            # Case 2: Fallback (shouldn't happen in normal usage)
+            elif not self.raw_sql:
+                target_backend = _FALLBACK_BACKEND
+
+            # Case 3: No AST, analyze raw SQL
+            elif _can_parse_with_custom_parser(self.raw_sql):
+                # Simple query
+                target_backend = _SIMPLE_QUERY_BACKEND
+            elif DUCKDB_AVAILABLE:
+                # Complex query - use DuckDB
+                target_backend = "duckdb"
             else:
-                if PANDAS_AVAILABLE:
-                    target_backend = "pandas"
-                elif DUCKDB_AVAILABLE:
-                    target_backend = "duckdb"
-                else:
-                    target_backend = "python"
-
-        # Configure executor based on target_backend
-        if target_backend == "duckdb":
-            # Force DuckDB backend
-            if not DUCKDB_AVAILABLE:
+                # Complex query but no DuckDB
                 raise ImportError(
-                    "DuckDB backend requested but duckdb is not installed. "
+                    "This query requires advanced SQL features not supported by the basic parser. "
                     "Install `sqlstream[duckdb]`"
                 )
-            self.executor = DuckDBExecutor()
-            self.use_duckdb = True
-            self.use_pandas = False
 
-        elif target_backend == "pandas":
-            # Force pandas backend
-            if not PANDAS_AVAILABLE:
-                raise ImportError(
-                    "Pandas backend requested but pandas is not installed. "
-                    "Install `sqlstream[pandas]`"
-                )
-
-            # Ensure AST is parsed if not already present
-            if not self.ast and self.raw_sql:
-                try:
-                    self.ast = parse(self.raw_sql)
-                except Exception as e:
-                    # If auto selected pandas but parsing failed, try fallback to DuckDB
-                    if self.backend == "auto" and DUCKDB_AVAILABLE:
-                        self.executor = DuckDBExecutor()
-                        self.use_duckdb = True
-                        self.use_pandas = False
-                        return
+        if target_backend == "duckdb" and not DUCKDB_AVAILABLE:
+            raise ImportError(
+                "DuckDB backend requested but duckdb is not installed. Install `sqlstream[duckdb]`"
+            )
+        if target_backend == "pandas" and not PANDAS_AVAILABLE:
+            raise ImportError(
+                "Pandas backend requested but pandas is not installed. Install `sqlstream[pandas]`"
+            )
 
+        # The pandas and python backends run on the AST; parse it if not already present
+        if target_backend != "duckdb" and not self.ast and self.raw_sql:
+            try:
+                self.ast = _parse(self.raw_sql)
+            except Exception as e:
+                if self.backend == "auto" and DUCKDB_AVAILABLE:
+                    # Auto picked a parser-based backend but parsing failed
+                    target_backend = "duckdb"
+                elif target_backend == "pandas":
                     raise ValueError(
                         f"Failed to parse SQL query: {e}. "
                         "Consider installing DuckDB for full SQL support: pip install sqlstream[duckdb]"
                     ) from e
-
-            self.executor = PandasExecutor()
-            self.use_pandas = True
-            self.use_duckdb = False
-
-        elif target_backend == "python":
-            # Force pure Python backend
-
-            # Ensure AST is parsed if not already present
-            if not self.ast and self.raw_sql:
-                try:
-                    self.ast = parse(self.raw_sql)
-                except Exception as e:
-                    # If auto selected python but parsing failed, try fallback to DuckDB
-                    if self.backend == "auto" and DUCKDB_AVAILABLE:
-                        self.executor = DuckDBExecutor()
-                        self.use_duckdb = True
-                        self.use_pandas = False
-                        return
-
+                else:
                     raise ValueError(f"Failed to parse SQL query: {e}") from e
 
-            self.executor = Executor()
-            self.use_pandas = False
-            self.use_duckdb = False
+        get_executor, self.use_pandas, self.use_duckdb = _EXECUTORS[target_backend]
+        self.executor = get_executor()
 
     def __iter__(self) -> Iterator[dict[str, Any]]:
         """
@@ -464,131 +483,337 @@ class QueryResult:
             yield from self.executor.execute(self.ast, self.source or self.ast.source, right_source)
         else:
             # Python executor uses reader objects
-            # If no reader exists (sourceless query), create one from AST
-            reader = self.reader
-            if not reader and self.ast and self.ast.source:
-                reader = self.reader_factory(self.ast.source)
-            yield from self.executor.execute(self.ast, reader, self.reader_factory)
-
-    @staticmethod
-    def _get_sanitized_name_and_table_hint(source: str) -> tuple[str, int | None]:
-        # Parse fragment if present to get base path
-        clean_path, format_hint, table_hint = parse_source_fragment(source)
-
-        # Generate a table name from the file path
-        # Extract base filename (without extension or parent directories)
-        base_name = os.path.splitext(os.path.basename(clean_path))[0]
-
-        # Clean up the name to be SQL-safe (only alphanumeric and underscore)
-        sanitized_name = re.sub(r"[^a-zA-Z0-9_]", "_", base_name)
-        return sanitized_name, table_hint
-
-    @staticmethod
-    def _get_table_name(source: str) -> str:
-        sanitized_name, table_hint = QueryResult._get_sanitized_name_and_table_hint(source)
-
-        # Make the table name unique if multiple tables from same file
-        # This handles cases like complex.html#html:0, complex.html#html:1, etc.
-        if table_hint is not None:
-            # Include table/fragment index in the name
-            table_name = f"{sanitized_name}_{table_hint}"
+            yield from self.executor.execute(self.ast, self._plan_reader(), self.reader_factory)
+
+    def _plan_reader(self) -> BaseReader | None:
+        """
+        Get a reader for the Python executor to plan against
+
+        The planner pushes filters, columns and limits into the reader, so each
+        execution works on a shallow copy rather than the ``Query``'s shared
+        reader (which would otherwise carry one query's pushdown into the next).
+
+        Returns:
+            Reader for this execution, or None if there is no source
+        """
+        if self.reader:
+            return copy.copy(self.reader)
+        # Sourceless query - create one from the AST
+        if self.ast and self.ast.source:
+            return self.reader_factory(self.ast.source)
+        return None
+
+    def __length_hint__(self) -> int:
+        """
+        Estimate the number of result rows (PEP 424)
+
+        Lets list() and tuple() size their buffer up front. Only plain scans
+        (no WHERE, GROUP BY, aggregates or JOIN) of a source whose metadata
+        records a row count, such as Parquet, get a hint; it is capped by LIMIT.
+        The pandas and DuckDB backends never need a reader, so they only get
+        a hint when one was already built.
+        """
+        ast = self.ast
+        if ast is None or ast.where or ast.group_by or ast.aggregates or ast.join:
+            return NotImplemented
+
+        try:
+            # The Python backend builds its reader to execute anyway
+            reader = self._reader if self.use_pandas or self.use_duckdb else self.reader
+            rows = reader.row_count_hint() if reader is not None else None
+        except Exception:
+            # A hint is optional; errors surface when the query runs
+            return NotImplemented
+
+        if rows is None:
+            return NotImplemented
+        return rows if ast.limit is None else min(rows, max(ast.limit, 0))
+
+    def rows(self) -> Iterator[tuple]:
+        """
+        Execute query and yield results lazily as tuples
+
+        Cheaper than iterating dicts: the pandas and DuckDB backends build no
+        per-row dict, and a tuple takes far less memory than a dict. Values are
+        in column order (the key order of the dicts iteration yields).
+
+        Yields:
+            Result rows as tuples
+
+        Example:
+            >>> for name, age in query("data.csv").sql("SELECT name, age").rows():
+            ...     print(name, age)
+        """
+        if self.use_duckdb:
+            if not self.raw_sql:
+                raise ValueError("DuckDB backend requires raw SQL query")
+
+            sources = self._discover_sources()
+            rows = self.executor.execute_tuples(
+                self.raw_sql, sources, reader_factory=self.reader_factory
+            )
+            next(rows)  # Column names
+            yield from rows
+        elif self.use_pandas:
+            right_source = self.ast.join.right_source if self.ast.join else None
+            yield from self.executor.execute_tuples(
+                self.ast, self.source or self.ast.source, right_source
+            )
+        else:
+            for row in self:
+                yield tuple(row.values())
+
+    def arrow_batches(self, batch_size: int = 2048) -> Iterator[Any]:
+        """
+        Execute query and yield results as Arrow record batches
+
+        The fast path for bulk consumers: the pandas and DuckDB backends hand
+        over whole columns instead of building a dict per row. The Python
+        backend builds batches from its rows; their column types are only
+        known once every row has been seen, so it builds all of them before
+        yielding any, with one schema for the whole stream.
+
+        Args:
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            pyarrow RecordBatches
+
+        Example:
+            >>> for batch in query("data.csv").sql("SELECT *").arrow_batches():
+            ...     print(batch.num_rows)
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("Arrow batches require pyarrow. Install `sqlstream[parquet]`") from e
+
+        if self.use_duckdb:
+            if not self.raw_sql:
+                raise ValueError("DuckDB backend requires raw SQL query")
+
+            sources = self._discover_sources()
+            yield from self.executor.execute_arrow(
+                self.raw_sql, sources, batch_size=batch_size, reader_factory=self.reader_factory
+            )
+        elif self.use_pandas:
+            right_source = self.ast.join.right_source if self.ast.join else None
+            yield from self.executor.execute_arrow(
+                self.ast, self.source or self.ast.source, right_source, batch_size=batch_size
+            )
         else:
-            table_name = sanitized_name
-        return table_name
+            rows = iter(self)
+            batches = []
+            while chunk := list(itertools.islice(rows, batch_size)):
+                batches.append(pa.RecordBatch.from_pylist(chunk))
+            yield from _unify_batches(batches)
 
-    def _discover_sources(self) -> dict[str, str]:
+    def to_dataframe(self):
+        """
+        Execute query and return the results as a pandas DataFrame
+
+        The pandas and DuckDB backends return their result frame directly,
+        without building a dict per row.
+
+        Returns:
+            pandas DataFrame
+
+        Example:
+            >>> df = query("data.csv").sql("SELECT * WHERE age > 25").to_dataframe()
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError(
+                "DataFrame results require pandas. Install `sqlstream[pandas]`"
+            ) from e
+
+        if self.use_duckdb:
+            if not self.raw_sql:
+                raise ValueError("DuckDB backend requires raw SQL query")
+
+            sources = self._discover_sources()
+            return self.executor.execute_df(
+                self.raw_sql, sources, reader_factory=self.reader_factory
+            )
+        elif self.use_pandas:
+            right_source = self.ast.join.right_source if self.ast.join else None
+            return self.executor.execute_df(self.ast, self.source or self.ast.source, right_source)
+        else:
+            return pd.DataFrame(list(self))
+
+    def to_arrow(self):
+        """
+        Execute query and return the results as a pyarrow Table
+
+        Returns:
+            pyarrow Table
+
+        Example:
+            >>> table = query("data.parquet").sql("SELECT * WHERE age > 25").to_arrow()
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("Arrow results require pyarrow. Install `sqlstream[parquet]`") from e
+
+        if self.use_duckdb:
+            if not self.raw_sql:
+                raise ValueError("DuckDB backend requires raw SQL query")
+
+            sources = self._discover_sources()
+            return self.executor.execute_arrow_table(
+                self.raw_sql, sources, reader_factory=self.reader_factory
+            )
+        elif self.use_pandas:
+            return pa.Table.from_pandas(self.to_dataframe(), preserve_index=False)
+        else:
+            return pa.Table.from_pylist(list(self))
+
+    def to_polars(self):
+        """
+        Execute query and return the results as a polars DataFrame
+
+        Built from to_arrow(), which polars adopts without copying the
+        columns, so no backend builds a dict per row.
+
+        Returns:
+            polars DataFrame
+
+        Example:
+            >>> df = query("data.parquet").sql("SELECT * WHERE age > 25").to_polars()
+        """
+        try:
+            import polars as pl
+        except ImportError as e:
+            raise ImportError("Polars results require polars. Install `polars`") from e
+
+        return pl.from_arrow(self.to_arrow())
+
+    def to_parquet(self, path: str) -> None:
+        """
+        Execute query and write the results to a Parquet file
+
+        The DuckDB backend writes the file itself (COPY ... TO). The other
+        backends write their Arrow batches into the file as they come, so the
+        result is never held as Python rows; the file takes the schema the
+        batches share.
+
+        Args:
+            path: Parquet file to write
+
+        Example:
+            >>> query("data.csv").sql("SELECT * WHERE age > 25").to_parquet("adults.parquet")
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet output requires pyarrow. Install `sqlstream[parquet]`"
+            ) from e
+
+        if self.use_duckdb:
+            if not self.raw_sql:
+                raise ValueError("DuckDB backend requires raw SQL query")
+
+            sources = self._discover_sources()
+            self.executor.write_parquet(
+                self.raw_sql, sources, path, reader_factory=self.reader_factory
+            )
+            return
+
+        batches = self.arrow_batches()
+        first = next(batches, None)
+        if first is None:
+            pq.write_table(pa.table({}), path)
+            return
+
+        with pq.ParquetWriter(path, first.schema) as writer:
+            writer.write_batch(first)
+            for batch in batches:
+                writer.write_batch(batch)
+
+    def _discover_sources(self) -> list[SourceTable]:
         """
         Discover all table sources from raw SQL or AST
 
         For DuckDB backend, this extracts all file paths from the SQL query.
         Handles multiple files in JOINs, subqueries, CTEs, etc.
-        Properly handles URL fragments like #html:0
+        Properly handles URL fragments like #html:0 (each parsed once)
+
+        Returns:
+            SourceTable per source, with unique table names
         """
-        sources: dict[str, str] = {}
+        sources: dict[str, SourceTable] = {}
 
         if self.raw_sql:
             # Extract file paths from raw SQL for DuckDB
-            # Pattern matches quoted file paths/URLs (including those with fragments)
-            # Matches: FROM 'file.csv' or FROM "file.csv" or JOIN 'url#format:table'
-            # The key is to NOT stop at # - we need to capture the full fragment
-
-            # Pattern for quoted file paths - captures everything inside quotes
-            # This handles fragments like #html:3, #csv:0, etc.
-            quoted_pattern = r"(?:FROM|JOIN)\s+(['\"])([^\1]+?)\1"
-            matches = re.findall(quoted_pattern, self.raw_sql, re.IGNORECASE)
+            # The lexer skips comments and string literals, and keeps quoted
+            # paths whole - including fragments like #html:3, #csv:0, etc.
 
             # Track table name usage to avoid conflicts
-            name_counter = {}
-
-            for _quote_char, file_path in matches:
-                sanitized_name, _ = self._get_sanitized_name_and_table_hint(file_path)
-                table_name = self._get_table_name(file_path)
-
-                # Ensure uniqueness by adding counter if needed
-                if table_name in sources:
-                    counter = name_counter.get(sanitized_name, 0) + 1
-                    name_counter[sanitized_name] = counter
-                    table_name = f"{table_name}_{counter}"
-
-                # Store the mapping: table_name -> original_file_path
-                sources[table_name] = file_path
-
-            # Also check for unquoted file paths (e.g., from f-strings in tests)
-            # Pattern: FROM /path/to/file.ext or FROM file.ext
-            # This is tricky because we need to stop at keywords or whitespace
-            unquoted_pattern = r"(?:FROM|JOIN)\s+([/\w.#:-]+?)(?:\s+(?:ON|WHERE|GROUP|ORDER|LIMIT|INNER|LEFT|RIGHT|JOIN|,|\))|$)"
-            unquoted_matches: list[str] = re.findall(unquoted_pattern, self.raw_sql, re.IGNORECASE)
-
-            for file_path in unquoted_matches:
-                # Skip if already found as quoted
-                if file_path in set(sources.values()):
-                    continue
+            name_counter: dict[str, int] = {}
+            seen_paths = set()
 
-                # Skip SQL keywords
-                if file_path.upper() in ["INNER", "LEFT", "RIGHT", "OUTER", "CROSS"]:
+            # Sources are quoted or contain a path character; without any of
+            # those in the query, only the main source can apply (skip the lexer)
+            if _SOURCE_CHARS_RE.search(self.raw_sql):
+                candidates = find_table_sources(self.raw_sql)
+            else:
+                candidates = []
+
+            for file_path, quoted in candidates:
+                # Skip if already found (e.g. a self-join registers the file once)
+                if file_path in seen_paths:
                     continue
 
-                # Only process if it looks like a file path
-                if "/" in file_path or "." in file_path or "#" in file_path:
-                    sanitized_name, _ = self._get_sanitized_name_and_table_hint(file_path)
-                    table_name = self._get_table_name(file_path)
+                if not quoted:
+                    # Skip SQL keywords
+                    if file_path.upper() in _JOIN_KEYWORDS:
+                        continue
+
+                    # Only process if it looks like a file path (not a table/CTE name)
+                    if not ("/" in file_path or "." in file_path or "#" in file_path):
+                        continue
 
-                    # Ensure uniqueness
-                    if table_name in sources:
-                        counter = name_counter.get(sanitized_name, 0) + 1
-                        name_counter[sanitized_name] = counter
-                        table_name = f"{table_name}_{counter}"
+                table = SourceTable.from_source(file_path)
 
-                    sources[table_name] = file_path
+                # Ensure uniqueness by adding counter if needed (skipping any
+                # suffixed name another file already has, e.g. a_1.csv)
+                name = table.name
+                while table.name in sources:
+                    counter = name_counter[name] = name_counter.get(name, 0) + 1
+                    table.name = f"{name}_{counter}"
+
+                sources[table.name] = table
+                seen_paths.add(file_path)
 
             # If no sources found from SQL, use the main source
             if not sources and self.source:
-                table_name = self._get_table_name(self.source)
-                sources[table_name] = self.source
+                table = SourceTable.from_source(self.source)
+                sources[table.name] = table
 
         elif self.ast:
-            table_name = self._get_table_name(self.ast.source)
-
             # Extract from AST for Python/Pandas backends
             # Main table
-            if hasattr(self.ast, "table") and self.ast.table:
-                sources[self.ast.table] = self.ast.source
-            else:
-                # If no explicit table name, use 'data' as default
-                sources[table_name] = self.ast.source
+            table = SourceTable.from_source(self.ast.source)
+            sources[table.name] = table
 
             # JOIN table
             if self.ast.join:
-                join_table = self.ast.join.right_source
-                join_table_name = self._get_table_name(join_table)
-                sources[join_table_name] = join_table
+                join_table = SourceTable.from_source(self.ast.join.right_source)
+                sources[join_table.name] = join_table
 
-        return sources
+        return list(sources.values())
 
     def to_list(self) -> list[dict[str, Any]]:
         """
         Materialize all results into a list
 
+        Builds one dict per row; for large results use to_dataframe(),
+        to_arrow() or arrow_batches().
+
         Returns:
             List of all result rows
 
@@ -597,6 +822,17 @@ class QueryResult:
             >>> print(len(results))
             100
         """
+        if self.use_pandas:
+            # DataFrame.to_dict("records") returns each chunk as a list of its
+            # final size; extend with it instead of growing a list row by row
+            right_source = self.ast.join.right_source if self.ast.join else None
+            rows: list[dict[str, Any]] = []
+            for df in self.executor.execute_frames(
+                self.ast, self.source or self.ast.source, right_source
+            ):
+                rows.extend(df.to_dict("records"))
+            return rows
+
         return list(self)
 
     def explain(self) -> str:
@@ -625,7 +861,7 @@ class QueryResult:
             return self.executor.explain(self.ast, self.source)
         else:
             # Python executor explain
-            return self.executor.explain(self.ast, self.reader, self.reader_factory)
+            return self.executor.explain(self.ast, self._plan_reader(), self.reader_factory)
 
 
 # Convenience function for top-level API
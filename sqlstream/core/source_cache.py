@@ -0,0 +1,181 @@
+"""
+Source Cache - in-process cache of loaded data files
+
+Keeps recently loaded files in memory as immutable pyarrow Tables so that
+repeated queries over the same file (scripts, the interactive shell) skip
+disk I/O and parsing entirely.
+
+Entries are keyed by (absolute path, mtime, size), so a modified file is
+reloaded automatically. Whole files are cached, so queries projecting
+different columns of a file share one entry. Eviction is least-recently-used
+by total byte size.
+
+Inferred schemas are cached the same way (load_schema), so creating a new
+query over an unchanged file doesn't re-sample it.
+
+Example:
+    >>> from sqlstream.core.source_cache import load_table
+    >>> table = load_table("data.parquet", lambda: pq.read_table("data.parquet"))
+    >>> df = table.to_pandas()
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+# Default byte budget for cached tables (256 MB)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Maximum number of cached schemas
+MAX_SCHEMAS = 512
+
+_cache: OrderedDict[tuple, Any] = OrderedDict()
+_schemas: OrderedDict[tuple, Any] = OrderedDict()
+_cache_bytes = 0
+_max_bytes = DEFAULT_MAX_BYTES
+_lock = threading.Lock()
+
+
+def _cache_key(path: str) -> tuple | None:
+    """
+    Build a cache key for a local file, or None if the file can't be cached
+
+    Remote sources (s3://, http://, ...) and missing files are not cached.
+    """
+    if "://" in path:
+        return None
+
+    try:
+        abspath = os.path.abspath(path)
+        stat = os.stat(abspath)
+    except OSError:
+        return None
+
+    return (abspath, stat.st_mtime_ns, stat.st_size)
+
+
+def load_table(path: str, loader: Callable[[], Any]):
+    """
+    Load a file as a pyarrow Table, reusing a cached copy when possible
+
+    Args:
+        path: Path to the data file
+        loader: Zero-argument callable that reads the file into a pyarrow Table
+
+    Returns:
+        pyarrow Table for the file
+    """
+    global _cache_bytes
+
+    key = _cache_key(path)
+    if key is None:
+        return loader()
+
+    with _lock:
+        table = _cache.get(key)
+        if table is not None:
+            _cache.move_to_end(key)
+            return table
+
+    table = loader()
+    nbytes = table.nbytes
+
+    # Tables larger than the whole budget are never cached
+    if nbytes > _max_bytes:
+        return table
+
+    with _lock:
+        if key not in _cache:
+            _cache[key] = table
+            _cache_bytes += nbytes
+            _evict()
+
+    return table
+
+
+def load_schema(path: str, loader: Callable[[], Any], *options: Any):
+    """
+    Infer a file's schema, reusing a cached copy when possible
+
+    Callers must not mutate the returned schema; it is shared between calls.
+
+    Args:
+        path: Path to the data file
+        loader: Zero-argument callable that infers the schema (None is not cached)
+        *options: Hashable reader options that affect the schema (part of the cache key)
+
+    Returns:
+        Schema returned by the loader
+    """
+    key = _cache_key(path)
+    if key is None:
+        return loader()
+
+    key += options
+    with _lock:
+        schema = _schemas.get(key)
+        if schema is not None:
+            _schemas.move_to_end(key)
+            return schema
+
+    schema = loader()
+    if schema is None:
+        return None
+
+    with _lock:
+        _schemas[key] = schema
+        if len(_schemas) > MAX_SCHEMAS:
+            _schemas.popitem(last=False)
+
+    return schema
+
+
+def _evict() -> None:
+    """Drop least-recently-used entries until the cache fits its byte budget"""
+    global _cache_bytes
+
+    while _cache and _cache_bytes > _max_bytes:
+        _, table = _cache.popitem(last=False)
+        _cache_bytes -= table.nbytes
+
+
+def set_cache_limit(max_bytes: int) -> None:
+    """
+    Set the byte budget for cached tables
+
+    Args:
+        max_bytes: Maximum total size of cached tables in bytes (0 disables caching)
+    """
+    global _max_bytes
+
+    if max_bytes < 0:
+        raise ValueError(f"Cache limit must be non-negative, got {max_bytes}")
+
+    with _lock:
+        _max_bytes = max_bytes
+        _evict()
+
+
+def clear_cache() -> None:
+    """Remove all cached tables and schemas"""
+    global _cache_bytes
+
+    with _lock:
+        _cache.clear()
+        _schemas.clear()
+        _cache_bytes = 0
+
+
+def cache_info() -> dict[str, int]:
+    """
+    Get cache statistics
+
+    Returns:
+        Dictionary with number of entries, bytes used, and the byte budget
+    """
+    with _lock:
+        return {"entries": len(_cache), "bytes": _cache_bytes, "max_bytes": _max_bytes}
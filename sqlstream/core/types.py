@@ -3,12 +3,33 @@
 This module provides type definitions, inference, and validation for query execution.
 """
 
+import functools
 import json
+import re
+from collections.abc import Callable
 from datetime import date, datetime, time
 from decimal import Decimal, InvalidOperation
 from enum import Enum
+from itertools import repeat
 from typing import Any
 
+# ISO 8601 shapes that the first strptime formats below accept; fromisoformat
+# parses exactly these much faster, so they're tried before the format loops
+_ISO_DATETIME_RE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+    r"(?:T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?"
+    r"| [0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{1,6})?)?)"
+)
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_ISO_TIME_RE = re.compile(r"[0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{1,6})?)?")
+
+# Plain integers and decimals, classified in one match; other numerals that
+# int()/float() accept (exponents, underscores, inf/nan, ...) are tried directly
+_NUMBER_RE = re.compile(r"(?P<int>[+-]?[0-9]+)|(?P<float>[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+))")
+
+# Words float() accepts besides numerals (case-insensitive, optionally signed)
+_FLOAT_WORDS = frozenset({"inf", "infinity", "nan"})
+
 
 class DataType(Enum):
     """SQL data types supported by SQLStream."""
@@ -46,6 +67,17 @@ class DataType(Enum):
 
     def is_comparable(self, other: "DataType") -> bool:
         """Check if this type can be compared with another type."""
+        return bool(_COMPARABLE[self._index] >> other._index & 1)
+
+    def coerce_to(self, other: "DataType") -> "DataType":
+        """Determine the result type when coercing this type to another.
+
+        Used for type promotion in expressions like INTEGER + FLOAT.
+        """
+        return _COERCIONS[self._index][other._index]
+
+    def _comparable(self, other: "DataType") -> bool:
+        """Comparability rules, tabulated into _COMPARABLE at import."""
         # NULL can be compared with anything
         if self == DataType.NULL or other == DataType.NULL:
             return True
@@ -65,11 +97,8 @@ class DataType(Enum):
         # Strings and JSON are not comparable with numbers or temporals
         return False
 
-    def coerce_to(self, other: "DataType") -> "DataType":
-        """Determine the result type when coercing this type to another.
-
-        Used for type promotion in expressions like INTEGER + FLOAT.
-        """
+    def _coerce(self, other: "DataType") -> "DataType":
+        """Coercion rules, tabulated into _COERCIONS at import."""
         # NULL coerces to any type
         if self == DataType.NULL:
             return other
@@ -105,6 +134,173 @@ class DataType(Enum):
         return DataType.STRING
 
 
+# Each member's position, indexing the tables below. Enum.__hash__ is a Python
+# function, so indexing tuples by a plain int is much cheaper than keying a
+# dict by members.
+for _index, _member in enumerate(DataType):
+    _member._index = _index
+del _index, _member
+
+# Every pair of types is looked up instead of re-running the rules (schema
+# inference coerces once per value): _COERCIONS[a][b] is the coerced type, and
+# bit b of _COMPARABLE[a] is set when a and b are comparable
+_COERCIONS = tuple(tuple(a._coerce(b) for b in DataType) for a in DataType)
+_COMPARABLE = tuple(sum(1 << b._index for b in DataType if a._comparable(b)) for a in DataType)
+
+# Members bound as module globals for the inference hot paths below, where
+# attribute access through the Enum metaclass costs more than the check itself
+_NULL = DataType.NULL
+_BOOL = DataType.BOOLEAN
+_INT = DataType.INTEGER
+_FLOAT = DataType.FLOAT
+_DEC = DataType.DECIMAL
+_DT = DataType.DATETIME
+_DATE = DataType.DATE
+_TIME = DataType.TIME
+_JSON = DataType.JSON
+_STR = DataType.STRING
+
+
+# Formats parse_datetime, parse_date and parse_time accept, in priority order
+_DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",  # ISO 8601: 2024-01-15T10:30:00
+    "%Y-%m-%dT%H:%M:%S.%f",  # ISO with microseconds
+    "%Y-%m-%d %H:%M:%S",  # SQL format: 2024-01-15 10:30:00
+    "%Y-%m-%d %H:%M:%S.%f",  # SQL with microseconds
+    "%d/%m/%Y %H:%M:%S",  # EU format: 15/01/2024 10:30:00
+    "%m/%d/%Y %H:%M:%S",  # US format: 01/15/2024 10:30:00
+    "%Y%m%d%H%M%S",  # Compact: 20240115103000
+    "%Y-%m-%d %H:%M",  # Without seconds
+    "%d/%m/%Y %H:%M",  # EU without seconds
+    "%m/%d/%Y %H:%M",  # US without seconds
+)
+_DATE_FORMATS = (
+    "%Y-%m-%d",  # ISO: 2024-01-15
+    "%d/%m/%Y",  # EU: 15/01/2024
+    "%m/%d/%Y",  # US: 01/15/2024
+    "%Y%m%d",  # Compact: 20240115
+    "%d-%m-%Y",  # EU with dashes: 15-01-2024
+    "%m-%d-%Y",  # US with dashes: 01-15-2024
+)
+_TIME_FORMATS = (
+    "%H:%M:%S",  # 24-hour: 14:30:00
+    "%H:%M:%S.%f",  # With microseconds: 14:30:00.123456
+    "%H:%M",  # Without seconds: 14:30
+)
+_TIME_FORMATS_12H = (
+    "%I:%M:%S %p",  # 12-hour with seconds: 02:30:00 PM
+    "%I:%M %p",  # 12-hour: 02:30 PM
+)
+
+# Digits and whitespace, which the directives and spaces of a format match
+_SIGNATURE_RE = re.compile(r"[\d\s]+")
+
+
+def _signature(value: str) -> str:
+    """Separators of a date/time string, which strptime matches literally
+
+    A format can only match strings with the same signature (strptime
+    ignores case), so formats are looked up by it instead of tried in turn.
+    """
+    return _SIGNATURE_RE.sub("", value).upper()
+
+
+def _formats_by_signature(formats: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    """Group formats by the signature of the strings they match, keeping their order"""
+    grouped: dict[str, list[str]] = {}
+    for fmt in formats:
+        # Directives match digits, so they drop out like the digits of a value
+        grouped.setdefault(_signature(re.sub("%.", "0", fmt)), []).append(fmt)
+    return {signature: tuple(group) for signature, group in grouped.items()}
+
+
+# The patterns strptime matches the numeric directives above with, named
+# after the datetime field each sets
+_DIRECTIVE_PATTERNS = {
+    "Y": r"(?P<year>\d\d\d\d)",
+    "m": r"(?P<month>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<day>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<hour>2[0-3]|[0-1]\d|\d)",
+    "M": r"(?P<minute>[0-5]\d|\d)",
+    "S": r"(?P<second>6[0-1]|[0-5]\d|\d)",
+    "f": r"(?P<microsecond>[0-9]{1,6})",
+}
+
+
+def _format_parser(fmt: str) -> Callable[[str], datetime | None]:
+    """Build a parser equivalent to datetime.strptime(value, fmt)
+
+    Numeric formats are compiled once into the regex strptime would use, and
+    matches are turned into a datetime directly, skipping strptime's per-call
+    overhead and the exception it raises for every format that doesn't match.
+    Formats with other directives (AM/PM markers are locale-dependent) are
+    left to strptime.
+
+    Returns:
+        Function returning the parsed datetime, or None if the value doesn't match
+    """
+    parts = re.split(r"(%.)", fmt)
+    if not all(part[1] in _DIRECTIVE_PATTERNS for part in parts[1::2]):
+
+        def parse_with_strptime(value: str) -> datetime | None:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                return None
+
+        return parse_with_strptime
+
+    # Like strptime: literals match exactly (ignoring case), and whitespace
+    # matches any run of whitespace
+    pattern = re.compile(
+        "".join(
+            _DIRECTIVE_PATTERNS[part[1]]
+            if i % 2
+            else r"\s+".join(map(re.escape, re.split(r"\s+", part)))
+            for i, part in enumerate(parts)
+        ),
+        re.IGNORECASE,
+    )
+
+    def parse(value: str) -> datetime | None:
+        # strptime takes the first match, then rejects any unconverted data
+        match = pattern.match(value)
+        if match is None or match.end() != len(value):
+            return None
+
+        fields = match.groupdict()
+        microsecond = fields.pop("microsecond", None)
+        try:
+            return datetime(
+                int(fields.pop("year", 1900)),
+                int(fields.pop("month", 1)),
+                int(fields.pop("day", 1)),
+                microsecond=int(microsecond.ljust(6, "0")) if microsecond else 0,
+                **{field: int(number) for field, number in fields.items()},
+            )
+        except ValueError:
+            # e.g. 31/02/2024
+            return None
+
+    return parse
+
+
+def _parsers_by_signature(
+    formats: tuple[str, ...],
+) -> dict[str, tuple[Callable[[str], datetime | None], ...]]:
+    """Group ready parsers for formats by signature, keeping their order"""
+    return {
+        signature: tuple(map(_format_parser, group))
+        for signature, group in _formats_by_signature(formats).items()
+    }
+
+
+_DATETIME_PARSERS_BY_SIGNATURE = _parsers_by_signature(_DATETIME_FORMATS)
+_DATE_PARSERS_BY_SIGNATURE = _parsers_by_signature(_DATE_FORMATS)
+_TIME_PARSERS_BY_SIGNATURE = _parsers_by_signature(_TIME_FORMATS)
+_TIME_PARSERS_12H = tuple(map(_format_parser, _TIME_FORMATS_12H))
+
+
 def parse_datetime(value: str) -> datetime | None:
     """Try to parse datetime from string using multiple formats.
 
@@ -119,30 +315,17 @@ def parse_datetime(value: str) -> datetime | None:
 
     value = value.strip()
 
-    # Try ISO 8601 with timezone (handle Z and +HH:MM)
-    if "T" in value:
-        # Remove timezone suffix for basic parsing
-        base_value = value.replace("Z", "").split("+")[0].split("-")[0:3]
-        base_value = "-".join(base_value) if len(base_value) == 3 else value.replace("Z", "")
-
-    formats = [
-        "%Y-%m-%dT%H:%M:%S",  # ISO 8601: 2024-01-15T10:30:00
-        "%Y-%m-%dT%H:%M:%S.%f",  # ISO with microseconds
-        "%Y-%m-%d %H:%M:%S",  # SQL format: 2024-01-15 10:30:00
-        "%Y-%m-%d %H:%M:%S.%f",  # SQL with microseconds
-        "%d/%m/%Y %H:%M:%S",  # EU format: 15/01/2024 10:30:00
-        "%m/%d/%Y %H:%M:%S",  # US format: 01/15/2024 10:30:00
-        "%Y%m%d%H%M%S",  # Compact: 20240115103000
-        "%Y-%m-%d %H:%M",  # Without seconds
-        "%d/%m/%Y %H:%M",  # EU without seconds
-        "%m/%d/%Y %H:%M",  # US without seconds
-    ]
-
-    for fmt in formats:
+    # Fast path for ISO 8601 / SQL timestamps
+    if _ISO_DATETIME_RE.fullmatch(value):
         try:
-            return datetime.strptime(value, fmt)
+            return datetime.fromisoformat(value)
         except ValueError:
-            continue
+            pass
+
+    for parse in _DATETIME_PARSERS_BY_SIGNATURE.get(_signature(value), ()):
+        parsed = parse(value)
+        if parsed is not None:
+            return parsed
 
     return None
 
@@ -161,20 +344,17 @@ def parse_date(value: str) -> date | None:
 
     value = value.strip()
 
-    formats = [
-        "%Y-%m-%d",  # ISO: 2024-01-15
-        "%d/%m/%Y",  # EU: 15/01/2024
-        "%m/%d/%Y",  # US: 01/15/2024
-        "%Y%m%d",  # Compact: 20240115
-        "%d-%m-%Y",  # EU with dashes: 15-01-2024
-        "%m-%d-%Y",  # US with dashes: 01-15-2024
-    ]
-
-    for fmt in formats:
+    # Fast path for ISO dates
+    if _ISO_DATE_RE.fullmatch(value):
         try:
-            return datetime.strptime(value, fmt).date()
+            return date.fromisoformat(value)
         except ValueError:
-            continue
+            pass
+
+    for parse in _DATE_PARSERS_BY_SIGNATURE.get(_signature(value), ()):
+        parsed = parse(value)
+        if parsed is not None:
+            return parsed.date()
 
     return None
 
@@ -193,23 +373,26 @@ def parse_time(value: str) -> time | None:
 
     value = value.strip()
 
-    formats = [
-        "%H:%M:%S",  # 24-hour: 14:30:00
-        "%H:%M:%S.%f",  # With microseconds: 14:30:00.123456
-        "%H:%M",  # Without seconds: 14:30
-        "%I:%M:%S %p",  # 12-hour with seconds: 02:30:00 PM
-        "%I:%M %p",  # 12-hour: 02:30 PM
-    ]
-
-    for fmt in formats:
+    # Fast path for 24-hour ISO times
+    if _ISO_TIME_RE.fullmatch(value):
         try:
-            return datetime.strptime(value, fmt).time()
+            return time.fromisoformat(value)
         except ValueError:
-            continue
+            pass
+
+    # 12-hour times end in a locale-dependent AM/PM marker
+    for parse in _TIME_PARSERS_BY_SIGNATURE.get(_signature(value), _TIME_PARSERS_12H):
+        parsed = parse(value)
+        if parsed is not None:
+            return parsed.time()
 
     return None
 
 
+# Shared decoder for is_json_string
+_JSON_DECODER = json.JSONDecoder()
+
+
 def is_json_string(value: str) -> bool:
     """Check if a string contains valid JSON (object or array).
 
@@ -224,18 +407,145 @@ def is_json_string(value: str) -> bool:
 
     value = value.strip()
 
-    # Must start with { or [
-    if not (value.startswith("{") or value.startswith("[")):
+    # Must start with { or [ and end with } or ]
+    if not value or value[0] not in "{[" or value[-1] not in "}]":
         return False
 
-    # Try to parse as JSON
+    # Try to parse as JSON (the value is already stripped, so decode it as-is)
     try:
-        parsed = json.loads(value)
-        # Must be dict or list (not just a string, number, etc.)
-        return isinstance(parsed, (dict, list))
+        parsed, end = _JSON_DECODER.raw_decode(value)
     except (json.JSONDecodeError, ValueError):
         return False
 
+    # Must be the whole string, and dict or list (not just a string, number, etc.)
+    return end == len(value) and isinstance(parsed, (dict, list))
+
+
+# Type of a value parsed from a string -> its DataType
+_VALUE_TYPES = {
+    int: _INT,
+    float: _FLOAT,
+    Decimal: _DEC,
+    datetime: _DT,
+    date: _DATE,
+    time: _TIME,
+}
+
+# Python types infer_type() recognises; anything else falls back to STRING
+_INFERRED_VALUE_TYPES = (bool, str, *_VALUE_TYPES)
+
+
+def _parse_number(value: str) -> int | float | Decimal | None:
+    """Parse a stripped, non-empty string as an integer, float or decimal.
+
+    Plain numerals are classified by one regex match, so no exception is
+    raised for them; only strings that int() or float() could still accept
+    are passed to those.
+
+    Args:
+        value: Stripped, non-empty string
+
+    Returns:
+        int, float, or Decimal (more than 6 significant decimal places),
+        or None if the string isn't a number
+    """
+    match = _NUMBER_RE.fullmatch(value)
+    if match is not None and match.lastgroup == "int":
+        try:
+            return int(value)
+        except ValueError:
+            # Longer than int()'s digit limit; float() still accepts it
+            pass
+
+    if match is None:
+        # Anything else int()/float() accept ends in a digit or "." or is inf/nan
+        last = value[-1]
+        if not (last.isdigit() or last == "." or value.lstrip("+-").lower() in _FLOAT_WORDS):
+            return None
+
+        try:
+            return int(value)
+        except ValueError:
+            pass
+
+    try:
+        # Check precision - more than 6 decimal places (ignoring trailing
+        # zeros) uses DECIMAL. Only long fractions need the zeros stripped.
+        dot = value.find(".")
+        if dot >= 0 and len(value) - dot > 7 and len(value.rstrip("0")) - dot > 7:
+            return Decimal(value)
+        return float(value)
+    except (ValueError, InvalidOperation):
+        return None
+
+
+def _parse_temporal(value: str) -> datetime | date | time | None:
+    """Parse a stripped, non-empty string as a datetime, date or time.
+
+    Every supported format starts with a digit, so other strings are
+    rejected without trying any of them.
+
+    Args:
+        value: Stripped, non-empty string
+
+    Returns:
+        datetime, date, or time object, or None if no format matches
+    """
+    if not value[0].isdigit():
+        return None
+
+    # DateTime (check before Date to catch timestamps)
+    dt = parse_datetime(value)
+    if dt is not None:
+        return dt
+
+    d = parse_date(value)
+    if d is not None:
+        return d
+
+    return parse_time(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _infer_string_type(value: str) -> DataType:
+    """Infer the data type of a string value.
+
+    Cached, since columns tend to repeat values (status codes, countries,
+    dates within a day), and each miss runs the number/date parsers.
+
+    Args:
+        value: String to infer type from
+
+    Returns:
+        Inferred DataType
+    """
+    value_stripped = value.strip()
+
+    # Empty string → NULL
+    if not value_stripped:
+        return _NULL
+
+    # Boolean literals
+    if value_stripped.lower() in ("true", "false"):
+        return _BOOL
+
+    # JSON (must check early - before numeric)
+    if is_json_string(value_stripped):
+        return _JSON
+
+    # Integer, Float or Decimal
+    number = _parse_number(value_stripped)
+    if number is not None:
+        return _VALUE_TYPES[type(number)]
+
+    # DateTime, Date or Time
+    temporal = _parse_temporal(value_stripped)
+    if temporal is not None:
+        return _VALUE_TYPES[type(temporal)]
+
+    # Default to STRING
+    return _STR
+
 
 def infer_type(value: Any) -> DataType:
     """Infer the data type from a Python value.
@@ -260,89 +570,36 @@ def infer_type(value: Any) -> DataType:
     """
     # 1. NULL check
     if value is None:
-        return DataType.NULL
+        return _NULL
 
     # 2. Python type checks (non-string)
     if isinstance(value, bool):
-        return DataType.BOOLEAN
+        return _BOOL
 
     if isinstance(value, int):
-        return DataType.INTEGER
+        return _INT
 
     if isinstance(value, float):
-        return DataType.FLOAT
+        return _FLOAT
 
     if isinstance(value, Decimal):
-        return DataType.DECIMAL
+        return _DEC
 
     if isinstance(value, datetime):
-        return DataType.DATETIME
+        return _DT
 
     if isinstance(value, date):
-        return DataType.DATE
+        return _DATE
 
     if isinstance(value, time):
-        return DataType.TIME
+        return _TIME
 
     # 3. String value inference
     if isinstance(value, str):
-        value_stripped = value.strip()
-
-        # Empty string → NULL
-        if not value_stripped:
-            return DataType.NULL
-
-        # Boolean literals
-        if value_stripped.lower() in ("true", "false"):
-            return DataType.BOOLEAN
-
-        # JSON (must check early - before numeric)
-        if is_json_string(value_stripped):
-            return DataType.JSON
-
-        # Integer
-        try:
-            int(value_stripped)
-            return DataType.INTEGER
-        except ValueError:
-            pass
-
-        # Float or Decimal
-        try:
-            # Check if it has decimal point
-            if "." in value_stripped:
-                # Check precision - if more than 6 decimal places, use DECIMAL
-                decimal_part = value_stripped.split(".")[1]
-                # Remove trailing zeros for check
-                significant_decimals = decimal_part.rstrip("0")
-                if len(significant_decimals) > 6:
-                    Decimal(value_stripped)  # Validate
-                    return DataType.DECIMAL
-            float(value_stripped)
-            return DataType.FLOAT
-        except (ValueError, InvalidOperation):
-            pass
-
-        # DateTime (check before Date to catch timestamps)
-        dt = parse_datetime(value_stripped)
-        if dt is not None:
-            return DataType.DATETIME
-
-        # Date
-        d = parse_date(value_stripped)
-        if d is not None:
-            return DataType.DATE
-
-        # Time
-        t = parse_time(value_stripped)
-        if t is not None:
-            return DataType.TIME
-
-        # Default to STRING
-        return DataType.STRING
+        return _infer_string_type(value)
 
     # 4. Fallback for unknown types
-    return DataType.STRING
+    return _STR
 
 
 def infer_type_from_string(value: str) -> Any:
@@ -383,37 +640,15 @@ def infer_type_from_string(value: str) -> Any:
     if is_json_string(value_stripped):
         return value_stripped
 
-    # Integer
-    try:
-        return int(value_stripped)
-    except ValueError:
-        pass
+    # Integer, Float or Decimal
+    number = _parse_number(value_stripped)
+    if number is not None:
+        return number
 
-    # Float or Decimal
-    try:
-        if "." in value_stripped:
-            decimal_part = value_stripped.split(".")[1]
-            significant_decimals = decimal_part.rstrip("0")
-            if len(significant_decimals) > 6:
-                return Decimal(value_stripped)
-        return float(value_stripped)
-    except (ValueError, InvalidOperation):
-        pass
-
-    # DateTime
-    dt = parse_datetime(value_stripped)
-    if dt is not None:
-        return dt
-
-    # Date
-    d = parse_date(value_stripped)
-    if d is not None:
-        return d
-
-    # Time
-    t = parse_time(value_stripped)
-    if t is not None:
-        return t
+    # DateTime, Date or Time
+    temporal = _parse_temporal(value_stripped)
+    if temporal is not None:
+        return temporal
 
     # Return as string
     return value
@@ -438,22 +673,40 @@ def infer_common_type(values: list[Any]) -> DataType:
         >>> infer_common_type([1, "hello", 3])
         DataType.STRING
     """
-    if not values:
-        return DataType.NULL
-
-    # Filter out None values for type inference
-    non_null_values = [v for v in values if v is not None]
-
-    if not non_null_values:
-        return DataType.NULL
+    # Values of one non-string Python type (typed reader output) all infer
+    # alike, so the column is settled without inferring each value
+    value_types = set(map(type, values))
+    value_types.discard(type(None))
+
+    # No values, or only None
+    if not value_types:
+        return _NULL
+
+    if len(value_types) == 1 and not any(issubclass(t, str) for t in value_types):
+        return infer_type(next(v for v in values if v is not None))
+
+    # Other Python types (lists and dicts from nested JSON) infer as STRING,
+    # which nothing widens, so mixed columns holding one need no inference
+    if not all(issubclass(t, _INFERRED_VALUE_TYPES) for t in value_types):
+        return _STR
+
+    # Fold the types of the non-None values. A non-string value of the same
+    # Python type as the last one folded infers the same DataType, and folding
+    # a type in again changes nothing, so runs of such values are skipped
+    common_type = None
+    last_type = None
+    for value in values:
+        value_type = type(value)
+        if value is None or (value_type is last_type and not issubclass(value_type, str)):
+            continue
+        last_type = value_type
 
-    # Infer type of first value
-    common_type = infer_type(non_null_values[0])
+        inferred = infer_type(value)
+        common_type = inferred if common_type is None else common_type.coerce_to(inferred)
 
-    # Check remaining values and coerce as needed
-    for value in non_null_values[1:]:
-        value_type = infer_type(value)
-        common_type = common_type.coerce_to(value_type)
+        # STRING absorbs every other type, so the rest can't change it
+        if common_type is _STR:
+            break
 
     return common_type
 
@@ -539,14 +792,12 @@ class Schema:
         if not rows:
             return Schema({})
 
-        # Get all column names from first row
-        column_names = list(rows[0].keys())
-
-        # Collect values for each column
-        columns = {}
-        for col_name in column_names:
-            col_values = [row.get(col_name) for row in rows if col_name in row]
-            columns[col_name] = infer_common_type(col_values)
+        # Collect each of the first row's columns with a C-level map; rows
+        # missing the column give None, which infer_common_type ignores
+        columns = {
+            col_name: infer_common_type(list(map(dict.get, rows, repeat(col_name))))
+            for col_name in rows[0]
+        }
 
         return Schema(columns)
 
@@ -5,9 +5,12 @@ The Volcano model uses pull-based execution where each operator
 pulls data from its child operator(s) on demand.
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import Any, Optional
 
+# Rows converted from an Arrow batch at a time
+ROWS_PER_SLICE = 1024
+
 
 class Operator:
     """
@@ -45,6 +48,37 @@ class Operator:
         """
         raise NotImplementedError(f"{self.__class__.__name__} must implement __iter__()")
 
+    def batches(self) -> Iterator[Any] | None:
+        """
+        Yield results as Arrow tables, for operators that can work columnar
+
+        Returns None (the default) when the operator only produces rows, so
+        parents fall back to iterating it row by row.
+
+        Returns:
+            Iterator over pyarrow Tables or RecordBatches, or None
+        """
+        return None
+
     def __repr__(self) -> str:
         """String representation for debugging"""
         return f"{self.__class__.__name__}()"
+
+
+def batch_rows(batches: Iterable[Any]) -> Iterator[dict[str, Any]]:
+    """
+    Yield the rows of Arrow batches as dictionaries
+
+    Rows are built a slice at a time, so large batches (e.g. whole Parquet
+    row groups) are never converted at once and consumers that stop early
+    (LIMIT) don't pay for rows they never see.
+
+    Args:
+        batches: pyarrow Tables or RecordBatches
+
+    Yields:
+        Rows as dictionaries
+    """
+    for batch in batches:
+        for offset in range(0, batch.num_rows, ROWS_PER_SLICE):
+            yield from batch.slice(offset, ROWS_PER_SLICE).to_pylist()
@@ -7,8 +7,14 @@ Evaluates conditions and only yields rows that match.
 from collections.abc import Iterator
 from typing import Any
 
-from sqlstream.operators.base import Operator
+from sqlstream.operators.base import Operator, batch_rows
 from sqlstream.sql.ast_nodes import Condition
+from sqlstream.utils.predicates import (
+    Predicate,
+    arrow_mask,
+    compile_condition,
+    compile_conditions,
+)
 
 
 class Filter(Operator):
@@ -29,19 +35,73 @@ class Filter(Operator):
         """
         super().__init__(child)
         self.conditions = conditions
+        self._predicate = compile_conditions(conditions)
+        # Predicates for the conditions Arrow can't evaluate on a batch, keyed
+        # by which conditions those are (they depend only on the batch schema)
+        self._remaining_predicates: dict[tuple[int, ...], Predicate] = {}
 
     def __iter__(self) -> Iterator[dict[str, Any]]:
         """
         Yield only rows that match all conditions
 
-        For each row from child:
-        1. Evaluate all conditions
-        2. If all are True, yield the row
-        3. Otherwise, skip it
+        When the child produces Arrow batches, rows come from the vectorized
+        batch filter; conditions Arrow can't evaluate are checked on the rows
+        as they are converted, so each row is converted once. Otherwise all
+        conditions are fused into one compiled predicate, run through the
+        built-in filter, so each row costs a single call.
         """
-        for row in self.child:
-            if self._matches(row):
-                yield row
+        batches = self.child.batches()
+        if batches is not None:
+            for batch, matches in self._masked_batches(batches):
+                rows = batch_rows((batch,))
+                yield from rows if matches is None else filter(matches, rows)
+            return
+
+        yield from filter(self._predicate, self.child)
+
+    def batches(self) -> Iterator[Any] | None:
+        """
+        Filter the child's Arrow batches with vectorized masks
+
+        Returns:
+            Iterator over filtered batches, or None if the child only yields rows
+        """
+        batches = self.child.batches()
+        if batches is None:
+            return None
+        return self._filter_batches(batches)
+
+    def _filter_batches(self, batches: Iterator[Any]) -> Iterator[Any]:
+        """Apply the conditions to each batch, row by row only where Arrow can't"""
+        import pyarrow as pa
+
+        for batch, matches in self._masked_batches(batches):
+            if matches is not None:
+                keep = [matches(row) for row in batch.to_pylist()]
+                batch = batch.filter(pa.array(keep, type=pa.bool_()))
+            yield batch
+
+    def _masked_batches(self, batches: Iterator[Any]) -> Iterator[tuple[Any, Predicate | None]]:
+        """
+        Apply the conditions Arrow can evaluate to each batch
+
+        Yields:
+            Tuples of (masked batch, predicate for the conditions left to
+            check row by row, or None if there are none)
+        """
+        for batch in batches:
+            mask, remaining = arrow_mask(batch, self.conditions)
+            if mask is not None:
+                batch = batch.filter(mask)
+
+            matches = None
+            if remaining:
+                key = tuple(map(id, remaining))
+                matches = self._remaining_predicates.get(key)
+                if matches is None:
+                    matches = self._remaining_predicates[key] = compile_conditions(remaining)
+
+            yield batch, matches
 
     def _matches(self, row: dict[str, Any]) -> bool:
         """
@@ -53,10 +113,7 @@ class Filter(Operator):
         Returns:
             True if all conditions are satisfied (AND logic)
         """
-        for condition in self.conditions:
-            if not self._evaluate_condition(row, condition):
-                return False
-        return True
+        return self._predicate(row)
 
     def _evaluate_condition(self, row: dict[str, Any], condition: Condition) -> bool:
         """
@@ -69,42 +126,7 @@ class Filter(Operator):
         Returns:
             True if condition is satisfied
         """
-        # Get column value
-        if condition.column not in row:
-            return False
-
-        value = row[condition.column]
-
-        # Handle NULL values
-        if value is None:
-            return False
-
-        # Get expected value
-        expected = condition.value
-
-        # Evaluate operator
-        op = condition.operator
-
-        try:
-            if op == "=":
-                return value == expected
-            elif op == ">":
-                return value > expected
-            elif op == "<":
-                return value < expected
-            elif op == ">=":
-                return value >= expected
-            elif op == "<=":
-                return value <= expected
-            elif op == "!=":
-                return value != expected
-            else:
-                # Unknown operator - default to True to avoid filtering
-                return True
-
-        except TypeError:
-            # Type mismatch (e.g., comparing string to int)
-            return False
+        return compile_condition(condition)(row)
 
     def __repr__(self) -> str:
         cond_str = " AND ".join(str(c) for c in self.conditions)
@@ -5,13 +5,18 @@ Performs hash-based aggregation with GROUP BY support.
 Groups rows by specified columns and computes aggregate functions.
 """
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from functools import reduce
+from operator import add
 from typing import Any
 
 from sqlstream.operators.base import Operator
 from sqlstream.sql.ast_nodes import AggregateFunction
 from sqlstream.utils.aggregates import create_aggregator
 
+# Column added to Arrow tables to record the row each group first appears at
+_FIRST_ROW = "__sqlstream_first_row__"
+
 
 class GroupByOperator(Operator):
     """
@@ -47,40 +52,233 @@ class GroupByOperator(Operator):
         self.group_by_columns = group_by_columns
         self.aggregates = aggregates
         self.select_columns = select_columns
+        self._group_key = _compile_group_key(group_by_columns)
+        self._update_group = _compile_group_update(aggregates)
 
     def __iter__(self) -> Iterator[dict[str, Any]]:
         """
         Execute GROUP BY aggregation
 
+        Aggregates the child's Arrow batches with Arrow's hash aggregation
+        when the child produces them, otherwise aggregates row by row.
+
         Yields:
             One row per group with group columns and aggregated values
         """
+        batches = self.child.batches()
+        if batches is not None:
+            yield from self._aggregate_batches(batches)
+        else:
+            yield from self._aggregate_rows(self.child)
+
+    def _aggregate_rows(self, rows: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """
+        Hash-aggregate rows one at a time
+
+        Args:
+            rows: Input rows
+
+        Yields:
+            One row per group
+        """
         # Hash map: group_key -> aggregators
         groups: dict[tuple, list] = {}
 
         # Scan all input rows and build groups
-        for row in self.child:
+        group_key_of = self._group_key
+        update_group = self._update_group
+        for row in rows:
             # Extract group key
-            group_key = self._extract_group_key(row)
+            group_key = group_key_of(row)
 
             # Initialize aggregators for new group
-            if group_key not in groups:
-                groups[group_key] = self._create_aggregators()
+            try:
+                aggregators = groups.get(group_key)
+            except TypeError:
+                # Unhashable values (e.g., lists, dicts) need converting
+                group_key = self._extract_group_key(row)
+                aggregators = groups.get(group_key)
+            if aggregators is None:
+                aggregators = groups[group_key] = self._create_aggregators()
 
             # Update aggregators
-            aggregators = groups[group_key]
-            for i, agg_func in enumerate(self.aggregates):
-                value = row.get(agg_func.column) if agg_func.column != "*" else None
-                aggregators[i].update(value)
+            update_group(row, aggregators)
 
         # Yield one row per group
         for group_key, aggregators in groups.items():
             row = self._build_output_row(group_key, aggregators)
             yield row
 
+    def _aggregate_batches(self, batches: Iterator[Any]) -> Iterator[dict[str, Any]]:
+        """
+        Aggregate Arrow batches with Arrow's vectorized hash aggregation
+
+        Only used where Arrow's results are exactly what the row-by-row
+        aggregators give (see _arrow_aggregations); otherwise the batches'
+        rows are aggregated one at a time.
+
+        Args:
+            batches: pyarrow Tables or RecordBatches
+
+        Yields:
+            One row per group, in order of first appearance
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        tables = [
+            batch if isinstance(batch, pa.Table) else pa.Table.from_batches([batch])
+            for batch in batches
+        ]
+        if not tables:
+            return
+        table = pa.concat_tables(tables)
+
+        aggregations = self._arrow_aggregations(table)
+        if aggregations is None:
+            yield from self._aggregate_rows(
+                row for batch in table.to_batches() for row in batch.to_pylist()
+            )
+            return
+
+        # Arrow doesn't keep groups in order of first appearance, so track
+        # each group's first row and sort by it
+        table = table.append_column(_FIRST_ROW, pc.cumulative_sum(pa.repeat(1, table.num_rows)))
+        try:
+            # Threads could collect a group's values out of row order
+            grouped = table.group_by(self.group_by_columns, use_threads=False)
+        except TypeError:
+            # pyarrow < 12 always groups on one thread
+            grouped = table.group_by(self.group_by_columns)
+        result = grouped.aggregate([*aggregations.values(), (_FIRST_ROW, "min")])
+
+        # Arrow versions differ in whether the keys come before or after the
+        # aggregates, which are otherwise in the order requested
+        key_count = len(self.group_by_columns)
+        if result.column_names[:key_count] == self.group_by_columns:
+            key_columns, agg_columns = result.columns[:key_count], result.columns[key_count:]
+        else:
+            key_columns, agg_columns = result.columns[-key_count:], result.columns[:-key_count]
+        order = pc.sort_indices(agg_columns.pop())
+        key_columns = [column.take(order) for column in key_columns]
+        agg_values = {}
+        for name, column in zip(aggregations, agg_columns, strict=True):
+            column = column.take(order)
+            if aggregations[name][1] == "list":
+                agg_values[name] = _sequential_sums(column)
+            else:
+                agg_values[name] = column.to_pylist()
+
+        for i, group_key in enumerate(
+            zip(*(column.to_pylist() for column in key_columns), strict=True)
+        ):
+            row = dict(zip(self.group_by_columns, group_key, strict=True))
+            for agg_func in self.aggregates:
+                row[self._output_name(agg_func)] = self._arrow_result(agg_func, agg_values, i)
+            yield row
+
+    def _arrow_aggregations(self, table: Any) -> dict[tuple[str, str], tuple] | None:
+        """
+        Map the aggregates to Arrow hash aggregations that match the row path exactly
+
+        Keys must be integer, string, boolean, date, time or timestamp
+        columns (floats group NaNs differently). SUM and AVG need integer
+        columns whose sum can't overflow int64, or float columns, whose
+        values are collected per group and summed in order (Arrow's pairwise
+        float sums round differently). MIN/MAX need integer, string, boolean,
+        date, time or timestamp columns.
+
+        Args:
+            table: Arrow table being aggregated
+
+        Returns:
+            Mapping of (column, name) to the (column, function, options)
+            aggregation computing it, each needed once, or None if any
+            aggregate must run row by row
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        schema = table.schema
+
+        def column_type(name: str) -> Any:
+            index = schema.get_field_index(name)
+            return schema.field(index).type if index >= 0 else None
+
+        def is_exact(arrow_type: Any) -> bool:
+            return arrow_type is not None and (
+                pa.types.is_integer(arrow_type)
+                or pa.types.is_string(arrow_type)
+                or pa.types.is_large_string(arrow_type)
+                or pa.types.is_boolean(arrow_type)
+                or pa.types.is_date(arrow_type)
+                or pa.types.is_time(arrow_type)
+                or pa.types.is_timestamp(arrow_type)
+            )
+
+        if not all(is_exact(column_type(col)) for col in self.group_by_columns):
+            return None
+
+        count_all = pc.CountOptions(mode="all")
+        count_valid = pc.CountOptions(mode="only_valid")
+        aggregations: dict[tuple[str, str], tuple] = {}
+        for agg_func in self.aggregates:
+            function = agg_func.function.upper()
+            column = agg_func.column
+
+            if function == "COUNT" and column == "*":
+                key = self.group_by_columns[0]
+                aggregations[key, "count_all"] = (key, "count", count_all)
+                continue
+
+            arrow_type = column_type(column)
+            if arrow_type is None:
+                return None
+
+            if function == "COUNT":
+                aggregations[column, "count"] = (column, "count", count_valid)
+            elif function in ("SUM", "AVG"):
+                if pa.types.is_float32(arrow_type) or pa.types.is_float64(arrow_type):
+                    aggregations[column, "sum"] = (column, "list", None)
+                elif pa.types.is_integer(arrow_type) and self._sum_fits(table[column]):
+                    aggregations[column, "sum"] = (column, "sum", None)
+                else:
+                    return None
+                if function == "AVG":
+                    aggregations[column, "count"] = (column, "count", count_valid)
+            elif function in ("MIN", "MAX") and is_exact(arrow_type):
+                aggregations[column, function.lower()] = (column, function.lower(), None)
+            else:
+                return None
+
+        return aggregations
+
+    @staticmethod
+    def _sum_fits(column: Any) -> bool:
+        """Check an integer column's sum is bounded within int64, as Arrow sums in int64"""
+        import pyarrow.compute as pc
+
+        bounds = pc.min_max(column)
+        largest = max(abs(bounds["min"].as_py() or 0), abs(bounds["max"].as_py() or 0))
+        return largest * len(column) <= 2**63 - 1
+
+    def _arrow_result(self, agg_func: AggregateFunction, agg_values: dict, group: int) -> Any:
+        """Read one group's value for an aggregate out of the Arrow results"""
+        function = agg_func.function.upper()
+        column = agg_func.column
+
+        if function == "COUNT" and column == "*":
+            return agg_values[self.group_by_columns[0], "count_all"][group]
+        if function == "COUNT":
+            return agg_values[column, "count"][group]
+        if function == "AVG":
+            count = agg_values[column, "count"][group]
+            return agg_values[column, "sum"][group] / count if count else None
+        return agg_values[column, function.lower()][group]
+
     def _extract_group_key(self, row: dict[str, Any]) -> tuple:
         """
-        Extract group key from row
+        Extract group key from row, converting unhashable values
 
         Args:
             row: Input row
@@ -131,16 +329,17 @@ class GroupByOperator(Operator):
 
         # Add aggregated columns
         for i, agg_func in enumerate(self.aggregates):
-            # Use alias if provided, otherwise generate name
-            col_name = (
-                agg_func.alias
-                if agg_func.alias
-                else f"{agg_func.function.lower()}_{agg_func.column}"
-            )
-            row[col_name] = aggregators[i].result()
+            row[self._output_name(agg_func)] = aggregators[i].result()
 
         return row
 
+    @staticmethod
+    def _output_name(agg_func: AggregateFunction) -> str:
+        """Output column name for an aggregate: its alias, otherwise e.g. sum_amount"""
+        return (
+            agg_func.alias if agg_func.alias else f"{agg_func.function.lower()}_{agg_func.column}"
+        )
+
     def explain(self, indent: int = 0) -> list[str]:
         """Generate execution plan explanation"""
         lines = [" " * indent + f"GroupBy(keys={self.group_by_columns})"]
@@ -153,3 +352,79 @@ class GroupByOperator(Operator):
         lines.extend(self.child.explain(indent + 2))
 
         return lines
+
+
+def _compile_group_key(group_by_columns: list[str]) -> Callable[[dict[str, Any]], tuple]:
+    """
+    Build a function extracting a row's group key
+
+    The key tuple is generated inline, one lookup per column, so extracting
+    it costs a single call. Values are taken as they are; a key holding an
+    unhashable value is rebuilt by GroupByOperator._extract_group_key().
+
+    Args:
+        group_by_columns: Columns to group by
+
+    Returns:
+        Function mapping a row to its tuple of group column values
+    """
+    namespace: dict[str, Any] = {f"c{i}": column for i, column in enumerate(group_by_columns)}
+    values = "".join(f"get(c{i}), " for i in range(len(group_by_columns)))
+    source = f"def group_key(row):\n    get = row.get\n    return ({values})"
+    exec(compile(source, "<group by>", "exec"), namespace)
+    return namespace["group_key"]
+
+
+def _compile_group_update(
+    aggregates: list[AggregateFunction],
+) -> Callable[[dict[str, Any], list], None]:
+    """
+    Build a function feeding a row to a group's aggregators
+
+    The updates are generated inline, one per aggregate, so a row costs a
+    single call rather than a loop re-reading each aggregate's column.
+    COUNT(*) is updated without reading the row.
+
+    Args:
+        aggregates: Aggregate functions, in the order of the aggregators
+
+    Returns:
+        Function taking a row and the group's aggregators
+    """
+    namespace: dict[str, Any] = {}
+    lines = ["def update_group(row, aggregators):", "    get = row.get"]
+    for i, agg_func in enumerate(aggregates):
+        if agg_func.column == "*":
+            lines.append(f"    aggregators[{i}].update(None)")
+        else:
+            namespace[f"c{i}"] = agg_func.column
+            lines.append(f"    aggregators[{i}].update(get(c{i}))")
+    exec(compile("\n".join(lines), "<aggregates>", "exec"), namespace)
+    return namespace["update_group"]
+
+
+def _sequential_sums(lists: Any) -> list[float | None]:
+    """
+    Add up each group's float values in row order, as SumAggregator does
+
+    The additions run in C (reduce over operator.add), but one after another,
+    so every sum rounds exactly as the row-by-row aggregator's would. NULLs
+    are skipped; a group with no values sums to None.
+
+    Args:
+        lists: Arrow list array holding each group's values
+
+    Returns:
+        One sum per group
+    """
+    import pyarrow.compute as pc
+
+    lengths = pc.list_value_length(lists).to_pylist()
+    values = pc.list_flatten(lists).to_pylist()
+    sums: list[float | None] = []
+    start = 0
+    for length in lengths:
+        group_values = [value for value in values[start : start + length] if value is not None]
+        sums.append(reduce(add, group_values, 0) if group_values else None)
+        start += length
+    return sums
@@ -14,6 +14,10 @@ from typing import Any
 
 from sqlstream.operators.base import Operator
 
+# Right rows sharing a join key: a 1-tuple until a second row arrives
+Bucket = tuple[dict[str, Any], ...] | list[dict[str, Any]]
+RowIdBucket = tuple[int, ...] | list[int]
+
 
 class HashJoinOperator(Operator):
     """
@@ -95,9 +99,10 @@ class HashJoinOperator(Operator):
                 continue
 
             # Probe hash table
-            if join_key in hash_table:
+            right_rows = hash_table.get(join_key)
+            if right_rows is not None:
                 # Found match(es) - join with all matching right rows
-                for right_row in hash_table[join_key]:
+                for right_row in right_rows:
                     yield self._merge_rows(left_row, right_row)
 
     def _left_join(self) -> Iterator[dict[str, Any]]:
@@ -114,10 +119,11 @@ class HashJoinOperator(Operator):
         for left_row in self.left:
             join_key = left_row.get(self.left_key)
 
-            # Check for match
-            if join_key is not None and join_key in hash_table:
+            # Check for match (NULL keys are never in the hash table)
+            right_rows = hash_table.get(join_key)
+            if right_rows is not None:
                 # Found match(es) - join with all matching right rows
-                for right_row in hash_table[join_key]:
+                for right_row in right_rows:
                     yield self._merge_rows(left_row, right_row)
             else:
                 # No match - output left row with NULL for right columns
@@ -130,36 +136,41 @@ class HashJoinOperator(Operator):
         Returns all rows from right table. If there's a match in left table,
         include left columns. If no match, left columns are NULL.
         """
-        # Build phase: Create hash table from right table
-        # Also track which right rows were matched
-        hash_table = self._build_hash_table()
-        matched_right_rows = set()  # Track (join_key, row_index) tuples
+        # Build phase: Create hash table of right row ids, so matches can be
+        # marked in a flat byte per row rather than a set of keys
+        right_rows, hash_table = self._build_row_id_table()
+        matched = bytearray(len(right_rows))
 
         # Probe phase: Scan left table and output matches
         for left_row in self.left:
             join_key = left_row.get(self.left_key)
 
-            if join_key is not None and join_key in hash_table:
+            row_ids = hash_table.get(join_key)
+            if row_ids is not None:
                 # Found match(es) - join with all matching right rows
-                for idx, right_row in enumerate(hash_table[join_key]):
-                    yield self._merge_rows(left_row, right_row)
+                for row_id in row_ids:
+                    yield self._merge_rows(left_row, right_rows[row_id])
                     # Mark this right row as matched
-                    matched_right_rows.add((join_key, idx))
+                    matched[row_id] = 1
 
         # Output unmatched right rows with NULL for left columns
-        for join_key, right_rows in hash_table.items():
-            for idx, right_row in enumerate(right_rows):
-                if (join_key, idx) not in matched_right_rows:
-                    yield self._merge_rows(None, right_row)
+        for row_ids in hash_table.values():
+            for row_id in row_ids:
+                if not matched[row_id]:
+                    yield self._merge_rows(None, right_rows[row_id])
 
-    def _build_hash_table(self) -> dict[Any, list[dict[str, Any]]]:
+    def _build_hash_table(self) -> dict[Any, Bucket]:
         """
         Build hash table from right table
 
+        Join keys are usually unique on the build side, so a key's rows are
+        held in a 1-tuple (about half the size of a 1-item list) until a
+        second row with that key turns it into a list.
+
         Returns:
-            Hash table mapping join key values to lists of matching rows
+            Hash table mapping join key values to the matching rows, in order
         """
-        hash_table: dict[Any, list[dict[str, Any]]] = {}
+        hash_table: dict[Any, Bucket] = {}
 
         for row in self.right:
             join_key = row.get(self.right_key)
@@ -173,12 +184,54 @@ class HashJoinOperator(Operator):
                 join_key = str(join_key)
 
             # Add row to hash table
-            if join_key not in hash_table:
-                hash_table[join_key] = []
-            hash_table[join_key].append(row)
+            rows = hash_table.get(join_key)
+            if rows is None:
+                hash_table[join_key] = (row,)
+            elif type(rows) is tuple:
+                hash_table[join_key] = [*rows, row]
+            else:
+                rows.append(row)
 
         return hash_table
 
+    def _build_row_id_table(self) -> tuple[list[dict[str, Any]], dict[Any, RowIdBucket]]:
+        """
+        Build hash table of row ids from right table
+
+        Like _build_hash_table(), but buckets hold each row's position in the
+        right table, so per-row state can be kept in flat arrays.
+
+        Returns:
+            Tuple of (right rows in order, hash table mapping join key values
+            to the ids of the matching rows, in order)
+        """
+        right_rows: list[dict[str, Any]] = []
+        hash_table: dict[Any, RowIdBucket] = {}
+
+        for row in self.right:
+            join_key = row.get(self.right_key)
+
+            # Skip rows with NULL join key (they can never match)
+            if join_key is None:
+                continue
+
+            # Handle unhashable types (e.g., lists, dicts)
+            if isinstance(join_key, (list, dict)):
+                join_key = str(join_key)
+
+            # Add row id to hash table
+            row_id = len(right_rows)
+            right_rows.append(row)
+            row_ids = hash_table.get(join_key)
+            if row_ids is None:
+                hash_table[join_key] = (row_id,)
+            elif type(row_ids) is tuple:
+                hash_table[join_key] = [*row_ids, row_id]
+            else:
+                row_ids.append(row_id)
+
+        return right_rows, hash_table
+
     def _merge_rows(
         self, left_row: dict[str, Any] | None, right_row: dict[str, Any] | None
     ) -> dict[str, Any]:
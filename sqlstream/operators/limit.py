@@ -5,6 +5,7 @@ Yields only the first N rows, then stops.
 """
 
 from collections.abc import Iterator
+from itertools import islice
 from typing import Any
 
 from sqlstream.operators.base import Operator
@@ -37,14 +38,32 @@ class Limit(Operator):
         This is efficient because it stops pulling from child
         as soon as we've yielded enough rows (early termination).
         """
-        count = 0
+        # islice stops right after the last row, without pulling one more
+        yield from islice(self.child, max(self.limit, 0))
 
-        for row in self.child:
-            if count >= self.limit:
-                break
+    def batches(self) -> Iterator[Any] | None:
+        """
+        Cut the child's Arrow batches off after limit rows
+
+        Returns:
+            Iterator over batches, or None if the child only yields rows
+        """
+        batches = self.child.batches()
+        if batches is None:
+            return None
+        return self._limit_batches(batches)
 
-            yield row
-            count += 1
+    def _limit_batches(self, batches: Iterator[Any]) -> Iterator[Any]:
+        """Yield batches until limit rows, without pulling another batch after"""
+        remaining = max(self.limit, 0)
+        if remaining == 0:
+            return
+        for batch in batches:
+            if batch.num_rows >= remaining:
+                yield batch.slice(0, remaining)
+                return
+            remaining -= batch.num_rows
+            yield batch
 
     def __repr__(self) -> str:
         return f"Limit({self.limit})"
@@ -5,6 +5,9 @@ Sorts rows by specified columns with ASC/DESC directions.
 """
 
 from collections.abc import Iterator
+from functools import cmp_to_key
+from itertools import compress, repeat
+from operator import is_, is_not, itemgetter
 from typing import Any
 
 from sqlstream.operators.base import Operator
@@ -42,46 +45,71 @@ class OrderByOperator(Operator):
         # Materialize all rows
         rows = list(self.child)
 
-        # Sort rows using multi-key sort
-        sorted_rows = sorted(rows, key=self._sort_key)
+        try:
+            sorted_rows = self._sort_by_columns(rows)
+        except TypeError:
+            # Incomparable values in a column: compare whole rows, which only
+            # compares a column where the columns before it tie
+            sorted_rows = sorted(rows, key=cmp_to_key(self._compare_rows))
 
         # Yield sorted rows
         yield from sorted_rows
 
-    def _sort_key(self, row: dict[str, Any]) -> tuple:
+    def _sort_by_columns(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
-        Generate sort key for a row
+        Sort rows with one stable sort per column, last column first
+
+        Each pass moves the column's NULLs to the end and sorts the rest on
+        their bare values, so CPython compares keys with its C comparisons
+        specialized for ints, floats and strings, rather than calling back
+        into Python for every comparison of tuple keys. Stability makes the
+        result the same as sorting on the combined key.
 
         Args:
-            row: Input row
+            rows: Rows to sort
 
         Returns:
-            Tuple of (value, reverse_flag) for multi-key sorting
+            Sorted rows
+
+        Raises:
+            TypeError: If a column holds values that can't be compared
         """
-        key_parts = []
+        for order_col in reversed(self.order_by):
+            column = order_col.column
+            values = list(map(dict.get, rows, repeat(column)))
+            present = list(compress(rows, map(is_not, values, repeat(None))))
+            # Reverse sorting keeps equal values in order, so it stays stable
+            present.sort(key=itemgetter(column), reverse=order_col.direction == "DESC")
+            if len(present) < len(rows):
+                present.extend(compress(rows, map(is_, values, repeat(None))))
+            rows = present
+        return rows
+
+    def _compare_rows(self, left: dict[str, Any], right: dict[str, Any]) -> int:
+        """
+        Compare two rows by the ORDER BY columns
 
-        for order_col in self.order_by:
-            value = row.get(order_col.column)
+        The first column whose values differ decides; NULLs sort last in
+        either direction.
 
-            # Handle NULL values - sort them last
-            if value is None:
-                # Use a sentinel that sorts last
-                value = (1, None)  # (sort_last_flag, None)
-            else:
-                value = (0, value)  # (sort_first_flag, actual_value)
+        Args:
+            left: First row
+            right: Second row
 
-            # For DESC, we need to reverse the comparison
+        Returns:
+            Negative if left sorts first, positive if right does, else 0
+        """
+        for order_col in self.order_by:
+            a = left.get(order_col.column)
+            b = right.get(order_col.column)
+            if a is b or a == b:
+                continue
+            if a is None or b is None:
+                return 1 if a is None else -1
             if order_col.direction == "DESC":
-                # Invert the sort order by negating numbers or using reverse wrapper
-                if isinstance(value[1], (int, float)):
-                    value = (value[0], -value[1] if value[1] is not None else None)
-                else:
-                    # For non-numeric types, we'll use a reverse wrapper
-                    value = (value[0], ReverseCompare(value[1]))
-
-            key_parts.append(value)
-
-        return tuple(key_parts)
+                return -1 if a > b else 1
+            return -1 if a < b else 1
+        return 0
 
     def explain(self, indent: int = 0) -> list[str]:
         """Generate execution plan explanation"""
@@ -89,47 +117,3 @@ class OrderByOperator(Operator):
         lines = [" " * indent + f"OrderBy({order_spec})"]
         lines.extend(self.child.explain(indent + 2))
         return lines
-
-
-class ReverseCompare:
-    """
-    Wrapper class to reverse comparison order for non-numeric types
-
-    Used for DESC sorting of strings and other non-numeric types.
-    """
-
-    def __init__(self, value):
-        self.value = value
-
-    def __lt__(self, other):
-        if isinstance(other, ReverseCompare):
-            return self.value > other.value
-        return self.value > other
-
-    def __le__(self, other):
-        if isinstance(other, ReverseCompare):
-            return self.value >= other.value
-        return self.value >= other
-
-    def __gt__(self, other):
-        if isinstance(other, ReverseCompare):
-            return self.value < other.value
-        return self.value < other
-
-    def __ge__(self, other):
-        if isinstance(other, ReverseCompare):
-            return self.value <= other.value
-        return self.value <= other
-
-    def __eq__(self, other):
-        if isinstance(other, ReverseCompare):
-            return self.value == other.value
-        return self.value == other
-
-    def __ne__(self, other):
-        if isinstance(other, ReverseCompare):
-            return self.value != other.value
-        return self.value != other
-
-    def __repr__(self):
-        return f"ReverseCompare({self.value!r})"
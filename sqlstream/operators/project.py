@@ -4,10 +4,10 @@ Project operator - implements SELECT column list
 Selects specific columns from rows (or all columns with *).
 """
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
-from sqlstream.operators.base import Operator
+from sqlstream.operators.base import Operator, batch_rows
 
 
 class Project(Operator):
@@ -29,6 +29,7 @@ class Project(Operator):
         """
         super().__init__(child)
         self.columns = columns
+        self._project = _compile_projection(columns)
 
     def __iter__(self) -> Iterator[dict[str, Any]]:
         """
@@ -42,20 +43,69 @@ class Project(Operator):
             yield from self.child
             return
 
-        # SELECT specific columns
-        for row in self.child:
-            # Create projected row with only selected columns
-            projected = {}
+        # Project the child's Arrow batches before building any rows
+        batches = self.batches()
+        if batches is not None:
+            yield from batch_rows(batches)
+            return
+
+        # SELECT specific columns (missing columns are set to None)
+        yield from self._project(self.child)
 
-            for col in self.columns:
-                if col in row:
-                    projected[col] = row[col]
-                else:
-                    # Column not found - set to None
-                    projected[col] = None
+    def batches(self) -> Iterator[Any] | None:
+        """
+        Select the columns from the child's Arrow batches
 
-            yield projected
+        Returns:
+            Iterator over projected batches, or None if the child only yields rows
+        """
+        batches = self.child.batches()
+        if batches is None or self.columns == ["*"]:
+            return batches
+        return self._project_batches(batches)
+
+    def _project_batches(self, batches: Iterator[Any]) -> Iterator[Any]:
+        """Select the columns from each batch, with NULLs for missing columns"""
+        import pyarrow as pa
+
+        for batch in batches:
+            arrays = []
+            for column in self.columns:
+                # The last of any duplicates, as when converting to rows
+                indices = batch.schema.get_all_field_indices(column)
+                arrays.append(batch.column(indices[-1]) if indices else pa.nulls(batch.num_rows))
+            yield pa.Table.from_arrays(arrays, names=self.columns)
 
     def __repr__(self) -> str:
         col_str = ", ".join(self.columns)
         return f"Project({col_str})"
+
+
+def _compile_projection(
+    columns: list[str],
+) -> Callable[[Iterable[dict[str, Any]]], Iterator[dict[str, Any]]]:
+    """
+    Build a generator that projects rows onto columns
+
+    The output row is generated as a dict display with one entry per
+    column, so each row is built in the loop itself rather than by running
+    a dict comprehension (a nested function call per row before Python
+    3.12). Column names are bound as names, so any name works.
+
+    Args:
+        columns: Column names to select
+
+    Returns:
+        Function taking rows and yielding their projections, with None for
+        missing columns
+    """
+    namespace: dict[str, Any] = {f"c{i}": column for i, column in enumerate(columns)}
+    entries = ", ".join(f"c{i}: get(c{i})" for i in range(len(columns)))
+    source = (
+        "def project(rows):\n"
+        "    for row in rows:\n"
+        "        get = row.get\n"
+        f"        yield {{{entries}}}\n"
+    )
+    exec(compile(source, "<select>", "exec"), namespace)
+    return namespace["project"]
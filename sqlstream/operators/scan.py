@@ -38,5 +38,17 @@ class Scan(Operator):
         """
         yield from self.reader.read_lazy()
 
+    def batches(self) -> Iterator[Any] | None:
+        """
+        Yield the reader's Arrow batches, if it can read columnar
+
+        Returns:
+            Iterator over pyarrow Tables or RecordBatches, or None if the
+            reader only yields rows
+        """
+        # Any object with read_lazy() can be scanned (e.g. ParallelReader)
+        read_batches = getattr(self.reader, "read_batches", None)
+        return read_batches() if read_batches is not None else None
+
     def __repr__(self) -> str:
         return f"Scan({self.reader.__class__.__name__})"
@@ -19,7 +19,7 @@ Example:
 
 from sqlstream.optimizers.base import Optimizer
 from sqlstream.readers.base import BaseReader
-from sqlstream.sql.ast_nodes import SelectStatement
+from sqlstream.sql.ast_nodes import SelectStatement, WhereClause
 
 
 class PartitionPruningOptimizer(Optimizer):
@@ -104,7 +104,8 @@ class PartitionPruningOptimizer(Optimizer):
             # IMPORTANT: Remove partition filters from WHERE clause
             # Partition columns are virtual (from directory path) and don't exist in data
             # They should only be used for partition pruning, not row-level filtering
-            ast.where.conditions = non_partition_filters
+            # (a new WhereClause: parsed ASTs share nested nodes, see core.query._parse)
+            ast.where = WhereClause(non_partition_filters)
 
             self.applied = True
             self.description = f"{len(partition_filters)} partition filter(s)"
@@ -165,6 +165,36 @@ class BaseReader:
         """
         return None
 
+    def row_count_hint(self) -> int | None:
+        """
+        Get the number of rows in the source without reading it
+
+        Returns:
+            Row count, or None if it isn't cheaply available
+
+        Note:
+            Optional method. Returns None by default.
+            Readers whose metadata records a row count (e.g. Parquet footers)
+            should override this.
+        """
+        return None
+
+    def read_batches(self) -> Iterator[Any] | None:
+        """
+        Read data as Arrow batches, for readers with a columnar format
+
+        Returns:
+            Iterator over pyarrow Tables or RecordBatches honouring the same
+            filters, columns and limit as read_lazy(), or None if the reader
+            only yields rows
+
+        Note:
+            Optional method. Returns None by default.
+            Readers backed by Arrow (e.g. Parquet) should override this so
+            operators can stay columnar.
+        """
+        return None
+
     def __iter__(self):
         """Allow readers to be used directly in for loops"""
         return self.read_lazy()
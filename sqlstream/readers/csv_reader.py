@@ -5,14 +5,98 @@ Uses Python's built-in csv module for simplicity and zero dependencies.
 """
 
 import csv
+import importlib.util
 import warnings
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from sqlstream.core.source_cache import load_schema, load_table
 from sqlstream.core.types import Schema
 from sqlstream.readers.base import BaseReader
 from sqlstream.sql.ast_nodes import Condition
+from sqlstream.utils.predicates import COMPARISON_OPERATORS, compile_conditions
+
+# DuckDB, if installed, parses local CSV files (much faster than pandas' reader)
+DUCKDB_AVAILABLE = importlib.util.find_spec("duckdb") is not None
+
+# Inferred column type -> DuckDB type matching CSVReader's pandas dtypes
+# (anything else, e.g. STRING or TIME, is read as VARCHAR like pandas does)
+_DUCKDB_CSV_TYPES = {
+    "INTEGER": "BIGINT",
+    "FLOAT": "DOUBLE",
+    "DECIMAL": "DOUBLE",
+    "NULL": "DOUBLE",
+    "BOOLEAN": "BOOLEAN",
+    "DATE": "TIMESTAMP",
+    "DATETIME": "TIMESTAMP",
+}
+
+# pandas.read_csv's default missing-value markers
+_CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]  # fmt: skip
+
+
+def _read_csv_with_duckdb(path: str):
+    """
+    Parse a local CSV file into a pyarrow Table with DuckDB's native reader
+
+    Column types come from CSVReader's inferred schema, so the result matches
+    the pandas read_csv path.
+
+    Returns:
+        pyarrow Table, or None if DuckDB is unavailable or can't read the file
+        (callers then fall back to pandas)
+    """
+    if not DUCKDB_AVAILABLE or "://" in path:
+        return None
+
+    import duckdb
+
+    schema = CSVReader(path).get_schema()
+    if not schema:
+        return None
+    dtype = {col: _DUCKDB_CSV_TYPES.get(t.value, "VARCHAR") for col, t in schema.columns.items()}
+
+    # A cursor on the default connection: cheap, and safe to use from the
+    # thread that loads the right side of a JOIN
+    conn = duckdb.cursor()
+    try:
+        relation = conn.read_csv(path, header=True, sep=",", dtype=dtype, na_values=_CSV_NA_VALUES)
+        # to_arrow_table() supersedes fetch_arrow_table() in newer DuckDB releases
+        to_table = getattr(relation, "to_arrow_table", None) or relation.fetch_arrow_table
+        return to_table()
+    except Exception:
+        return None
+    finally:
+        conn.close()
+
+
+def load_csv_table(path: str):
+    """
+    Load a local CSV file as a pyarrow Table, reusing the in-process source cache
+
+    Used by the pandas and DuckDB backends, so a file either backend has
+    loaded is a cache hit for the other.
+
+    Args:
+        path: Path to the CSV file
+
+    Returns:
+        pyarrow Table with CSVReader's inferred column types
+    """
+    import pyarrow as pa
+
+    def loader():
+        table = _read_csv_with_duckdb(path)
+        if table is not None:
+            return table
+        df = CSVReader(path).to_dataframe()
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    return load_table(path, loader)
 
 
 class CSVReader(BaseReader):
@@ -103,6 +187,15 @@ class CSVReader(BaseReader):
         """
         with self._get_file_handle() as f:
             reader = csv.DictReader(f, delimiter=self.delimiter)
+            matches = None
+            if self.filter_conditions:
+                for condition in self.filter_conditions:
+                    if condition.operator not in COMPARISON_OPERATORS:
+                        # Unknown operator, the condition matches every row
+                        warnings.warn(
+                            f"Unknown operator: {condition.operator}", UserWarning, stacklevel=2
+                        )
+                matches = compile_conditions(self.filter_conditions)
             rows_yielded = 0
 
             for row_num, raw_row in enumerate(reader, start=2):  # Start at 2 (after header)
@@ -115,9 +208,8 @@ class CSVReader(BaseReader):
                     row = self._infer_types(raw_row)
 
                     # Apply filters if set (predicate pushdown)
-                    if self.filter_conditions:
-                        if not self._matches_filter(row):
-                            continue
+                    if matches is not None and not matches(row):
+                        continue
 
                     # Apply column selection if set (column pruning)
                     if self.required_columns:
@@ -177,69 +269,6 @@ class CSVReader(BaseReader):
 
         return infer_type_from_string(value)
 
-    def _matches_filter(self, row: dict[str, Any]) -> bool:
-        """
-        Check if row matches all filter conditions
-
-        Args:
-            row: Row to check
-
-        Returns:
-            True if row matches all conditions (AND logic)
-        """
-        for condition in self.filter_conditions:
-            if not self._evaluate_condition(row, condition):
-                return False
-        return True
-
-    def _evaluate_condition(self, row: dict[str, Any], condition: Condition) -> bool:
-        """
-        Evaluate a single condition against a row
-
-        Args:
-            row: Row to check
-            condition: Condition to evaluate
-
-        Returns:
-            True if condition is satisfied
-        """
-        # Get column value
-        if condition.column not in row:
-            return False
-
-        value = row[condition.column]
-
-        # Handle NULL values
-        if value is None:
-            return False
-
-        # Evaluate operator
-        op = condition.operator
-        expected = condition.value
-
-        try:
-            if op == "=":
-                return value == expected
-            elif op == ">":
-                return value > expected
-            elif op == "<":
-                return value < expected
-            elif op == ">=":
-                return value >= expected
-            elif op == "<=":
-                return value <= expected
-            elif op == "!=":
-                return value != expected
-            else:
-                # Unknown operator, skip this condition
-                warnings.warn(f"Unknown operator: {op}", UserWarning, stacklevel=2)
-                return True
-
-        except TypeError:
-            # Type mismatch (e.g., comparing string to int)
-            # This is fine - row just doesn't match
-            return False
-
     def get_schema(self, sample_size: int = 100) -> Schema | None:
         """
         Infer schema by sampling rows from the CSV file
@@ -250,6 +279,20 @@ class CSVReader(BaseReader):
         Returns:
             Schema object with inferred types, or None if file is empty
         """
+        # Sampling doesn't depend on pushdown state, so the schema of an
+        # unchanged file is reused across readers
+        schema = load_schema(
+            self.path_str,
+            lambda: self._sample_schema(sample_size),
+            self.encoding,
+            self.delimiter,
+            sample_size,
+        )
+        # Schemas are mutable; don't hand out the cached one
+        return Schema(dict(schema.columns)) if schema is not None else None
+
+    def _sample_schema(self, sample_size: int) -> Schema | None:
+        """Infer the schema from the first sample_size rows of the file"""
         sample_rows = []
 
         with self._get_file_handle() as f:
@@ -278,6 +321,34 @@ class CSVReader(BaseReader):
         """
         import pandas as pd
 
+        return pd.read_csv(self._pandas_source(), **self._pandas_read_kwargs())
+
+    def iter_dataframes(self, chunksize: int):
+        """
+        Read the file as a sequence of DataFrames of at most ``chunksize`` rows
+
+        Uses the same inferred types as to_dataframe(), so every chunk has
+        consistent dtypes. Only one chunk is held in memory at a time.
+
+        Args:
+            chunksize: Maximum number of rows per chunk
+
+        Yields:
+            pandas DataFrames
+        """
+        import pandas as pd
+
+        with pd.read_csv(
+            self._pandas_source(), chunksize=chunksize, **self._pandas_read_kwargs()
+        ) as chunks:
+            yield from chunks
+
+    def _pandas_source(self):
+        """Path or URL handed to pandas.read_csv"""
+        return self.path_str if self.is_s3 else self.path
+
+    def _pandas_read_kwargs(self) -> dict[str, Any]:
+        """Build pandas.read_csv arguments from the inferred schema"""
         from sqlstream.core.types import DataType
 
         # Get schema to guide pandas parsing
@@ -313,6 +384,5 @@ class CSVReader(BaseReader):
 
         if self.is_s3:
             kwargs["storage_options"] = {"anon": False}
-            return pd.read_csv(self.path_str, **kwargs)
-        else:
-            return pd.read_csv(self.path, **kwargs)
+
+        return kwargs
@@ -10,7 +10,9 @@ Supports:
 
 from __future__ import annotations
 
+import copy
 import hashlib
+import importlib.util
 import tempfile
 from collections.abc import Iterator
 from pathlib import Path
@@ -26,25 +28,19 @@ except ImportError:
     httpx = None
 
 from sqlstream.readers.base import BaseReader
-from sqlstream.readers.csv_reader import CSVReader
+from sqlstream.readers.registry import detect_format, get_reader_factory, sniff_format
 from sqlstream.sql.ast_nodes import Condition
 
-# Try to import ParquetReader (optional)
-try:
-    from sqlstream.readers.parquet_reader import ParquetReader
-
-    PARQUET_AVAILABLE = True
-except ImportError:
-    PARQUET_AVAILABLE = False
-    ParquetReader = None
+# Parquet delegates need pyarrow (optional)
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
 
 class HTTPReader(BaseReader):
     """
     Read data from HTTP/HTTPS URLs with intelligent caching
 
-    Automatically detects file format (CSV or Parquet) and delegates
-    to appropriate reader. Caches downloaded files to avoid re-downloads.
+    Automatically detects file format and delegates to the reader the
+    registry has for it. Caches downloaded files to avoid re-downloads.
 
     Example:
         reader = HTTPReader("https://example.com/data.csv")
@@ -67,9 +63,11 @@ class HTTPReader(BaseReader):
             url: HTTP/HTTPS URL to data file
             cache_dir: Directory to cache downloaded files (default: system temp)
             force_download: If True, re-download even if cached
-            format: Explicit format specification (csv, parquet, html, markdown).
-                   If not provided, will auto-detect from URL extension or content.
-            **kwargs: Additional arguments passed to the delegate reader
+            format: Explicit format specification (csv, parquet, json, jsonl, html,
+                   markdown, xml). If not provided, will auto-detect from URL
+                   extension or content.
+            **kwargs: Delegate reader options; `table` selects the table (HTML,
+                   Markdown), records key (JSON) or element (XML)
         """
         if not HTTPX_AVAILABLE:
             raise ImportError("HTTP reader requires httpx library. Install `sqlstream[http]`")
@@ -88,7 +86,7 @@ class HTTPReader(BaseReader):
         # Download or get cached file
         self.local_path = self._get_or_download()
 
-        # Detect format and create appropriate reader
+        # Detect format (sets self.format) and create appropriate reader
         self.delegate_reader = self._create_delegate_reader()
 
         # Delegate filter conditions and column selection
@@ -139,117 +137,44 @@ class HTTPReader(BaseReader):
         except Exception as e:
             raise OSError(f"Failed to download {self.url}: {e}") from e
 
+    def __copy__(self) -> HTTPReader:
+        """Copy the reader along with its delegate, so pushdown state isn't shared"""
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.delegate_reader = copy.copy(self.delegate_reader)
+        return clone
+
     def _create_delegate_reader(self) -> BaseReader:
-        """Create appropriate reader based on file format"""
-        format_to_use = self.explicit_format
-
-        # If no explicit format, try to detect from URL extension
-        if not format_to_use:
-            path_lower = str(self.local_path).lower()
-
-            if path_lower.endswith(".parquet"):
-                format_to_use = "parquet"
-            elif path_lower.endswith(".csv"):
-                format_to_use = "csv"
-            elif path_lower.endswith((".html", ".htm")):
-                format_to_use = "html"
-            elif path_lower.endswith((".md", ".markdown")):
-                format_to_use = "markdown"
-            elif path_lower.endswith(".json"):
-                format_to_use = "json"
-            elif path_lower.endswith(".jsonl"):
-                format_to_use = "jsonl"
-            else:
-                # Try to detect from content
-                format_to_use = self._detect_format_from_content()
-
-        # Create appropriate reader based on detected/specified format
-        if format_to_use == "parquet":
-            if not PARQUET_AVAILABLE:
-                raise ImportError("Parquet files require pyarrow. Install `sqlstream[parquet]`")
-            return ParquetReader(str(self.local_path))
-
-        elif format_to_use == "html":
-            try:
-                from sqlstream.readers.html_reader import HTMLReader
-
-                return HTMLReader(str(self.local_path), **self.reader_kwargs)
-            except ImportError as e:
-                raise ImportError(
-                    "HTML reader requires pandas library. Install `sqlstream[pandas]`"
-                ) from e
-
-        elif format_to_use == "markdown":
-            from sqlstream.readers.markdown_reader import MarkdownReader
-
-            return MarkdownReader(str(self.local_path), **self.reader_kwargs)
-
-        elif format_to_use == "json":
-            from sqlstream.readers.json_reader import JSONReader
-
-            # Pass table/records_key if available in kwargs
-            records_key = self.reader_kwargs.get("table")
-            return JSONReader(str(self.local_path), records_key=records_key)
-
-        elif format_to_use == "jsonl":
-            from sqlstream.readers.jsonl_reader import JSONLReader
-
-            return JSONLReader(str(self.local_path))
-
-        else:  # csv or unknown - default to CSV
-            try:
-                return CSVReader(str(self.local_path))
-            except Exception as e:
-                raise ValueError(f"Unknown file format: {format_to_use}") from e
-
-    def _detect_format_from_content(self) -> str:
-        """Try to detect format by peeking at file content"""
-        try:
-            with open(self.local_path, "rb") as f:
-                # Read first few bytes
-                header = f.read(512)
-
-            # Check for HTML
-            if (
-                b"<html" in header.lower()
-                or b"<!doctype html" in header.lower()
-                or b"<table" in header.lower()
-            ):
-                return "html"
-
-            # Check for Markdown table (simple heuristic)
-            if b"|" in header and b"---" in header:
-                return "markdown"
-
-            # Check for Parquet magic number
-            if header.startswith(b"PAR1"):
-                return "parquet"
-
-            # Check for JSON (starts with [ or {)
-            stripped = header.strip()
-            if stripped.startswith(b"[") or (
-                stripped.startswith(b"{") and b'"records":' in stripped
-            ):
-                return "json"
-
-            # Check for JSONL (multiple lines starting with {)
-            lines = header.split(b"\n")
-            if (
-                len(lines) > 1
-                and lines[0].strip().startswith(b"{")
-                and lines[1].strip().startswith(b"{")
-            ):
-                return "jsonl"
-
-            # Default to CSV
-            return "csv"
-
-        except Exception:
-            # If detection fails, default to CSV
-            return "csv"
+        """Create the registry's reader for the file's format"""
+        local_path = str(self.local_path)
+
+        # If no explicit format, detect from URL extension, then content,
+        # defaulting to CSV
+        self.format = (
+            self.explicit_format or detect_format(local_path) or sniff_format(local_path) or "csv"
+        )
+
+        if self.format == "parquet" and not PARQUET_AVAILABLE:
+            raise ImportError("Parquet files require pyarrow. Install `sqlstream[parquet]`")
+
+        # Raises ValueError for formats without a registered reader
+        factory = get_reader_factory(self.format)
+        return factory(local_path, self.reader_kwargs.get("table"))
 
     def read_lazy(self) -> Iterator[dict[str, Any]]:
         """Read data lazily, delegating to underlying reader"""
+        self._push_down_to_delegate()
+
+        # Delegate to underlying reader
+        yield from self.delegate_reader.read_lazy()
+
+    def read_batches(self) -> Iterator[Any] | None:
+        """Read Arrow batches, if the underlying reader can"""
+        self._push_down_to_delegate()
+        return self.delegate_reader.read_batches()
+
+    def _push_down_to_delegate(self) -> None:
+        """Pass filter conditions and column selection on to the delegate"""
         # Apply filter conditions to delegate
         if self.filter_conditions:
             self.delegate_reader.set_filter(self.filter_conditions)
@@ -258,9 +183,6 @@ class HTTPReader(BaseReader):
         if self.required_columns:
             self.delegate_reader.set_columns(self.required_columns)
 
-        # Delegate to underlying reader
-        yield from self.delegate_reader.read_lazy()
-
     def get_schema(self) -> dict[str, str]:
         """Get schema from delegate reader"""
         return self.delegate_reader.get_schema()
@@ -10,6 +10,7 @@ from typing import Any
 from sqlstream.core.types import Schema
 from sqlstream.readers.base import BaseReader
 from sqlstream.sql.ast_nodes import Condition
+from sqlstream.utils.predicates import compile_conditions
 
 
 class JSONReader(BaseReader):
@@ -101,15 +102,15 @@ class JSONReader(BaseReader):
         # Locate records
         records = self._locate_records(data)
 
+        matches = compile_conditions(self.filter_conditions) if self.filter_conditions else None
         rows_yielded = 0
         for row in records:
             if not isinstance(row, dict):
                 continue
 
             # Apply filters
-            if self.filter_conditions:
-                if not self._matches_filter(row):
-                    continue
+            if matches is not None and not matches(row):
+                continue
 
             # Apply column selection
             if self.required_columns:
@@ -299,43 +300,6 @@ class JSONReader(BaseReader):
 
         return current
 
-    def _matches_filter(self, row: dict[str, Any]) -> bool:
-        """Check if row matches filter conditions"""
-        for condition in self.filter_conditions:
-            if not self._evaluate_condition(row, condition):
-                return False
-        return True
-
-    def _evaluate_condition(self, row: dict[str, Any], condition: Condition) -> bool:
-        """Evaluate single condition"""
-        if condition.column not in row:
-            return False
-
-        value = row[condition.column]
-        if value is None:
-            return False
-
-        op = condition.operator
-        expected = condition.value
-
-        try:
-            if op == "=":
-                return value == expected
-            elif op == ">":
-                return value > expected
-            elif op == "<":
-                return value < expected
-            elif op == ">=":
-                return value >= expected
-            elif op == "<=":
-                return value <= expected
-            elif op == "!=":
-                return value != expected
-            else:
-                return True
-        except TypeError:
-            return False
-
     def get_schema(self) -> Schema | None:
         """Infer schema from data"""
         # We have to load the file to get schema
@@ -11,6 +11,7 @@ from typing import Any
 from sqlstream.core.types import Schema
 from sqlstream.readers.base import BaseReader
 from sqlstream.sql.ast_nodes import Condition
+from sqlstream.utils.predicates import compile_conditions
 
 
 class JSONLReader(BaseReader):
@@ -91,6 +92,7 @@ class JSONLReader(BaseReader):
         Yield rows from JSONL file line by line
         """
         with self._get_file_handle() as f:
+            matches = compile_conditions(self.filter_conditions) if self.filter_conditions else None
             rows_yielded = 0
 
             for line_num, line in enumerate(f, start=1):
@@ -108,9 +110,8 @@ class JSONLReader(BaseReader):
                         continue
 
                     # Apply filters
-                    if self.filter_conditions:
-                        if not self._matches_filter(row):
-                            continue
+                    if matches is not None and not matches(row):
+                        continue
 
                     # Apply column selection
                     if self.required_columns:
@@ -128,43 +129,6 @@ class JSONLReader(BaseReader):
                     )
                     continue
 
-    def _matches_filter(self, row: dict[str, Any]) -> bool:
-        """Check if row matches filter conditions"""
-        for condition in self.filter_conditions:
-            if not self._evaluate_condition(row, condition):
-                return False
-        return True
-
-    def _evaluate_condition(self, row: dict[str, Any], condition: Condition) -> bool:
-        """Evaluate single condition"""
-        if condition.column not in row:
-            return False
-
-        value = row[condition.column]
-        if value is None:
-            return False
-
-        op = condition.operator
-        expected = condition.value
-
-        try:
-            if op == "=":
-                return value == expected
-            elif op == ">":
-                return value > expected
-            elif op == "<":
-                return value < expected
-            elif op == ">=":
-                return value >= expected
-            elif op == "<=":
-                return value <= expected
-            elif op == "!=":
-                return value != expected
-            else:
-                return True
-        except TypeError:
-            return False
-
     def get_schema(self, sample_size: int = 100) -> Schema | None:
         """Infer schema by sampling first N lines"""
         sample_rows = []
@@ -11,11 +11,16 @@ from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 from sqlstream.core.types import DataType, Schema
 from sqlstream.readers.base import BaseReader
 from sqlstream.sql.ast_nodes import Condition
+from sqlstream.utils.predicates import arrow_mask, compile_conditions
+
+# Rows converted from Arrow at a time
+ROW_BATCH_SIZE = 1024
 
 
 class ParquetReader(BaseReader):
@@ -314,6 +319,42 @@ class ParquetReader(BaseReader):
             # Comparison failed (type mismatch), keep row group
             return True
 
+    def read_batches(self) -> Iterator[pa.Table]:
+        """
+        Read the selected row groups as Arrow tables
+
+        Applies the same pruning, filters, column selection, partition
+        columns and limit as read_lazy(), without building any rows.
+
+        Yields:
+            One table per selected row group
+        """
+        if self.partition_pruned:
+            return
+
+        selected_row_groups = self._select_row_groups_with_statistics()
+        self.row_groups_scanned = len(selected_row_groups)
+
+        remaining = self.limit
+        for rg_idx in selected_row_groups:
+            table = self._read_row_group_table(rg_idx)
+
+            # Partition columns hold the same value on every row
+            for col, value in self.partition_values.items():
+                column = pa.repeat(value, table.num_rows)
+                index = table.schema.get_field_index(col)
+                if index >= 0:
+                    table = table.set_column(index, col, column)
+                else:
+                    table = table.append_column(col, column)
+
+            if remaining is not None:
+                if table.num_rows >= remaining:
+                    yield table.slice(0, remaining)
+                    return
+                remaining -= table.num_rows
+            yield table
+
     def _read_row_group(self, rg_idx: int) -> Iterator[dict[str, Any]]:
         """
         Read a specific row group
@@ -324,6 +365,22 @@ class ParquetReader(BaseReader):
         Yields:
             Rows as dictionaries
         """
+        # Build rows a slice at a time in C, rather than a Python call per
+        # cell, while still stopping early when a LIMIT is reached
+        table = self._read_row_group_table(rg_idx)
+        for batch in table.to_batches(max_chunksize=ROW_BATCH_SIZE):
+            yield from batch.to_pylist()
+
+    def _read_row_group_table(self, rg_idx: int) -> pa.Table:
+        """
+        Read a specific row group, filtered and with only the required columns
+
+        Args:
+            rg_idx: Row group index to read
+
+        Returns:
+            Arrow table of the row group's matching rows
+        """
         # Determine which columns to read
         # If we have filters, we need to read those columns even if not in required_columns
         columns_to_read = set()
@@ -342,93 +399,30 @@ class ParquetReader(BaseReader):
         # Read row group with column selection
         table = self.parquet_file.read_row_group(rg_idx, columns=columns)
 
-        # Convert to row-oriented format and yield
-        # PyArrow returns columnar data, we need rows
-        num_rows = table.num_rows
-
-        for i in range(num_rows):
-            row = {}
-            for col_name in table.column_names:
-                col_data = table.column(col_name)
-                # Get value at index i
-                value = col_data[i].as_py()  # Convert to Python type
-                row[col_name] = value
-
-            # Apply filter conditions if set
-            # Note: Row group statistics only help us skip entire groups,
-            # but we still need to filter individual rows within selected groups
-            if self.filter_conditions:
-                if not self._matches_filter(row):
-                    continue
-
-            # Apply column selection to output
-            # (we may have read extra columns for filtering)
-            if self.required_columns:
-                row = {k: v for k, v in row.items() if k in self.required_columns}
-
-            yield row
-
-    def _matches_filter(self, row: dict[str, Any]) -> bool:
-        """
-        Check if row matches all filter conditions
-
-        Args:
-            row: Row to check
-
-        Returns:
-            True if row matches all conditions (AND logic)
-        """
-        for condition in self.filter_conditions:
-            if not self._evaluate_condition(row, condition):
-                return False
-        return True
-
-    def _evaluate_condition(self, row: dict[str, Any], condition: Condition) -> bool:
-        """
-        Evaluate a single condition against a row
-
-        Args:
-            row: Row to check
-            condition: Condition to evaluate
-
-        Returns:
-            True if condition is satisfied
-        """
-        # Get column value
-        if condition.column not in row:
-            return False
-
-        value = row[condition.column]
-
-        # Handle NULL values
-        if value is None:
-            return False
-
-        # Evaluate operator
-        op = condition.operator
-        expected = condition.value
+        # Filter the row group with Arrow's vectorized comparisons where they
+        # agree with Python's, leaving any other conditions for each row
+        if self.filter_conditions:
+            mask, remaining = arrow_mask(table, self.filter_conditions)
+            if mask is not None:
+                table = table.filter(mask)
+            if remaining:
+                matches = compile_conditions(remaining)
+                tested = {condition.column for condition in remaining}
+                rows = table.select([name for name in table.column_names if name in tested])
+                keep = [matches(row) for row in rows.to_pylist()]
+                table = table.filter(pa.array(keep, type=pa.bool_()))
+
+        # Drop columns read only for filtering before any rows are built
+        if self.required_columns:
+            table = table.select(
+                [name for name in table.column_names if name in self.required_columns]
+            )
 
-        try:
-            if op == "=":
-                return value == expected
-            elif op == ">":
-                return value > expected
-            elif op == "<":
-                return value < expected
-            elif op == ">=":
-                return value >= expected
-            elif op == "<=":
-                return value <= expected
-            elif op == "!=":
-                return value != expected
-            else:
-                # Unknown operator, conservatively keep row
-                return True
+        return table
 
-        except TypeError:
-            # Type mismatch (e.g., comparing string to int)
-            # This is fine - row just doesn't match
-            return False
+    def row_count_hint(self) -> int:
+        """Row count recorded in the Parquet footer (no data is read)"""
+        return self.parquet_file.metadata.num_rows
 
     def get_schema(self) -> Schema:
         """
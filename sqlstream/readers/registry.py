@@ -0,0 +1,257 @@
+"""
+Reader Registry - single place that maps data formats to reader classes
+
+Centralizes format detection (fragment hint or file extension) and reader
+construction so that `Query` and the pandas executor share one dispatch
+table instead of duplicating if/elif chains.
+
+Reader modules are still imported lazily: each registered factory imports
+its reader class on first call (and memoizes it), so optional dependencies
+(pyarrow, lxml, ...) are only needed for formats that are actually used.
+
+Example:
+    >>> from sqlstream.readers.registry import create_reader, detect_format
+    >>> detect_format("data.parquet")
+    'parquet'
+    >>> reader = create_reader("page.html#html:1")
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+from collections.abc import Callable
+
+from sqlstream.core.fragment_parser import parse_source_fragment
+from sqlstream.readers.base import BaseReader
+
+# File extension -> format name
+SUFFIX_FORMATS: dict[str, str] = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".html": "html",
+    ".htm": "html",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".xml": "xml",
+}
+
+# Bytes read from the start of a file with an unknown extension to detect its format
+SNIFF_BYTES = 512
+
+# Format name -> factory(path, table_hint) returning a reader
+_REGISTRY: dict[str, Callable[[str, int | str | None], BaseReader]] = {}
+
+
+def register(format: str, factory: Callable[[str, int | str | None], BaseReader]) -> None:
+    """
+    Register a reader factory for a format
+
+    Args:
+        format: Format name (e.g. "csv", "parquet")
+        factory: Callable taking (path, table_hint) and returning a reader
+    """
+    _REGISTRY[format] = factory
+
+
+def get_reader_factory(format: str) -> Callable[[str, int | str | None], BaseReader]:
+    """
+    Get the reader factory registered for a format
+
+    Raises:
+        ValueError: If no reader is registered for the format
+    """
+    try:
+        return _REGISTRY[format]
+    except KeyError:
+        raise ValueError(
+            f"No reader registered for format '{format}'. "
+            f"Registered formats: {', '.join(sorted(_REGISTRY))}"
+        ) from None
+
+
+def detect_format(source_path: str, format_hint: str | None = None) -> str | None:
+    """
+    Determine the format of a source
+
+    An explicit format hint (from a URL fragment) takes precedence over
+    the file extension.
+
+    Args:
+        source_path: Path to data file (without fragment)
+        format_hint: Optional explicit format
+
+    Returns:
+        Format name, or None if it can't be determined
+    """
+    if format_hint:
+        return format_hint
+    return SUFFIX_FORMATS.get(_suffix(source_path))
+
+
+def _suffix(path: str) -> str:
+    """Lowercased extension, same as Path(path).suffix.lower() without building a Path"""
+    name = path.rstrip("/").rpartition("/")[2]
+    dot = name.rfind(".")
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+
+
+def sniff_format(path: str) -> str | None:
+    """
+    Guess a local file's format from its leading bytes
+
+    Reads a fixed-size prefix, so the cost doesn't depend on file size.
+
+    Args:
+        path: Path to a local file
+
+    Returns:
+        Format name, or None if the file is remote, unreadable, or unrecognized
+    """
+    if "://" in path:
+        return None
+    try:
+        with open(path, "rb") as f:
+            head = f.read(SNIFF_BYTES)
+    except OSError:
+        return None
+
+    if head.startswith(b"PAR1"):
+        return "parquet"
+
+    lowered = head.lower()
+    if b"<html" in lowered or b"<!doctype html" in lowered or b"<table" in lowered:
+        return "html"
+
+    # Skip a UTF-8 BOM and leading whitespace before the content
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if text.lower().startswith(b"<?xml"):
+        return "xml"
+
+    # Markdown table: pipes plus a header separator row
+    if b"|" in head and b"---" in head:
+        return "markdown"
+
+    if text.startswith(b"[") or (text.startswith(b"{") and b'"records":' in text):
+        return "json"
+
+    # JSONL: several lines that each hold an object
+    lines = text.split(b"\n")
+    if len(lines) > 1 and lines[0].strip().startswith(b"{") and lines[1].strip().startswith(b"{"):
+        return "jsonl"
+
+    return None
+
+
+@functools.cache
+def _reader_class(module: str, name: str) -> type:
+    """
+    Import a reader class on first use
+
+    Memoized so repeated reader creation (one per JOIN table, per query in
+    the shell, ...) skips the import machinery after the first call.
+    """
+    return getattr(importlib.import_module(module), name)
+
+
+def create_reader(source: str) -> BaseReader:
+    """
+    Auto-detect source type and create appropriate reader
+
+    Supports URL fragments: source#format:table
+
+    Args:
+        source: Path to data file or URL, optionally with #format:table fragment
+
+    Returns:
+        Reader instance for the source
+
+    Raises:
+        ValueError: If file format is not supported
+    """
+    # Fast path for the common case: a plain path with a known extension
+    if "#" not in source and not source.startswith(("http://", "https://")):
+        format = SUFFIX_FORMATS.get(_suffix(source))
+        if format is not None:
+            return get_reader_factory(format)(source, None)
+
+    source_path, format_hint, table_hint = parse_source_fragment(source)
+
+    # HTTP/HTTPS URLs download (and cache) the file, then delegate by format
+    if source_path.startswith(("http://", "https://")):
+        HTTPReader = _reader_class("sqlstream.readers.http_reader", "HTTPReader")
+
+        kwargs = {}
+        if format_hint:
+            kwargs["format"] = format_hint
+        if table_hint is not None:
+            kwargs["table"] = table_hint
+        return HTTPReader(source_path, **kwargs)
+
+    format = detect_format(source_path, format_hint)
+    if format is not None:
+        return get_reader_factory(format)(source_path, table_hint)
+
+    # Unknown extension: identify the file from its first bytes
+    format = sniff_format(source_path)
+    if format is not None:
+        return get_reader_factory(format)(source_path, table_hint)
+
+    # Try CSV as default
+    try:
+        return _REGISTRY["csv"](source_path, table_hint)
+    except Exception as e:
+        raise ValueError(
+            f"Unsupported file format: {_suffix(source_path)}. "
+            f"Supported formats: .csv, .parquet, .json, .jsonl, .html, .md, .xml"
+        ) from e
+
+
+def _csv_reader(path: str, table_hint: int | str | None) -> BaseReader:
+    CSVReader = _reader_class("sqlstream.readers.csv_reader", "CSVReader")
+    return CSVReader(path)
+
+
+def _parquet_reader(path: str, table_hint: int | str | None) -> BaseReader:
+    ParquetReader = _reader_class("sqlstream.readers.parquet_reader", "ParquetReader")
+    return ParquetReader(path)
+
+
+def _json_reader(path: str, table_hint: int | str | None) -> BaseReader:
+    JSONReader = _reader_class("sqlstream.readers.json_reader", "JSONReader")
+    # Ensure key is a string for JSON lookups
+    key = str(table_hint) if table_hint is not None else None
+    return JSONReader(path, records_key=key)
+
+
+def _jsonl_reader(path: str, table_hint: int | str | None) -> BaseReader:
+    JSONLReader = _reader_class("sqlstream.readers.jsonl_reader", "JSONLReader")
+    return JSONLReader(path)
+
+
+def _html_reader(path: str, table_hint: int | str | None) -> BaseReader:
+    HTMLReader = _reader_class("sqlstream.readers.html_reader", "HTMLReader")
+    return HTMLReader(path, table=table_hint if table_hint is not None else 0)
+
+
+def _markdown_reader(path: str, table_hint: int | str | None) -> BaseReader:
+    MarkdownReader = _reader_class("sqlstream.readers.markdown_reader", "MarkdownReader")
+    return MarkdownReader(path, table=table_hint if table_hint is not None else 0)
+
+
+def _xml_reader(path: str, table_hint: int | str | None) -> BaseReader:
+    XMLReader = _reader_class("sqlstream.readers.xml_reader", "XMLReader")
+    # For XML, table_hint is used as element name/path
+    element = str(table_hint) if table_hint is not None else None
+    return XMLReader(path, element=element)
+
+
+register("csv", _csv_reader)
+register("parquet", _parquet_reader)
+register("json", _json_reader)
+register("jsonl", _jsonl_reader)
+register("html", _html_reader)
+register("markdown", _markdown_reader)
+register("xml", _xml_reader)
@@ -3,13 +3,16 @@ AST (Abstract Syntax Tree) node definitions for SQL queries
 
 These dataclasses represent the parsed structure of SQL queries.
 Start with a minimal subset supporting SELECT, WHERE, and LIMIT.
+
+Clause nodes use slots, since executors read their fields per row (e.g.
+Condition in filters).
 """
 
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Condition:
     """A single WHERE condition: column operator value"""
 
@@ -21,7 +24,7 @@ class Condition:
         return f"{self.column} {self.operator} {self.value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class WhereClause:
     """WHERE clause containing multiple conditions"""
 
@@ -31,7 +34,7 @@ class WhereClause:
         return " AND ".join(str(c) for c in self.conditions)
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateFunction:
     """
     Represents an aggregate function in SELECT clause
@@ -51,7 +54,7 @@ class AggregateFunction:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderByColumn:
     """
     Represents a column in ORDER BY clause
@@ -67,7 +70,7 @@ class OrderByColumn:
         return f"{self.column} {self.direction}"
 
 
-@dataclass
+@dataclass(slots=True)
 class JoinClause:
     """
     Represents a JOIN clause
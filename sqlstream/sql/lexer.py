@@ -0,0 +1,142 @@
+"""
+SQL Lexer - single-pass tokenizer for locating table sources in raw SQL
+
+Used to discover file paths in queries that are handed to DuckDB as-is
+(CTEs, subqueries, window functions, ...), which the recursive descent
+parser doesn't support, and to rewrite those paths to table names.
+
+Unlike searching the raw text with a FROM/JOIN regex, the lexer skips
+comments and string literals, so `SELECT 'a FROM b'` or `-- FROM old.csv`
+are not mistaken for table sources. Tokenizing is one left-to-right scan
+with a compiled pattern whose alternatives never backtrack into each other.
+
+Example:
+    >>> find_table_sources("SELECT * FROM 'a.csv' JOIN b.parquet ON a.id = b.id")
+    [('a.csv', True), ('b.parquet', False)]
+"""
+
+import re
+from collections.abc import Callable, Iterator
+
+# One alternative per token kind, tried in order at each position
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<comment>--[^\n]*|/\*.*?(?:\*/|\Z))
+    | (?P<string>'(?:[^']|'')*'|"(?:[^"]|"")*")
+    | (?P<word>[^\s,()'";]+)
+    | (?P<punct>[,();])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Keywords that introduce a table source
+_SOURCE_KEYWORDS = frozenset({"FROM", "JOIN"})
+
+# Keywords that start a subquery inside parentheses
+_SUBQUERY_KEYWORDS = frozenset({"SELECT", "WITH"})
+
+
+def tokenize(sql: str) -> Iterator[tuple[str, str]]:
+    """
+    Split SQL into (kind, text) tokens, dropping comments
+
+    Kinds are "string" (quoted, quotes included), "word", and "punct".
+
+    Args:
+        sql: SQL query text
+
+    Yields:
+        (kind, text) tuples in order of appearance
+    """
+    for match in _TOKEN_RE.finditer(sql):
+        kind = match.lastgroup
+        if kind != "comment":
+            yield kind, match.group()
+
+
+def substitute_tokens(sql: str, replace: Callable[[str, str], str]) -> str:
+    """
+    Rewrite the tokens of a SQL query
+
+    Tokens are the same as tokenize()'s. Comments and the text between
+    tokens are kept as they are, so a comment is never rewritten.
+
+    Args:
+        sql: SQL query text
+        replace: Called with each token's (kind, text); returns its replacement
+
+    Returns:
+        SQL with every token replaced
+    """
+
+    def substitute(match: re.Match) -> str:
+        kind = match.lastgroup
+        if kind == "comment":
+            return match.group()
+        return replace(kind, match.group())
+
+    return _TOKEN_RE.sub(substitute, sql)
+
+
+def find_table_sources(sql: str) -> list[tuple[str, bool]]:
+    """
+    Find the table sources that follow FROM / JOIN in a SQL query
+
+    FROM inside function calls (e.g. `EXTRACT(YEAR FROM ts)`) is ignored;
+    FROM inside subqueries is not. Table functions (`FROM read_csv(...)`)
+    are not reported.
+
+    Args:
+        sql: SQL query text
+
+    Returns:
+        List of (source, quoted) tuples in order of appearance. Quoted
+        sources have their quotes removed; unquoted ones may still be table
+        names or aliases and are left for the caller to filter.
+    """
+    sources = []
+
+    # One entry per open parenthesis: can FROM/JOIN in this scope name a table?
+    scopes = [True]
+
+    # Tokens are streamed, so decisions that depend on the next token are
+    # held until it arrives
+    prev = ""  # upper-cased text of the previous token
+    opened_after_source = None  # "(" just seen: did it follow FROM/JOIN?
+    expect_source = False  # FROM/JOIN just seen: the next token may be a source
+    unquoted = None  # unquoted source, kept unless the next token is "("
+
+    for kind, text in tokenize(sql):
+        upper = text.upper()
+
+        if opened_after_source is not None:
+            scopes.append(opened_after_source or upper in _SUBQUERY_KEYWORDS)
+            opened_after_source = None
+
+        if unquoted is not None:
+            # Skip table functions like read_csv('...')
+            if text != "(":
+                sources.append((unquoted, False))
+            unquoted = None
+
+        if expect_source:
+            expect_source = False
+            if kind == "string":
+                sources.append((text[1:-1], True))
+            elif kind == "word":
+                unquoted = text
+
+        if text == "(":
+            opened_after_source = prev in _SOURCE_KEYWORDS
+        elif text == ")":
+            if len(scopes) > 1:
+                scopes.pop()
+        elif kind == "word" and upper in _SOURCE_KEYWORDS and scopes[-1]:
+            expect_source = True
+
+        prev = upper
+
+    if unquoted is not None:
+        sources.append((unquoted, False))
+
+    return sources
@@ -0,0 +1,202 @@
+"""
+Row predicates compiled from WHERE conditions
+
+Used by the Filter operator and by readers that apply pushed-down filters,
+so a condition's column, operator and value are resolved once per scan
+instead of being re-dispatched for every row. Arrow-backed data can instead
+be filtered with a vectorized mask (arrow_mask).
+"""
+
+import operator
+from collections.abc import Callable
+from typing import Any
+
+from sqlstream.sql.ast_nodes import Condition
+
+Predicate = Callable[[dict[str, Any]], bool]
+
+# WHERE comparison operator -> comparison function
+_COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    "=": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "!=": operator.ne,
+}
+
+# WHERE comparison operators the predicates evaluate
+COMPARISON_OPERATORS = frozenset(_COMPARISONS)
+
+# WHERE comparison operator -> Python source for the same comparison
+_OPERATOR_SOURCE: dict[str, str] = {
+    "=": "==",
+    ">": ">",
+    "<": "<",
+    ">=": ">=",
+    "<=": "<=",
+    "!=": "!=",
+}
+
+
+def compile_condition(condition: Condition) -> Predicate:
+    """
+    Build a row predicate for a condition
+
+    Evaluating a row is then one lookup and one comparison. Missing columns,
+    NULL values and type mismatches never match; an unknown operator
+    matches every row.
+
+    Args:
+        condition: Condition to compile
+
+    Returns:
+        Function that takes a row and returns True if it satisfies the condition
+    """
+    column = condition.column
+    expected = condition.value
+    compare = _COMPARISONS.get(condition.operator)
+
+    def predicate(row: dict[str, Any]) -> bool:
+        value = row.get(column)
+        if value is None:
+            return False
+
+        if compare is None:
+            return True
+
+        try:
+            return compare(value, expected)
+        except TypeError:
+            # Type mismatch (e.g., comparing string to int)
+            return False
+
+    return predicate
+
+
+def compile_conditions(conditions: list[Condition]) -> Predicate:
+    """
+    Build a single row predicate for conditions AND'd together
+
+    The conditions are fused into one generated function, so a row costs a
+    single call however many conditions there are, and each column is looked
+    up once however many conditions test it (e.g. a range). Columns and values
+    are bound as names rather than spliced into the source, so any value type
+    works. Each condition keeps the semantics of compile_condition().
+
+    Args:
+        conditions: Conditions to compile
+
+    Returns:
+        Function that takes a row and returns True if it satisfies every condition
+    """
+    namespace: dict[str, Any] = {}
+    # Column -> local variable holding its (already NULL-checked) value
+    fetched: dict[str, str] = {}
+    lines = ["def predicate(row):", "    try:"]
+    for i, condition in enumerate(conditions):
+        namespace[f"e{i}"] = condition.value
+        op = _OPERATOR_SOURCE.get(condition.operator)
+
+        checks = []
+        value = fetched.get(condition.column)
+        if value is None:
+            value = fetched[condition.column] = f"v{len(fetched)}"
+            namespace[f"c{i}"] = condition.column
+            lines.append(f"        {value} = row.get(c{i})")
+            # Missing columns and NULL values fail, even for unknown operators
+            checks.append(f"{value} is None")
+        if op is not None:
+            checks.append(f"not {value} {op} e{i}")
+
+        if checks:
+            lines.append(f"        if {' or '.join(checks)}:")
+            lines.append("            return False")
+    lines.extend(
+        [
+            "        return True",
+            "    except TypeError:",
+            "        return False",
+        ]
+    )
+
+    exec(compile("\n".join(lines), "<where>", "exec"), namespace)
+    return namespace["predicate"]
+
+
+# WHERE comparison operator -> pyarrow.compute function
+_ARROW_COMPARISONS: dict[str, str] = {
+    "=": "equal",
+    ">": "greater",
+    "<": "less",
+    ">=": "greater_equal",
+    "<=": "less_equal",
+    "!=": "not_equal",
+}
+
+
+def _arrow_comparable(arrow_type: Any, value: Any) -> bool:
+    """Check Arrow compares a column of this type with value exactly as Python would"""
+    import pyarrow as pa
+
+    if isinstance(value, bool):
+        return pa.types.is_boolean(arrow_type)
+    if isinstance(value, int):
+        # Integers beyond 2**53 would lose precision against a float column
+        return pa.types.is_integer(arrow_type) or (
+            pa.types.is_floating(arrow_type) and abs(value) <= 2**53
+        )
+    if isinstance(value, float):
+        return pa.types.is_floating(arrow_type)
+    if isinstance(value, str):
+        return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+    return False
+
+
+def arrow_mask(batch: Any, conditions: list[Condition]) -> tuple[Any, list[Condition]]:
+    """
+    Evaluate conditions over an Arrow table or record batch as one vectorized mask
+
+    Only conditions Arrow evaluates exactly as compile_condition() would are
+    included: numeric, string and boolean columns compared with a literal of
+    the same kind. The rest are returned for row-by-row evaluation.
+
+    Args:
+        batch: pyarrow Table or RecordBatch
+        conditions: Conditions AND'd together
+
+    Returns:
+        Tuple of (boolean mask, or None if no condition could be vectorized,
+        conditions left to evaluate per row)
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    schema = batch.schema
+    mask = None
+    remaining = []
+
+    for condition in conditions:
+        function = _ARROW_COMPARISONS.get(condition.operator)
+        # -1 when the column is missing (or ambiguous)
+        index = schema.get_field_index(condition.column)
+        if (
+            function is None
+            or index < 0
+            or not _arrow_comparable(schema.field(index).type, condition.value)
+        ):
+            remaining.append(condition)
+            continue
+
+        try:
+            result = pc.call_function(function, [batch.column(index), condition.value])
+        except (TypeError, pa.ArrowException):
+            # e.g. a literal outside the column type's range
+            remaining.append(condition)
+            continue
+
+        # NULL values never match
+        result = pc.fill_null(result, False)
+        mask = result if mask is None else pc.and_(mask, result)
+
+    return mask, remaining
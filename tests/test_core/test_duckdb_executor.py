@@ -77,6 +77,19 @@ class TestDuckDBBackendBasic:
         expected_avg = (75000 + 65000 + 85000 + 70000) / 4
         assert result[0]["avg_sal"] == expected_avg
 
+    def test_rows_fetched_in_batches(self, sample_csv):
+        """Test results spanning several fetch batches come back complete and in order"""
+        from sqlstream.core.duckdb_executor import DuckDBExecutor
+
+        with DuckDBExecutor() as executor:
+            rows = executor.execute_raw(
+                f"SELECT id FROM '{sample_csv}' ORDER BY id",
+                {"data": str(sample_csv)},
+                use_dataframes=False,
+                batch_size=3,
+            )
+            assert [r["id"] for r in rows] == [1, 2, 3, 4]
+
 
 class TestDuckDBAdvancedFeatures:
     """Test advanced SQL features only supported by DuckDB"""
@@ -133,6 +146,32 @@ class TestDuckDBAdvancedFeatures:
         assert result[0]["dept"] == "Eng"
         assert result[0]["count"] == 2
 
+    def test_from_in_comment_and_string(self, employees_csv):
+        """Test FROM inside comments and string literals isn't taken as a source"""
+        sql = f"""
+            -- previously: SELECT * FROM old/employees.csv
+            SELECT name, 'from a.csv' AS note FROM '{employees_csv}' WHERE dept = 'Eng'
+        """
+        result = query(str(employees_csv)).sql(sql, backend="duckdb")
+
+        assert [t.source for t in result._discover_sources()] == [str(employees_csv)]
+        assert len(result.to_list()) == 3
+
+    def test_plain_table_name_skips_lexer(self, employees_csv, monkeypatch):
+        """Test SQL that can't name a file falls back to the main source without lexing"""
+        from sqlstream.core import query as query_module
+
+        def fail(sql):
+            raise AssertionError("lexer should not run")
+
+        monkeypatch.setattr(query_module, "find_table_sources", fail)
+        result = query(str(employees_csv)).sql(
+            "SELECT name FROM employees WHERE salary > 95000", backend="duckdb"
+        )
+
+        assert [t.source for t in result._discover_sources()] == [str(employees_csv)]
+        assert sorted(r["name"] for r in result) == ["Alice", "Eve"]
+
 
 class TestDuckDBJoins:
     """Test JOINs with multiple files using DuckDB backend"""
@@ -171,6 +210,161 @@ class TestDuckDBJoins:
         amounts = sorted([r["amount"] for r in alice_orders])
         assert amounts == [100, 150]
 
+    def test_self_join_registers_file_once(self, orders_csv):
+        """Test a file referenced twice is discovered (and loaded) once"""
+        sql = f"""
+            SELECT a.order_id, b.order_id AS other_id
+            FROM '{orders_csv}' a
+            JOIN '{orders_csv}' b ON a.customer_id = b.customer_id AND a.order_id < b.order_id
+        """
+        result = query(str(orders_csv)).sql(sql, backend="duckdb")
+
+        assert [t.source for t in result._discover_sources()] == [str(orders_csv)]
+        assert result.to_list() == [{"order_id": 101, "other_id": 103}]
+
+    def test_same_file_names_get_unique_tables(self, tmp_path):
+        """Test clashing file names never overwrite each other's table"""
+        sql = (
+            "SELECT * FROM 'a.csv' JOIN 'sub/a.csv' ON a.id = a_1.id "
+            "JOIN 'a_1.csv' ON a.id = a_1_1.id JOIN 'b/a.csv' ON a.id = a_2.id"
+        )
+        result = query().sql(sql, backend="duckdb")
+
+        assert {t.name: t.source for t in result._discover_sources()} == {
+            "a": "a.csv",
+            "a_1": "sub/a.csv",
+            "a_1_1": "a_1.csv",
+            "a_2": "b/a.csv",
+        }
+
+
+class TestDuckDBNativeScans:
+    """Test local Parquet files are scanned by DuckDB instead of a Reader"""
+
+    def test_parquet_skips_reader(self, tmp_path):
+        """Test Parquet sources become DuckDB views while other formats still use readers"""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        from sqlstream.core.duckdb_executor import DuckDBExecutor
+        from sqlstream.readers.registry import create_reader
+
+        parquet_file = tmp_path / "orders.parquet"
+        pq.write_table(
+            pa.table({"customer_id": [1, 2, 1], "amount": [100, 200, 150]}), parquet_file
+        )
+        jsonl_file = tmp_path / "customers.jsonl"
+        jsonl_file.write_text('{"id": 1, "name": "Alice"}\n{"id": 2, "name": "Bob"}\n')
+
+        created = []
+
+        def reader_factory(source):
+            created.append(source)
+            return create_reader(source)
+
+        sql = f"""
+            SELECT c.name, SUM(o.amount) AS total
+            FROM '{jsonl_file}' c JOIN '{parquet_file}' o ON c.id = o.customer_id
+            GROUP BY c.name ORDER BY c.name
+        """
+        with DuckDBExecutor() as executor:
+            rows = list(
+                executor.execute_raw(
+                    sql,
+                    {"customers": str(jsonl_file), "orders": str(parquet_file)},
+                    reader_factory=reader_factory,
+                )
+            )
+
+        assert rows == [{"name": "Alice", "total": 250}, {"name": "Bob", "total": 200}]
+        assert created == [str(jsonl_file)]
+
+    def test_csv_loaded_once(self, tmp_path):
+        """Test repeated queries over a CSV reuse the source cache"""
+        pytest.importorskip("pyarrow")
+        from sqlstream.core.source_cache import cache_info, clear_cache
+
+        csv_file = tmp_path / "scores.csv"
+        csv_file.write_text("id,score\n1,3.5\n2,\n3,4\n")
+        sql = f"SELECT id, score FROM '{csv_file}' ORDER BY id"
+
+        clear_cache()
+        first = query(str(csv_file)).sql(sql, backend="duckdb").to_list()
+        entries = cache_info()["entries"]
+        second = query(str(csv_file)).sql(sql, backend="duckdb").to_list()
+
+        assert entries == 1
+        assert cache_info()["entries"] == 1
+        assert (
+            first
+            == second
+            == [
+                {"id": 1, "score": 3.5},
+                {"id": 2, "score": None},
+                {"id": 3, "score": 4.0},
+            ]
+        )
+
+    def test_partitioned_directory(self, tmp_path):
+        """Test a Hive-partitioned Parquet directory is queried with its partition column"""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        for year, ids in ((2023, [1, 2]), (2024, [3])):
+            partition = tmp_path / "sales" / f"year={year}"
+            partition.mkdir(parents=True)
+            pq.write_table(pa.table({"id": ids}), partition / "part-0.parquet")
+
+        dataset = tmp_path / "sales"
+        result = query().sql(
+            f"SELECT id, year FROM '{dataset}' WHERE year = 2024", backend="duckdb"
+        )
+
+        assert result.to_list() == [{"id": 3, "year": 2024}]
+        assert "year" in result.explain()
+
+
+class TestSourceReplacement:
+    """Test file paths in SQL are rewritten to registered table names"""
+
+    def test_quoted_unquoted_and_nested_paths(self):
+        """Test each form is replaced, and a path inside a longer one is left alone"""
+        from sqlstream.core.duckdb_executor import DuckDBExecutor
+        from sqlstream.core.fragment_parser import SourceTable
+
+        sources = [
+            SourceTable.from_source("a.csv"),
+            SourceTable.from_source("data/a.csv", name="a_1"),
+            SourceTable.from_source("page.html#html:1"),
+        ]
+        sql = (
+            'SELECT * FROM a.csv JOIN "data/a.csv" ON a.id = a_1.id '
+            "JOIN 'page.html#html:1' p ON p.id = a.id WHERE a.note = 'a.csv, b'"
+        )
+
+        with DuckDBExecutor() as executor:
+            result = executor._replace_sources_in_sql(sql, sources)
+
+        assert result == (
+            'SELECT * FROM "a" JOIN "a_1" ON a.id = a_1.id '
+            "JOIN \"page_1\" p ON p.id = a.id WHERE a.note = 'a.csv, b'"
+        )
+
+    def test_comments_and_escaped_literals_left_alone(self):
+        """Test paths inside comments or literals with '' escapes are not rewritten"""
+        from sqlstream.core.duckdb_executor import DuckDBExecutor
+        from sqlstream.core.fragment_parser import SourceTable
+
+        sources = [SourceTable.from_source("a.csv")]
+        sql = "SELECT * FROM a.csv -- was a.csv\n/* FROM 'a.csv' */ WHERE note = 'it''s a.csv'"
+
+        with DuckDBExecutor() as executor:
+            result = executor._replace_sources_in_sql(sql, sources)
+
+        assert result == (
+            "SELECT * FROM \"a\" -- was a.csv\n/* FROM 'a.csv' */ WHERE note = 'it''s a.csv'"
+        )
+
 
 class TestBackendSelection:
     """Test backend selection logic"""
@@ -188,6 +382,19 @@ class TestBackendSelection:
         assert q.use_pandas is False
         assert isinstance(q.executor, object)  # Should be DuckDBExecutor
 
+    def test_explicit_duckdb_skips_parser(self, sample_csv, monkeypatch):
+        """Test a query forced onto DuckDB is never run through the custom parser"""
+        from sqlstream.core import query as query_module
+
+        def fail(sql):
+            raise AssertionError("parser should not run")
+
+        monkeypatch.setattr(query_module, "_parse", fail)
+        q = query(str(sample_csv)).sql(f"SELECT * FROM '{sample_csv}'", backend="duckdb")
+
+        assert q.ast is None
+        assert q.to_list() == [{"id": 1, "val": 10}]
+
     def test_auto_priority(self, sample_csv):
         """Test auto priority (Pandas > DuckDB > Python)"""
         # This depends on what is installed in the environment
@@ -199,3 +406,29 @@ class TestBackendSelection:
         elif DUCKDB_AVAILABLE:
             assert q.use_duckdb is True
             assert q.use_pandas is False
+
+    def test_executor_shared_between_queries(self, sample_csv, tmp_path):
+        """Test queries share one DuckDB executor without leaking tables"""
+        other_csv = tmp_path / "other.csv"
+        other_csv.write_text("id,val\n2,20\n")
+
+        first = query(str(sample_csv)).sql(f"SELECT * FROM '{sample_csv}'", backend="duckdb")
+        second = query(str(other_csv)).sql(f"SELECT * FROM '{other_csv}'", backend="duckdb")
+
+        assert first.executor is second.executor
+        assert first.to_list() == [{"id": 1, "val": 10}]
+        assert second.to_list() == [{"id": 2, "val": 20}]
+
+        # Tables registered for a query are dropped with its cursor
+        tables = first.executor.conn.execute("SHOW TABLES").fetchall()
+        assert tables == []
+
+    def test_closing_shared_executor_keeps_it_usable(self, sample_csv):
+        """Test closing one result's executor doesn't break later queries"""
+        sql = f"SELECT * FROM '{sample_csv}'"
+
+        with query(str(sample_csv)).sql(sql, backend="duckdb").executor:
+            pass
+        query(str(sample_csv)).sql(sql, backend="duckdb").executor.close()
+
+        assert query(str(sample_csv)).sql(sql, backend="duckdb").to_list() == [{"id": 1, "val": 10}]
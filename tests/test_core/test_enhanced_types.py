@@ -55,6 +55,28 @@ class TestDatetimeParsing:
         assert parse_datetime("not a datetime") is None
         assert parse_datetime("2024-13-01 00:00:00") is None
 
+    def test_lenient_separators(self):
+        """strptime leniency (case, runs of whitespace, unpadded fields) is kept"""
+        assert parse_datetime("2024-01-15t10:30:00") == datetime(2024, 1, 15, 10, 30, 0)
+        assert parse_datetime("2024-01-15   10:30") == datetime(2024, 1, 15, 10, 30, 0)
+        assert parse_datetime("1/5/2024 9:05:00") == datetime(2024, 5, 1, 9, 5, 0)
+        assert parse_time("2:30 pm") == time(14, 30, 0)
+
+    def test_iso_forms_outside_formats(self):
+        """ISO forms fromisoformat accepts but the format list doesn't stay unparsed"""
+        assert parse_datetime("2024-01-15") is None
+        assert parse_datetime("2024-01-15T10:30") is None
+        assert parse_datetime("2024-01-15T10:30:00+05:00") is None
+        assert parse_time("1430") is None
+
+    def test_falls_through_to_next_format(self):
+        """A value invalid in one format is tried in the next, as with strptime"""
+        # Month 25 rules out the EU reading, so it parses as US
+        assert parse_datetime("01/25/2024 10:30") == datetime(2024, 1, 25, 10, 30)
+        assert parse_datetime("31/02/2024 10:30") is None
+        assert parse_datetime("20240115103000") == datetime(2024, 1, 15, 10, 30, 0)
+        assert parse_time("14:30:00.12") == time(14, 30, 0, 120000)
+
 
 class TestDateParsing:
     """Test date parsing with multiple formats."""
@@ -141,6 +163,12 @@ class TestJSONDetection:
     def test_invalid_json(self):
         assert is_json_string("{invalid json}") is False
 
+    def test_not_json_unclosed_or_trailing(self):
+        assert is_json_string("[not closed") is False
+        assert is_json_string("[1, 2] extra") is False
+        assert is_json_string("{}{}") is False
+        assert is_json_string("  [1]  ") is True
+
     def test_non_string(self):
         assert is_json_string(42) is False
         assert is_json_string(None) is False
@@ -179,6 +207,25 @@ class TestTypeInference:
         assert infer_type("42") == DataType.INTEGER
         assert infer_type(42) == DataType.INTEGER
 
+    def test_infer_other_numerals(self):
+        # Forms int()/float() accept beyond plain digits and decimals
+        assert infer_type("1_000") == DataType.INTEGER
+        assert infer_type("+7") == DataType.INTEGER
+        assert infer_type("1e5") == DataType.FLOAT
+        assert infer_type("5.") == DataType.FLOAT
+        assert infer_type("-inf") == DataType.FLOAT
+        assert infer_type("NaN") == DataType.FLOAT
+        assert infer_type("5-") == DataType.STRING
+
+    def test_repeated_strings_cached(self):
+        from sqlstream.core.types import _infer_string_type
+
+        assert infer_type("2024-03-09") == DataType.DATE
+        hits = _infer_string_type.cache_info().hits
+
+        assert infer_type("2024-03-09") == DataType.DATE
+        assert _infer_string_type.cache_info().hits == hits + 1
+
     def test_infer_json(self):
         assert infer_type('{"name": "Alice"}') == DataType.JSON
         assert infer_type("[1, 2, 3]") == DataType.JSON
@@ -221,6 +268,13 @@ class TestTypeConversion:
         assert isinstance(result, Decimal)
         assert result == Decimal("99.9999999")
 
+    def test_convert_trailing_zeros_stay_float(self):
+        # Trailing zeros don't count towards decimal precision
+        result = infer_type_from_string("1.5000000000")
+        assert isinstance(result, float)
+        assert result == 1.5
+        assert isinstance(infer_type_from_string("1.1234567000"), Decimal)
+
     def test_convert_float(self):
         result = infer_type_from_string("3.14")
         assert isinstance(result, float)
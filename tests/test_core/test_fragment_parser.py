@@ -6,6 +6,7 @@ import pytest
 
 from sqlstream.core.fragment_parser import (
     FragmentParseError,
+    SourceTable,
     build_source_fragment,
     parse_source_fragment,
 )
@@ -93,6 +94,59 @@ class TestFragmentParser:
         result = build_source_fragment("data.csv")
         assert result == "data.csv"
 
+    def test_parse_is_memoized(self):
+        """Test repeated sources are parsed once"""
+        parse_source_fragment("memo.html#html:2")
+        hits = parse_source_fragment.cache_info().hits
+
+        assert parse_source_fragment("memo.html#html:2") == ("memo.html", "html", 2)
+        assert parse_source_fragment.cache_info().hits == hits + 1
+
+
+class TestSourceTable:
+    """Test SourceTable construction"""
+
+    def test_from_source_parses_fragment(self):
+        """Test fragment fields are parsed once into the table"""
+        table = SourceTable.from_source("data/my-report.html#html:1")
+
+        assert table.name == "my_report_1"
+        assert table.source == "data/my-report.html#html:1"
+        assert table.path == "data/my-report.html"
+        assert table.format == "html"
+        assert table.table_hint == 1
+
+    def test_explicit_name(self):
+        """Test an explicit name overrides the derived one"""
+        table = SourceTable.from_source("s3://bucket/sales.parquet", name="sales_2024")
+
+        assert table.name == "sales_2024"
+        assert table.base_name() == "sales"
+        assert table.format is None
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "sales.csv",
+            "/data/sales.csv",
+            "s3://bucket/a/b/logs.tar.gz",
+            ".env",
+            "..a.b",
+            "dir/",
+            "x",
+        ],
+    )
+    def test_base_name_matches_os_path(self, path):
+        """Test base names agree with os.path.splitext/basename"""
+        import os
+
+        expected = os.path.splitext(os.path.basename(path))[0]
+        assert SourceTable.from_source(path, name="t").base_name() == expected.replace(".", "_")
+
+    def test_base_name_windows_path(self):
+        """Test backslash-separated paths are split on any platform"""
+        assert SourceTable.from_source(r"C:\data\sales.csv").name == "sales"
+
 
 class TestFragmentIntegration:
     """Test fragment integration with query engine"""
@@ -150,5 +204,5 @@ class TestFragmentIntegration:
         assert len(sources) > 0
         # Check that a source with the fragment was discovered
         assert any(
-            "markdown" in str(path).lower() or "sample_data" in path for path in sources.values()
+            "markdown" in table.source.lower() or "sample_data" in table.path for table in sources
         )
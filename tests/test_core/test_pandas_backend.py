@@ -99,6 +99,29 @@ class TestPandasBackendBasic:
 
         assert len(python_result) == len(pandas_result) == 2
 
+    def test_where_with_projection(self, sample_csv):
+        """Test WHERE + column selection (fused filter/project)"""
+        pandas_result = (
+            query(str(sample_csv))
+            .sql(f"SELECT name FROM {sample_csv} WHERE age > 28", backend="pandas")
+            .to_list()
+        )
+
+        assert pandas_result == [{"name": "Alice"}, {"name": "Charlie"}]
+
+    def test_where_with_order_by_unselected_column(self, sample_csv):
+        """Test ORDER BY on a column that is filtered out of the SELECT list"""
+        pandas_result = (
+            query(str(sample_csv))
+            .sql(
+                f"SELECT name FROM {sample_csv} WHERE age > 26 ORDER BY salary DESC",
+                backend="pandas",
+            )
+            .to_list()
+        )
+
+        assert pandas_result == [{"name": "Charlie"}, {"name": "Alice"}, {"name": "David"}]
+
 
 class TestPandasBackendGroupBy:
     """Test GROUP BY with pandas backend"""
@@ -157,6 +180,150 @@ class TestPandasBackendGroupBy:
 
         assert len(python_result) == len(pandas_result) == 2
 
+    def test_groupby_repeated_execution(self, sales_csv):
+        """Test re-iterating a GROUP BY result gives the same rows"""
+        result = query(str(sales_csv)).sql(
+            f"SELECT region, COUNT(product) AS n, SUM(sales) FROM {sales_csv} GROUP BY region",
+            backend="pandas",
+        )
+
+        first = result.to_list()
+        second = result.to_list()
+
+        assert first == second
+        assert sorted((r["region"], r["n"], r["sum_sales"]) for r in first) == [
+            ("East", 3, 330),
+            ("West", 2, 320),
+        ]
+
+    def test_groupby_multiple_string_keys(self, sales_csv):
+        """Test GROUP BY on several string keys only yields observed combinations"""
+        pandas_result = (
+            query(str(sales_csv))
+            .sql(
+                f"SELECT region, product, SUM(sales) FROM {sales_csv} GROUP BY region, product",
+                backend="pandas",
+            )
+            .to_list()
+        )
+
+        sums = {(r["region"], r["product"]): r["sum_sales"] for r in pandas_result}
+        assert sums == {
+            ("East", "A"): 180,
+            ("East", "B"): 150,
+            ("West", "A"): 200,
+            ("West", "B"): 120,
+        }
+        assert all(isinstance(r["region"], str) for r in pandas_result)
+
+    def test_groupby_string_key_first_column(self, sales_csv):
+        """Test aggregates over a string key (COUNT(*) counts the first column) keep their types"""
+        count_result = (
+            query(str(sales_csv))
+            .sql(f"SELECT region, COUNT(*) AS n FROM {sales_csv} GROUP BY region", backend="pandas")
+            .to_list()
+        )
+        min_result = (
+            query(str(sales_csv))
+            .sql(
+                f"SELECT region, MIN(region) AS first FROM {sales_csv} GROUP BY region",
+                backend="pandas",
+            )
+            .to_list()
+        )
+
+        assert [r["n"] for r in count_result] == [3, 2]
+        assert [r["first"] for r in min_result] == ["East", "West"]
+
+    def test_groupby_count_star_then_aggregate_on_same_column(self, sales_csv):
+        """Test a later aggregate on the column COUNT(*) counts takes precedence"""
+        pandas_result = (
+            query(str(sales_csv))
+            .sql(
+                f"SELECT region, COUNT(*) AS n, MIN(region) AS first FROM {sales_csv} "
+                "GROUP BY region",
+                backend="pandas",
+            )
+            .to_list()
+        )
+
+        assert [r["first"] for r in pandas_result] == ["East", "West"]
+
+
+class TestPandasBackendNumbaGroupBy:
+    """Test GROUP BY through pandas' numba engine"""
+
+    @pytest.fixture
+    def sales_csv(self, tmp_path):
+        """Create sales CSV file with float values"""
+        csv_file = tmp_path / "sales.csv"
+        csv_file.write_text(
+            "region,sales,qty,price\n"
+            "East,100.5,2,1.5\n"
+            "East,150.0,1,2.5\n"
+            "West,200.25,4,3.0\n"
+            "West,120.0,3,0.5\n"
+            "East,80.5,5,4.0\n"
+        )
+        return csv_file
+
+    def test_numba_matches_default_engine(self, sales_csv, monkeypatch):
+        """Test numba aggregations match the Cython path"""
+        pytest.importorskip("numba")
+        from sqlstream.core import pandas_executor
+
+        sql = (
+            f"SELECT region, SUM(sales) AS total, COUNT(qty) AS n, MAX(price) AS top "
+            f"FROM {sales_csv} GROUP BY region ORDER BY region"
+        )
+        expected = query(str(sales_csv)).sql(sql, backend="pandas").to_list()
+
+        monkeypatch.setattr(pandas_executor, "NUMBA_GROUPBY_THRESHOLD", 0)
+        result = query(str(sales_csv)).sql(sql, backend="pandas").to_list()
+
+        assert result == expected
+
+
+class TestPandasBackendDuckDBIngest:
+    """Test CSV files parsed by DuckDB's reader for the pandas backend"""
+
+    @pytest.fixture
+    def mixed_csv(self, tmp_path):
+        """Create CSV file with missing values in every column type"""
+        csv_file = tmp_path / "mixed.csv"
+        csv_file.write_text(
+            "id,name,joined,score,active,note\n"
+            "1,Alice,2024-01-05,1.5,true,NA\n"
+            "2,,2024-02-01,,false,x\n"
+            "3,Carol,,2.0,,null\n"
+        )
+        return csv_file
+
+    def test_matches_pandas_reader(self, mixed_csv, monkeypatch):
+        """Test DuckDB-parsed CSVs give the same rows and types as pandas"""
+        pytest.importorskip("duckdb")
+        from sqlstream.core import source_cache
+        from sqlstream.readers import csv_reader
+
+        sql = f"SELECT * FROM {mixed_csv} WHERE id > 0"
+        source_cache.clear_cache()
+        via_duckdb = query(str(mixed_csv)).sql(sql, backend="pandas").to_list()
+
+        monkeypatch.setattr(csv_reader, "DUCKDB_AVAILABLE", False)
+        source_cache.clear_cache()
+        via_pandas = query(str(mixed_csv)).sql(sql, backend="pandas").to_list()
+
+        assert len(via_duckdb) == len(via_pandas) == 3
+        for duck_row, pandas_row in zip(via_duckdb, via_pandas, strict=True):
+            assert duck_row.keys() == pandas_row.keys()
+            for key in duck_row:
+                duck_value, pandas_value = duck_row[key], pandas_row[key]
+                if pd.isna(pandas_value):
+                    assert pd.isna(duck_value)
+                else:
+                    assert duck_value == pandas_value
+                    assert type(duck_value) is type(pandas_value)
+
 
 class TestPandasBackendOrderBy:
     """Test ORDER BY with pandas backend"""
@@ -201,6 +368,118 @@ class TestPandasBackendOrderBy:
         ages = [r["age"] for r in pandas_result]
         assert ages == [35, 30, 28, 25]
 
+    def test_order_by_with_limit(self, sample_csv):
+        """Test ORDER BY + LIMIT (top-K) matches python backend"""
+        for direction in ("ASC", "DESC"):
+            sql = f"SELECT name, age FROM {sample_csv} ORDER BY age {direction} LIMIT 2"
+            python_result = query(str(sample_csv)).sql(sql, backend="python").to_list()
+            pandas_result = query(str(sample_csv)).sql(sql, backend="pandas").to_list()
+
+            assert [r["name"] for r in pandas_result] == [r["name"] for r in python_result]
+
+    def test_order_by_with_limit_nulls_last(self, tmp_path):
+        """Test top-K keeps NULLs last when the limit exceeds non-null rows"""
+        csv_file = tmp_path / "nulls.csv"
+        csv_file.write_text("name,age\nAlice,30\nBob,\nCharlie,25\n")
+
+        pandas_result = (
+            query(str(csv_file))
+            .sql(f"SELECT name FROM {csv_file} ORDER BY age ASC LIMIT 3", backend="pandas")
+            .to_list()
+        )
+
+        assert [r["name"] for r in pandas_result] == ["Charlie", "Alice", "Bob"]
+
+    def test_order_by_numeric_with_limit_ties(self, tmp_path):
+        """Test single-column numeric top-K keeps the earliest rows on ties"""
+        csv_file = tmp_path / "scores.csv"
+        rows = [f"p{i},{i % 7}" for i in range(50)]
+        csv_file.write_text("name,score\n" + "\n".join(rows) + "\n")
+
+        for direction in ("ASC", "DESC"):
+            sql = f"SELECT name, score FROM {csv_file} ORDER BY score {direction} LIMIT 10"
+            python_result = query(str(csv_file)).sql(sql, backend="python").to_list()
+            pandas_result = query(str(csv_file)).sql(sql, backend="pandas").to_list()
+
+            assert pandas_result == python_result
+
+
+class TestPandasBackendStreaming:
+    """Test chunked execution of filter/project/limit queries"""
+
+    @pytest.fixture
+    def small_chunks(self, monkeypatch):
+        """Force tiny chunks so queries span several of them"""
+        from sqlstream.core import pandas_executor
+
+        monkeypatch.setattr(pandas_executor, "STREAMING_CHUNK_ROWS", 3)
+
+    @pytest.fixture
+    def numbers_csv(self, tmp_path):
+        """Create CSV file with ten rows"""
+        csv_file = tmp_path / "numbers.csv"
+        rows = [f"{i},n{i},{i * 10}" for i in range(10)]
+        csv_file.write_text("id,name,value\n" + "\n".join(rows) + "\n")
+        return csv_file
+
+    def test_where_limit_across_chunks(self, numbers_csv, small_chunks):
+        """Test WHERE + LIMIT collects matches from several chunks"""
+        sql = f"SELECT name FROM {numbers_csv} WHERE value > 15 LIMIT 4"
+        python_result = query(str(numbers_csv)).sql(sql, backend="python").to_list()
+        pandas_result = query(str(numbers_csv)).sql(sql, backend="pandas").to_list()
+
+        assert pandas_result == python_result
+        assert pandas_result == [{"name": "n2"}, {"name": "n3"}, {"name": "n4"}, {"name": "n5"}]
+        assert list(query(str(numbers_csv)).sql(sql, backend="pandas")) == pandas_result
+
+        df = query(str(numbers_csv)).sql(sql, backend="pandas").to_dataframe()
+        assert df.to_dict("records") == pandas_result
+        assert list(df.index) == [0, 1, 2, 3]
+
+    def test_limit_stops_reading_chunks(self, numbers_csv, small_chunks, monkeypatch):
+        """Test LIMIT stops pulling chunks once satisfied"""
+        from sqlstream.core.pandas_executor import PandasExecutor
+
+        chunks_read = []
+        original = PandasExecutor._iter_chunks
+
+        def counting_iter_chunks(self, source):
+            for chunk in original(self, source):
+                chunks_read.append(len(chunk))
+                yield chunk
+
+        monkeypatch.setattr(PandasExecutor, "_iter_chunks", counting_iter_chunks)
+
+        result = (
+            query(str(numbers_csv))
+            .sql(f"SELECT * FROM {numbers_csv} LIMIT 2", backend="pandas")
+            .to_list()
+        )
+
+        assert [r["id"] for r in result] == [0, 1]
+        assert chunks_read == [3]
+
+    def test_parquet_where_limit(self, tmp_path, small_chunks):
+        """Test streaming a Parquet file in record batches"""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        parquet_file = tmp_path / "numbers.parquet"
+        table = pa.table({"id": list(range(10)), "name": [f"n{i}" for i in range(10)]})
+        pq.write_table(table, parquet_file)
+
+        result = (
+            query(str(parquet_file))
+            .sql(f"SELECT id, name FROM {parquet_file} WHERE id >= 4 LIMIT 3", backend="pandas")
+            .to_list()
+        )
+
+        assert result == [
+            {"id": 4, "name": "n4"},
+            {"id": 5, "name": "n5"},
+            {"id": 6, "name": "n6"},
+        ]
+
 
 class TestPandasBackendJoin:
     """Test JOIN with pandas backend"""
@@ -254,6 +533,35 @@ class TestPandasBackendJoin:
         charlie = next(r for r in pandas_result if r["name"] == "Charlie")
         assert pd.isna(charlie.get("amount")) or charlie.get("amount") is None
 
+    def test_inner_join_with_where_on_both_sides(self, customers_csv, orders_csv):
+        """Test WHERE conditions on each side of an INNER JOIN"""
+        pandas_result = (
+            query(str(customers_csv))
+            .sql(
+                f"SELECT * FROM {customers_csv} INNER JOIN {orders_csv} ON id = customer_id "
+                "WHERE name = 'Alice' AND amount > 120",
+                backend="pandas",
+            )
+            .to_list()
+        )
+
+        assert len(pandas_result) == 1
+        assert pandas_result[0]["order_id"] == 103
+
+    def test_left_join_with_where_on_right_side(self, customers_csv, orders_csv):
+        """Test right-side WHERE on a LEFT JOIN still drops unmatched rows"""
+        pandas_result = (
+            query(str(customers_csv))
+            .sql(
+                f"SELECT * FROM {customers_csv} LEFT JOIN {orders_csv} ON id = customer_id "
+                "WHERE amount > 120",
+                backend="pandas",
+            )
+            .to_list()
+        )
+
+        assert sorted(r["amount"] for r in pandas_result) == [150, 200]
+
 
 class TestPandasBackendAuto:
     """Test automatic backend selection"""
@@ -657,3 +965,19 @@ class TestPandasBackendMultiFormat:
         # Check total amounts
         alice_total = sum(r["amount"] for r in alice_orders)
         assert alice_total == 550
+
+
+class TestPandasBackendLazyImport:
+    """Test that pandas is only imported when the pandas backend is used"""
+
+    def test_import_sqlstream_does_not_import_pandas(self):
+        """Importing sqlstream should not pull in pandas"""
+        import subprocess
+        import sys
+
+        code = "import sys, sqlstream; print('pandas' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "False"
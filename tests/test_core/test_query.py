@@ -57,6 +57,115 @@ class TestQueryAPI:
         assert isinstance(results, list)
         assert len(results) == 5
 
+    def test_repeated_sql_reuses_parse(self, sample_csv):
+        """Test identical SQL strings are parsed once but get separate statements"""
+        from sqlstream.core import query as query_module
+
+        sql = "SELECT name FROM data WHERE age > 29 AND city = 'NYC'"
+        first = query(str(sample_csv)).sql(sql, backend="python")
+        hits = query_module._parse_cached.cache_info().hits
+        second = query(str(sample_csv)).sql(sql, backend="python")
+
+        assert query_module._parse_cached.cache_info().hits == hits + 1
+        assert first.ast is not second.ast
+        assert first.ast == second.ast
+
+        # Replacing the WHERE clause on one statement doesn't affect the other
+        first.ast.where = None
+        assert second.to_list() == [{"name": "Alice"}]
+
+    def test_pushdown_not_shared_between_queries(self, sample_csv):
+        """Test one query's filter and limit don't leak into the next on the same source"""
+        q = query(str(sample_csv))
+        assert q.reader is not None  # Shared by both queries below
+
+        first = q.sql("SELECT name FROM data WHERE age > 30 LIMIT 1", backend="python")
+        assert first.to_list() == [{"name": "Charlie"}]
+
+        second = q.sql("SELECT name FROM data", backend="python")
+        assert len(second.to_list()) == 5
+        assert q.reader.filter_conditions == []
+
+    def test_reader_created_on_first_use(self, sample_csv, monkeypatch):
+        """Test building a Query, or running it on DuckDB, doesn't create a reader"""
+        pytest.importorskip("duckdb")
+
+        def fail(source):
+            raise AssertionError("reader should not be created")
+
+        monkeypatch.setattr(Query, "_create_reader", staticmethod(fail))
+        q = query(str(sample_csv))
+        result = q.sql(f"SELECT name FROM '{sample_csv}' WHERE age > 30", backend="duckdb")
+
+        assert sorted(row["name"] for row in result) == ["Charlie", "Eve"]
+
+    def test_import_skips_optional_backends(self):
+        """Test importing sqlstream loads neither backend library nor its executor"""
+        import subprocess
+        import sys
+
+        modules = [
+            "pandas",
+            "duckdb",
+            "sqlstream.core.pandas_executor",
+            "sqlstream.core.duckdb_executor",
+        ]
+        code = f"import sys, sqlstream; print([m for m in {modules!r} if m in sys.modules])"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert out.stdout.strip() == "[]"
+
+    def test_backend_names_normalized(self, sample_csv):
+        """Test backend names are case-insensitive and None means auto"""
+        q = query(str(sample_csv))
+
+        assert q.sql("SELECT * FROM data", backend=None).backend == "auto"
+        assert q.sql("SELECT * FROM data", backend="Python").backend == "python"
+
+    def test_unknown_backend(self, sample_csv):
+        """Test an unknown backend name is rejected up front"""
+        with pytest.raises(ValueError, match="Unknown backend 'polars'"):
+            query(str(sample_csv)).sql("SELECT * FROM data", backend="polars")
+
+
+class TestCustomParserDetection:
+    """Test routing between the custom parser and DuckDB"""
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "WITH t AS (SELECT * FROM data) SELECT * FROM t",
+            "SELECT name, RANK() OVER (ORDER BY age) FROM data",
+            "SELECT city FROM data GROUP BY city having count(*) > 1",
+            "SELECT CAST(age AS VARCHAR) FROM data",
+            "SELECT * FROM data WHERE age IN (select age FROM other)",
+            "select name from data union select name from other",
+            "SELECT a, SUM(b) OVER(partition\n  by a) FROM data",
+        ],
+    )
+    def test_advanced_sql_needs_duckdb(self, sql):
+        """Test advanced features and subqueries are detected in any case"""
+        from sqlstream.core.query import _can_parse_with_custom_parser
+
+        assert not _can_parse_with_custom_parser(sql)
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT overall, lead_time FROM data WHERE casework > 1",
+            "SELECT * FROM 'reports/withdrawals.csv'",
+            "SELECT COUNT(*) FROM data",
+            "SELECT partition, region FROM data",
+        ],
+    )
+    def test_keywords_inside_words_ignored(self, sql):
+        """Test keywords are matched as whole words only"""
+        from sqlstream.core.query import _can_parse_with_custom_parser
+
+        assert _can_parse_with_custom_parser(sql)
+
 
 class TestEndToEndQueries:
     """Test end-to-end query execution"""
@@ -168,6 +277,21 @@ class TestSchemaInference:
         assert schema["name"] == DataType.STRING
         assert schema["age"] == DataType.INTEGER
 
+    def test_schema_inferred_once(self, sample_csv, monkeypatch):
+        """Test repeated .schema() calls reuse the first inference"""
+        q = query(str(sample_csv))
+        calls = []
+        original = q.reader.get_schema
+
+        def counting_get_schema():
+            calls.append(1)
+            return original()
+
+        monkeypatch.setattr(q.reader, "get_schema", counting_get_schema)
+
+        assert q.schema() is q.schema()
+        assert len(calls) == 1
+
 
 class TestExplain:
     """Test query plan explanation"""
@@ -195,6 +319,161 @@ class TestExplain:
         assert "Scan" in plan
 
 
+class TestArrowBatches:
+    """Test columnar result batches"""
+
+    @pytest.mark.parametrize("backend", ["python", "pandas", "duckdb"])
+    def test_arrow_batches_match_rows(self, sample_csv, backend):
+        """Test arrow_batches() returns the same rows as iteration"""
+        pytest.importorskip("pyarrow")
+        if backend == "pandas":
+            pytest.importorskip("pandas")
+        if backend == "duckdb":
+            pytest.importorskip("duckdb")
+
+        sql = f"SELECT name, age FROM '{sample_csv}' WHERE age > 26 ORDER BY age"
+        rows = query(str(sample_csv)).sql(sql, backend=backend).to_list()
+        batches = list(query(str(sample_csv)).sql(sql, backend=backend).arrow_batches(batch_size=2))
+
+        assert all(batch.num_rows <= 2 for batch in batches)
+        assert [row for batch in batches for row in batch.to_pylist()] == rows
+        assert batches[0].schema.names == ["name", "age"]
+
+    def test_arrow_batches_share_one_schema(self, tmp_path):
+        """Test Python backend batches share a schema when chunks infer different types"""
+        pytest.importorskip("pyarrow")
+
+        path = tmp_path / "data.jsonl"
+        path.write_text(
+            '{"a": 1, "b": null}\n{"a": 2, "b": null}\n{"a": 2.5, "b": "x"}\n{"a": 3, "b": "y"}\n'
+        )
+
+        batches = list(
+            query(str(path)).sql(f"SELECT * FROM '{path}'", backend="python").arrow_batches(2)
+        )
+
+        assert len(batches) == 2
+        assert batches[0].schema == batches[1].schema
+        assert str(batches[0].schema.field("a").type) == "double"
+        assert str(batches[0].schema.field("b").type) == "string"
+        assert [row["b"] for batch in batches for row in batch.to_pylist()] == [
+            None,
+            None,
+            "x",
+            "y",
+        ]
+
+
+class TestTupleRows:
+    """Test tuple rows"""
+
+    @pytest.mark.parametrize("backend", ["python", "pandas", "duckdb"])
+    def test_rows_match_dicts(self, sample_csv, backend):
+        """Test rows() yields the values of the dicts iteration yields"""
+        if backend == "pandas":
+            pytest.importorskip("pandas")
+        if backend == "duckdb":
+            pytest.importorskip("duckdb")
+
+        sql = f"SELECT name, age FROM '{sample_csv}' WHERE age > 26 ORDER BY age"
+        dicts = query(str(sample_csv)).sql(sql, backend=backend).to_list()
+        rows = list(query(str(sample_csv)).sql(sql, backend=backend).rows())
+
+        assert rows == [tuple(row.values()) for row in dicts]
+        assert rows[0] == ("Diana", 28)
+        assert type(rows[0][1]) is int
+
+
+class TestColumnarResults:
+    """Test whole-result DataFrame and Arrow conversion"""
+
+    @pytest.mark.parametrize("backend", ["python", "pandas", "duckdb"])
+    def test_to_dataframe_matches_rows(self, sample_csv, backend):
+        """Test to_dataframe() holds the same rows as iteration"""
+        pytest.importorskip("pandas")
+        if backend == "duckdb":
+            pytest.importorskip("duckdb")
+
+        sql = f"SELECT name, age FROM '{sample_csv}' WHERE age > 26 ORDER BY age"
+        rows = query(str(sample_csv)).sql(sql, backend=backend).to_list()
+        df = query(str(sample_csv)).sql(sql, backend=backend).to_dataframe()
+
+        assert list(df.columns) == ["name", "age"]
+        assert list(df.index) == list(range(len(rows)))
+        assert df.to_dict("records") == rows
+
+    @pytest.mark.parametrize("backend", ["python", "pandas", "duckdb"])
+    def test_to_arrow_matches_rows(self, sample_csv, backend):
+        """Test to_arrow() holds the same rows as iteration"""
+        pytest.importorskip("pyarrow")
+        if backend == "pandas":
+            pytest.importorskip("pandas")
+        if backend == "duckdb":
+            pytest.importorskip("duckdb")
+
+        sql = f"SELECT name, age FROM '{sample_csv}' WHERE age > 26 ORDER BY age"
+        rows = query(str(sample_csv)).sql(sql, backend=backend).to_list()
+        table = query(str(sample_csv)).sql(sql, backend=backend).to_arrow()
+
+        assert table.column_names == ["name", "age"]
+        assert table.to_pylist() == rows
+
+    @pytest.mark.parametrize("backend", ["python", "pandas", "duckdb"])
+    def test_to_polars_matches_rows(self, sample_csv, backend):
+        """Test to_polars() holds the same rows as iteration"""
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        if backend == "pandas":
+            pytest.importorskip("pandas")
+        if backend == "duckdb":
+            pytest.importorskip("duckdb")
+
+        sql = f"SELECT name, age FROM '{sample_csv}' WHERE age > 26 ORDER BY age"
+        rows = query(str(sample_csv)).sql(sql, backend=backend).to_list()
+        df = query(str(sample_csv)).sql(sql, backend=backend).to_polars()
+
+        assert df.columns == ["name", "age"]
+        assert df.to_dicts() == rows
+
+    @pytest.mark.parametrize("backend", ["python", "pandas", "duckdb"])
+    def test_to_parquet_matches_rows(self, sample_csv, tmp_path, backend):
+        """Test to_parquet() writes the same rows as iteration"""
+        pytest.importorskip("pyarrow")
+        if backend == "pandas":
+            pytest.importorskip("pandas")
+        if backend == "duckdb":
+            pytest.importorskip("duckdb")
+        import pyarrow.parquet as pq
+
+        sql = f"SELECT name, age FROM '{sample_csv}' WHERE age > 26 ORDER BY age"
+        rows = query(str(sample_csv)).sql(sql, backend=backend).to_list()
+        out = tmp_path / "out.parquet"
+        query(str(sample_csv)).sql(sql, backend=backend).to_parquet(str(out))
+
+        assert pq.read_table(out).to_pylist() == rows
+
+    @pytest.mark.parametrize("backend", ["python", "pandas"])
+    def test_to_parquet_type_after_first_batch(self, tmp_path, backend):
+        """Test to_parquet() when a column's type only shows up after the first batch"""
+        pytest.importorskip("pyarrow")
+        if backend == "pandas":
+            pytest.importorskip("pandas")
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "data.jsonl"
+        path.write_text(
+            '{"a": 1, "b": null}\n' * 3000 + '{"a": 1.5, "b": "x"}\n{"a": 2, "b": "y"}\n'
+        )
+        out = tmp_path / "out.parquet"
+
+        query(str(path)).sql(f"SELECT * FROM '{path}'", backend=backend).to_parquet(str(out))
+
+        table = pq.read_table(out)
+        assert table.num_rows == 3002
+        assert str(table.schema.field("a").type) == "double"
+        assert table.column("b").to_pylist()[-3:] == [None, "x", "y"]
+
+
 class TestFormatDetection:
     """Test automatic format detection"""
 
@@ -0,0 +1,123 @@
+"""
+Tests for the in-process source cache
+"""
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from sqlstream.core import source_cache  # noqa: E402
+from sqlstream.core.source_cache import (  # noqa: E402
+    cache_info,
+    clear_cache,
+    load_table,
+    set_cache_limit,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test with an empty cache and the default budget"""
+    clear_cache()
+    yield
+    set_cache_limit(source_cache.DEFAULT_MAX_BYTES)
+    clear_cache()
+
+
+def _counting_loader(calls):
+    def loader():
+        calls.append(1)
+        return pa.table({"x": [1, 2, 3]})
+
+    return loader
+
+
+class TestSourceCache:
+    def test_second_load_hits_cache(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("x\n1\n")
+        calls = []
+
+        first = load_table(str(path), _counting_loader(calls))
+        second = load_table(str(path), _counting_loader(calls))
+
+        assert len(calls) == 1
+        assert first is second
+        assert cache_info()["entries"] == 1
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("x\n1\n")
+        calls = []
+
+        load_table(str(path), _counting_loader(calls))
+        path.write_text("x\n1\n2\n")
+        load_table(str(path), _counting_loader(calls))
+
+        assert len(calls) == 2
+
+    def test_remote_sources_not_cached(self):
+        calls = []
+
+        load_table("s3://bucket/data.parquet", _counting_loader(calls))
+        load_table("s3://bucket/data.parquet", _counting_loader(calls))
+
+        assert len(calls) == 2
+        assert cache_info()["entries"] == 0
+
+    def test_evicts_by_byte_budget(self, tmp_path):
+        first = tmp_path / "a.csv"
+        second = tmp_path / "b.csv"
+        first.write_text("x\n1\n")
+        second.write_text("x\n2\n")
+        table_bytes = pa.table({"x": [1, 2, 3]}).nbytes
+
+        set_cache_limit(table_bytes)
+        load_table(str(first), _counting_loader([]))
+        load_table(str(second), _counting_loader([]))
+
+        info = cache_info()
+        assert info["entries"] == 1
+        assert info["bytes"] <= table_bytes
+
+    def test_clear_cache(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("x\n1\n")
+
+        load_table(str(path), _counting_loader([]))
+        clear_cache()
+
+        assert cache_info()["entries"] == 0
+        assert cache_info()["bytes"] == 0
+
+    def test_negative_limit_rejected(self):
+        with pytest.raises(ValueError):
+            set_cache_limit(-1)
+
+
+class TestSchemaCache:
+    def test_csv_schema_sampled_once(self, tmp_path, monkeypatch):
+        from sqlstream.core.types import DataType
+        from sqlstream.readers.csv_reader import CSVReader
+
+        path = tmp_path / "data.csv"
+        path.write_text("id,name\n1,a\n2,b\n")
+        calls = []
+        sample = CSVReader._sample_schema
+
+        def counting_sample(self, sample_size):
+            calls.append(1)
+            return sample(self, sample_size)
+
+        monkeypatch.setattr(CSVReader, "_sample_schema", counting_sample)
+
+        first = CSVReader(str(path)).get_schema()
+        first.columns["id"] = DataType.STRING
+        second = CSVReader(str(path)).get_schema()
+
+        assert len(calls) == 1
+        assert second["id"] == DataType.INTEGER
+
+        path.write_text("id,name\nx,a\n")
+        assert CSVReader(str(path)).get_schema()["id"] == DataType.STRING
+        assert len(calls) == 2
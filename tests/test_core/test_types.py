@@ -126,6 +126,16 @@ class TestInferType:
         assert infer_type("-2.5") == DataType.FLOAT
         assert infer_type("0.0") == DataType.FLOAT
 
+    def test_infer_string_integer_over_digit_limit(self):
+        """Test numerals too long for int() are inferred as FLOAT."""
+        from sqlstream.core.types import infer_type_from_string
+
+        numeral = "1" * 5000
+
+        assert infer_type(numeral) == DataType.FLOAT
+        assert infer_type_from_string(numeral) == float("inf")
+        assert infer_common_type([numeral, "2"]) == DataType.FLOAT
+
     def test_infer_string_date(self):
         """Test inferring DATE from string."""
         assert infer_type("2024-01-01") == DataType.DATE
@@ -175,6 +185,58 @@ class TestInferCommonType:
         assert infer_common_type([1.5, "world", 3.5]) == DataType.STRING
         assert infer_common_type([True, 42, "test"]) == DataType.STRING
 
+    def test_str_subclass_values_are_parsed(self):
+        """Test str subclasses such as numpy.str_ are inferred value by value."""
+        np = pytest.importorskip("numpy")
+
+        assert infer_common_type([np.str_("1"), np.str_("abc")]) == DataType.STRING
+        assert infer_common_type([np.str_("1"), np.str_("2.5")]) == DataType.FLOAT
+        assert infer_common_type([1, np.str_("1"), np.str_("abc")]) == DataType.STRING
+
+    def test_stops_once_string(self, monkeypatch):
+        """Test values after the column widens to STRING are not inferred."""
+        from sqlstream.core import types
+
+        seen = []
+        infer = types.infer_type
+
+        def recording_infer(value):
+            seen.append(value)
+            return infer(value)
+
+        monkeypatch.setattr(types, "infer_type", recording_infer)
+
+        assert infer_common_type(["1", "abc", 2, 3]) == DataType.STRING
+        assert seen == ["1", "abc"]
+
+    def test_nested_values_settle_string(self, monkeypatch):
+        """Test columns mixing in lists or dicts are STRING without inference."""
+        from sqlstream.core import types
+
+        def failing_infer(value):
+            raise AssertionError(f"inferred {value!r}")
+
+        monkeypatch.setattr(types, "infer_type", failing_infer)
+
+        assert infer_common_type(["2024-01-01", {"a": 1}, None]) == DataType.STRING
+        assert infer_common_type([1, [1, 2]]) == DataType.STRING
+
+    def test_type_runs_inferred_once(self, monkeypatch):
+        """Test runs of one non-string Python type are inferred once."""
+        from sqlstream.core import types
+
+        seen = []
+        infer = types.infer_type
+
+        def recording_infer(value):
+            seen.append(value)
+            return infer(value)
+
+        monkeypatch.setattr(types, "infer_type", recording_infer)
+
+        assert infer_common_type([1, 2, None, 3, 1.5, 2.5, "7", "8"]) == DataType.FLOAT
+        assert seen == [1, 1.5, "7", "8"]
+
 
 class TestSchema:
     """Test Schema class."""
@@ -257,6 +319,18 @@ class TestSchema:
         assert schema["name"] == DataType.STRING
         assert schema["age"] == DataType.INTEGER  # Should infer from non-null value
 
+    def test_schema_from_rows_missing_keys(self):
+        """Test rows missing a column don't affect its type."""
+        rows = [
+            {"name": "Alice", "age": 30},
+            {"name": "Bob"},
+            {"name": "Carol", "age": 25, "city": "NYC"},
+        ]
+        schema = Schema.from_rows(rows)
+
+        assert list(schema.columns) == ["name", "age"]
+        assert schema["age"] == DataType.INTEGER
+
     def test_schema_merge_same_columns(self):
         """Test merging schemas with same columns."""
         schema1 = Schema({"name": DataType.STRING, "age": DataType.INTEGER})
@@ -136,6 +136,104 @@ class TestGroupByOperator:
         assert results["NYC"] == (100, 200)
         assert results["LA"] == (150, 250)
 
+    def test_group_by_unhashable_values(self):
+        """Test list and dict group values are grouped by their string form"""
+        rows = [
+            {"tags": ["a", "b"], "n": 1},
+            {"tags": "x", "n": 2},
+            {"tags": ["a", "b"], "n": 3},
+            {"tags": {"k": 1}, "n": 4},
+        ]
+
+        class ListScan(Scan):
+            def __iter__(self):
+                yield from rows
+
+        agg = [AggregateFunction("SUM", "n", "total")]
+        groupby = GroupByOperator(ListScan(None), ["tags"], agg, [])
+
+        assert list(groupby) == [
+            {"tags": "['a', 'b']", "total": 4},
+            {"tags": "x", "total": 2},
+            {"tags": "{'k': 1}", "total": 4},
+        ]
+
+    def test_group_by_arrow_batches(self, sales_csv):
+        """Test a child producing Arrow batches is aggregated columnar"""
+        pa = pytest.importorskip("pyarrow")
+
+        class BatchScan(Scan):
+            def batches(self):
+                rows = list(self.reader.read_lazy())
+                return iter([pa.Table.from_pylist(rows[:2]), pa.Table.from_pylist(rows[2:])])
+
+        agg = [
+            AggregateFunction("COUNT", "*", None),
+            AggregateFunction("COUNT", "city", "cities"),
+            AggregateFunction("SUM", "amount", "total"),
+            AggregateFunction("AVG", "amount", "average"),
+            AggregateFunction("MIN", "product", "first_product"),
+            AggregateFunction("MAX", "amount", None),
+        ]
+        columns = ["city", "product"]
+        groupby = GroupByOperator(BatchScan(CSVReader(str(sales_csv))), columns, agg, [])
+        expected = GroupByOperator(Scan(CSVReader(str(sales_csv))), columns, agg, [])
+
+        rows = list(groupby)
+
+        assert rows == list(expected)
+        # Groups keep their order of first appearance
+        assert [(row["city"], row["product"]) for row in rows] == [
+            ("NYC", "Widget"),
+            ("NYC", "Gadget"),
+            ("LA", "Widget"),
+            ("LA", "Gadget"),
+        ]
+        assert rows[0]["total"] == 220
+        assert rows[0]["average"] == 110.0
+
+    def test_group_by_arrow_batches_inexact(self):
+        """Test aggregates Arrow can't compute exactly fall back to row-by-row"""
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"key": [0.5, 1.5, 0.5], "value": [1, 5, 2]})
+
+        class BatchScan(Scan):
+            def __iter__(self):
+                yield from table.to_pylist()
+
+            def batches(self):
+                return iter(table.to_batches())
+
+        agg = [AggregateFunction("SUM", "value", "total")]
+        groupby = GroupByOperator(BatchScan(None), ["key"], agg, [])
+
+        assert groupby._arrow_aggregations(table) is None
+        assert list(groupby) == [{"key": 0.5, "total": 3}, {"key": 1.5, "total": 5}]
+
+    def test_group_by_arrow_batches_float_sums(self):
+        """Test float sums from Arrow batches add up in row order, like row-by-row"""
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"key": ["a", "b", "a", "a", "b"], "value": [0.1, None, 0.2, 0.3, None]})
+
+        class BatchScan(Scan):
+            def __iter__(self):
+                yield from table.to_pylist()
+
+            def batches(self):
+                return iter(table.to_batches(max_chunksize=2))
+
+        agg = [
+            AggregateFunction("SUM", "value", "total"),
+            AggregateFunction("AVG", "value", "average"),
+        ]
+        groupby = GroupByOperator(BatchScan(None), ["key"], agg, [])
+
+        assert groupby._arrow_aggregations(table) is not None
+        assert list(groupby) == [
+            {"key": "a", "total": 0.1 + 0.2 + 0.3, "average": (0.1 + 0.2 + 0.3) / 3},
+            {"key": "b", "total": None, "average": None},
+        ]
+
 
 class TestOrderByOperator:
     """Test OrderBy operator"""
@@ -240,6 +338,32 @@ class TestOrderByOperator:
         assert "age" in first_row
         assert "city" in first_row
 
+    def test_order_by_nulls_last(self, tmp_path):
+        """Test NULLs sort last for both directions across several columns"""
+        csv_file = tmp_path / "nulls.csv"
+        csv_file.write_text("name,age,city\nAlice,30,\nBob,,LA\nCarol,30,NYC\nDan,25,LA\n")
+        scan = Scan(CSVReader(str(csv_file)))
+
+        orderby = OrderByOperator(
+            scan, [OrderByColumn("age", "DESC"), OrderByColumn("city", "DESC")]
+        )
+
+        assert [row["name"] for row in orderby] == ["Carol", "Alice", "Dan", "Bob"]
+
+    def test_order_by_incomparable_tiebreak_column(self):
+        """Test a later column with mixed types still sorts when earlier columns never tie"""
+        rows = [{"id": 2, "tag": "x"}, {"id": 1, "tag": 5}, {"id": 3, "tag": None}]
+
+        class ListScan(Scan):
+            def __iter__(self):
+                yield from rows
+
+        orderby = OrderByOperator(
+            ListScan(None), [OrderByColumn("id", "DESC"), OrderByColumn("tag", "ASC")]
+        )
+
+        assert [row["id"] for row in orderby] == [3, 2, 1]
+
 
 class TestCombinedGroupByOrderBy:
     """Test combining GroupBy and OrderBy"""
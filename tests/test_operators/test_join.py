@@ -272,6 +272,57 @@ class TestJoinEdgeCases:
         amounts = sorted([r["amount"] for r in results])
         assert amounts == [100, 200, 300]
 
+    def test_join_matches_keep_right_order(self, tmp_path):
+        """Test matches come out in right table order, for unique and repeated keys"""
+        customers = tmp_path / "customers.csv"
+        customers.write_text("id,name\n1,Alice\n2,Bob\n3,Charlie\n")
+
+        orders = tmp_path / "orders.csv"
+        orders.write_text(
+            "order_id,customer_id,amount\n101,1,100\n102,2,250\n103,1,300\n104,1,50\n105,4,75\n"
+        )
+
+        inner = query(str(customers)).sql(
+            f"SELECT name, amount FROM {customers} INNER JOIN {orders} ON id = customer_id",
+            backend="python",
+        )
+        right = query(str(customers)).sql(
+            f"SELECT name, amount FROM {customers} RIGHT JOIN {orders} ON id = customer_id",
+            backend="python",
+        )
+
+        assert [(r["name"], r["amount"]) for r in inner.to_list()] == [
+            ("Alice", 100),
+            ("Alice", 300),
+            ("Alice", 50),
+            ("Bob", 250),
+        ]
+        assert [r["amount"] for r in right.to_list()] == [100, 300, 50, 250, 75]
+
+    def test_right_join_unmatched_repeated_keys(self, tmp_path):
+        """Test each unmatched right row appears once, however often its key repeats"""
+        customers = tmp_path / "customers.csv"
+        customers.write_text("id,name\n1,Alice\n1,Alicia\n")
+
+        orders = tmp_path / "orders.csv"
+        orders.write_text(
+            "order_id,customer_id,amount\n101,1,100\n102,4,250\n103,1,300\n104,4,50\n"
+        )
+
+        result = query(str(customers)).sql(
+            f"SELECT name, amount FROM {customers} RIGHT JOIN {orders} ON id = customer_id",
+            backend="python",
+        )
+
+        assert [(r.get("name"), r["amount"]) for r in result.to_list()] == [
+            ("Alice", 100),
+            ("Alice", 300),
+            ("Alicia", 100),
+            ("Alicia", 300),
+            (None, 250),
+            (None, 50),
+        ]
+
     def test_join_complex_query(self, tmp_path):
         """Test JOIN with WHERE, ORDER BY, and LIMIT"""
         customers = tmp_path / "customers.csv"
@@ -191,6 +191,13 @@ class TestProjectOperator:
         assert rows[0]["name"] == "Alice"
         assert rows[0]["nonexistent"] is None
 
+    def test_project_unusual_column_names(self):
+        """Test column names that aren't identifiers are projected as-is"""
+        data = [{"first name": "Alice", 'say "hi"': 1, "{x}": 2, "a\\b": 3}]
+        project = Project(Scan(MockReader(data)), ["{x}", 'say "hi"', "first name", "a\\b"])
+
+        assert list(project) == [{"{x}": 2, 'say "hi"': 1, "first name": "Alice", "a\\b": 3}]
+
 
 class TestLimitOperator:
     """Test Limit operator"""
@@ -249,8 +256,8 @@ class TestLimitOperator:
 
         # Should only return 2 rows
         assert len(rows) == 2
-        # Generator may read one ahead, so should read at most 3 rows (not all 5)
-        assert reader.rows_read <= 3
+        # Stops right after the second row, without reading ahead
+        assert reader.rows_read == 2
 
 
 class TestOperatorChaining:
@@ -338,6 +345,104 @@ class TestEdgeCases:
         assert len(rows) == 1
         assert rows[0]["name"] == "Charlie"
 
+    def test_filter_missing_column(self):
+        """Test rows without the filtered column never match"""
+        data = [
+            {"name": "Alice", "age": 30},
+            {"name": "Bob"},
+        ]
+
+        reader = MockReader(data)
+        scan = Scan(reader)
+        filter_op = Filter(scan, [Condition("age", "!=", 25)])
+
+        rows = list(filter_op)
+
+        assert [row["name"] for row in rows] == ["Alice"]
+
+    def test_filter_arrow_batches(self, sample_data):
+        """Test a child producing Arrow batches is filtered columnar"""
+        pa = pytest.importorskip("pyarrow")
+
+        class BatchScan(Scan):
+            def batches(self):
+                return iter(
+                    [pa.Table.from_pylist(sample_data[:2]), pa.Table.from_pylist(sample_data[2:])]
+                )
+
+        conditions = [Condition("age", ">", 25), Condition("city", "!=", "SF")]
+        filter_op = Filter(BatchScan(MockReader(sample_data)), conditions)
+
+        batches = list(filter_op.batches())
+        rows = list(filter_op)
+
+        assert sum(batch.num_rows for batch in batches) == len(rows)
+        assert rows == list(Filter(Scan(MockReader(sample_data)), conditions))
+        assert Filter(Scan(MockReader(sample_data)), conditions).batches() is None
+
+    def test_filter_arrow_batches_compile_row_predicate_once(self, sample_data, monkeypatch):
+        """Test conditions Arrow can't evaluate are compiled once, not per batch"""
+        pa = pytest.importorskip("pyarrow")
+        from sqlstream.operators import filter as filter_module
+
+        class BatchScan(Scan):
+            def batches(self):
+                return iter(pa.Table.from_pylist([row]) for row in sample_data)
+
+        # Comparing a string column with a number is left to the row predicate
+        conditions = [Condition("age", ">", 20), Condition("name", "!=", 0)]
+        filter_op = Filter(BatchScan(MockReader(sample_data)), conditions)
+        calls = []
+        compile_conditions = filter_module.compile_conditions
+
+        def counting(conditions):
+            calls.append(conditions)
+            return compile_conditions(conditions)
+
+        monkeypatch.setattr(filter_module, "compile_conditions", counting)
+
+        batches = list(filter_op.batches())
+
+        assert sum(batch.num_rows for batch in batches) == len(sample_data)
+        assert calls == [[conditions[1]]]
+
+    def test_filter_arrow_rows_converted_once(self, sample_data):
+        """Test rows checked row by row aren't converted from Arrow twice"""
+        pa = pytest.importorskip("pyarrow")
+        converted = []
+
+        class CountingBatch:
+            """Arrow batch recording how many rows are converted to dicts"""
+
+            def __init__(self, batch):
+                self.batch = batch
+                self.schema = batch.schema
+                self.num_rows = batch.num_rows
+
+            def column(self, index):
+                return self.batch.column(index)
+
+            def filter(self, mask):
+                return CountingBatch(self.batch.filter(mask))
+
+            def slice(self, offset, length):
+                return CountingBatch(self.batch.slice(offset, length))
+
+            def to_pylist(self):
+                converted.append(self.num_rows)
+                return self.batch.to_pylist()
+
+        class BatchScan(Scan):
+            def batches(self):
+                return iter([CountingBatch(pa.RecordBatch.from_pylist(sample_data))])
+
+        # Comparing a string column with a number is left to the row predicate
+        conditions = [Condition("age", ">", 26), Condition("name", "!=", 0)]
+        rows = list(Filter(BatchScan(MockReader(sample_data)), conditions))
+
+        assert [row["name"] for row in rows] == ["Alice", "Charlie", "Diana", "Eve"]
+        assert sum(converted) == 4
+
     def test_project_empty_column_list(self):
         """Test project with empty column list"""
         data = [{"name": "Alice", "age": 30}]
@@ -167,6 +167,16 @@ class TestPredicatePushdown:
 
         assert len(rows) == 0
 
+    def test_filter_unknown_operator_warns(self, sample_csv_file):
+        """Test an unsupported operator warns and doesn't filter"""
+        reader = CSVReader(str(sample_csv_file))
+        reader.set_filter([Condition("age", "LIKE", 30)])
+
+        with pytest.warns(UserWarning, match="Unknown operator: LIKE"):
+            rows = list(reader.read_lazy())
+
+        assert len(rows) == 5
+
     def test_supports_pushdown(self, sample_csv_file):
         """Test that CSV reader supports pushdown"""
         reader = CSVReader(str(sample_csv_file))
@@ -526,6 +526,38 @@ class TestHTTPAdditionalFormats:
             # Should create MarkdownReader as delegate
             assert reader.delegate_reader.__class__.__name__ == "MarkdownReader"
 
+    def test_xml_format_detection(self, tmp_path):
+        """Test XML is read with XMLReader, not the CSV fallback"""
+        url = "https://example.com/feed"
+        xml_data = b'<?xml version="1.0"?>\n<rows><row><a>1</a></row><row><a>2</a></row></rows>'
+
+        mock_response = Mock()
+        mock_response.iter_bytes = Mock(return_value=[xml_data])
+        mock_response.raise_for_status = Mock()
+
+        with patch("httpx.stream") as mock_stream:
+            mock_stream.return_value.__enter__.return_value = mock_response
+
+            reader = HTTPReader(url, cache_dir=str(tmp_path))
+
+            assert reader.format == "xml"
+            assert reader.delegate_reader.__class__.__name__ == "XMLReader"
+            assert [row["a"] for row in reader.read_lazy()] == [1, 2]
+
+    def test_unknown_explicit_format_rejected(self, tmp_path):
+        """Test an explicit format without a reader raises instead of reading CSV"""
+        url = "https://example.com/data.bin"
+
+        mock_response = Mock()
+        mock_response.iter_bytes = Mock(return_value=[b"a,b\n1,2\n"])
+        mock_response.raise_for_status = Mock()
+
+        with patch("httpx.stream") as mock_stream:
+            mock_stream.return_value.__enter__.return_value = mock_response
+
+            with pytest.raises(ValueError, match="No reader registered"):
+                HTTPReader(url, cache_dir=str(tmp_path), format="avro")
+
 
 class TestHTTPCacheKeyGeneration:
     """Test cache key generation and collision handling"""
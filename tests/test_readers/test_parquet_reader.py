@@ -236,6 +236,56 @@ class TestCombinedOptimizations:
         assert len(rows) > 0
 
 
+class TestReadBatches:
+    """Test reading Arrow batches instead of rows"""
+
+    def test_batches_match_rows(self, age_stratified_parquet):
+        """Batches hold the same rows read_lazy() yields"""
+        reader = ParquetReader(str(age_stratified_parquet))
+        reader.set_filter([Condition("age", ">", 30)])
+        reader.set_columns(["name", "age"])
+        rows = list(reader.read_lazy())
+
+        reader = ParquetReader(str(age_stratified_parquet))
+        reader.set_filter([Condition("age", ">", 30)])
+        reader.set_columns(["name", "age"])
+        batch_rows = [row for batch in reader.read_batches() for row in batch.to_pylist()]
+
+        assert batch_rows == rows
+        assert reader.get_statistics()["row_groups_scanned"] < reader.total_row_groups
+
+    def test_batches_respect_limit(self, sample_parquet):
+        """Limit pushdown cuts batches short"""
+        reader = ParquetReader(str(sample_parquet))
+        reader.set_limit(25)
+
+        assert sum(batch.num_rows for batch in reader.read_batches()) == 25
+
+    def test_query_uses_batches(self, sample_parquet):
+        """Queries over Parquet give the same results through the batch path"""
+        result = query(str(sample_parquet)).sql(
+            "SELECT city, COUNT(*) AS n, SUM(salary) AS total FROM data "
+            "WHERE age > 25 GROUP BY city",
+            backend="python",
+        )
+        assert result.to_list() == [
+            {"city": "NYC", "n": 40, "total": 2900000},
+            {"city": "SF", "n": 20, "total": 1700000},
+            {"city": "LA", "n": 20, "total": 1600000},
+        ]
+
+        rows = (
+            query(str(sample_parquet))
+            .sql("SELECT name, age FROM data LIMIT 3", backend="python")
+            .to_list()
+        )
+        assert rows == [
+            {"name": "Alice", "age": 30},
+            {"name": "Bob", "age": 25},
+            {"name": "Charlie", "age": 35},
+        ]
+
+
 class TestEndToEndWithQuery:
     """Test Parquet reader through the query API"""
 
@@ -289,6 +339,45 @@ class TestEndToEndWithQuery:
         assert len(results) == 5
         assert set(results[0].keys()) == {"name"}
 
+    def test_length_hint_from_footer(self, sample_parquet):
+        """Test list() gets its row count hint from the Parquet footer"""
+        import operator
+
+        scan = query(str(sample_parquet)).sql("SELECT name FROM data", backend="python")
+        limited = query(str(sample_parquet)).sql("SELECT name FROM data LIMIT 7", backend="python")
+        filtered = query(str(sample_parquet)).sql(
+            "SELECT name FROM data WHERE age > 30", backend="python"
+        )
+
+        assert operator.length_hint(scan) == 100
+        assert operator.length_hint(limited) == 7
+        assert operator.length_hint(filtered) == 0  # No hint
+        assert len(list(scan)) == 100
+
+    def test_length_hint_builds_no_reader_for_pandas(self, sample_parquet):
+        """Test the pandas backend isn't given a reader just to compute a hint"""
+        import operator
+
+        pytest.importorskip("pandas")
+        result = query(str(sample_parquet)).sql("SELECT name FROM data", backend="pandas")
+
+        assert operator.length_hint(result) == 0
+        assert result._reader is None
+        assert len(list(result)) == 100
+
+    def test_length_hint_errors_give_no_hint(self, sample_parquet, monkeypatch):
+        """Test a failing row count lookup gives no hint instead of raising"""
+        import operator
+
+        def failing_hint(self):
+            raise OSError("unreadable footer")
+
+        monkeypatch.setattr(ParquetReader, "row_count_hint", failing_hint)
+        result = query(str(sample_parquet)).sql("SELECT name FROM data", backend="python")
+
+        assert operator.length_hint(result) == 0
+        assert len(list(result)) == 100
+
     def test_format_auto_detection(self, sample_parquet):
         """Test that .parquet extension is auto-detected"""
         q = query(str(sample_parquet))
@@ -340,6 +429,20 @@ class TestStatisticsEdgeCases:
         # Should get all rows except age 30
         assert all(row["age"] != 30 for row in rows)
 
+    def test_vectorized_and_row_filters_combined(self, sample_parquet):
+        """Test conditions Arrow can't evaluate are still applied per row"""
+        reader = ParquetReader(str(sample_parquet))
+        reader.set_filter([Condition("age", ">", 28), Condition("salary", "=", "80000")])
+
+        assert list(reader.read_lazy()) == []
+
+        reader.set_filter([Condition("age", ">", 28), Condition("city", "=", "NYC")])
+        reader.set_columns(["name", "age", "city"])
+        rows = list(reader.read_lazy())
+
+        assert len(rows) == 20
+        assert {row["name"] for row in rows} == {"Alice"}
+
     def test_all_operators(self, age_stratified_parquet):
         """Test all comparison operators"""
         operators_and_values = [
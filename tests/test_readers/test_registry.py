@@ -0,0 +1,120 @@
+"""
+Tests for the reader registry
+"""
+
+import pytest
+
+from sqlstream.readers.csv_reader import CSVReader
+from sqlstream.readers.registry import (
+    create_reader,
+    detect_format,
+    get_reader_factory,
+    register,
+)
+
+
+class TestDetectFormat:
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("data.csv", "csv"),
+            ("data.PARQUET", "parquet"),
+            ("page.htm", "html"),
+            ("README.markdown", "markdown"),
+            ("logs.jsonl", "jsonl"),
+            ("feed.xml", "xml"),
+            ("data.txt", None),
+            ("data", None),
+            ("dir.csv/data", None),
+            (".csv", None),
+            ("s3://bucket/dir/data.csv", "csv"),
+        ],
+    )
+    def test_from_extension(self, path, expected):
+        assert detect_format(path) == expected
+
+    def test_hint_takes_precedence(self):
+        assert detect_format("data.txt", "csv") == "csv"
+        assert detect_format("data.csv", "json") == "json"
+
+
+class TestCreateReader:
+    def test_csv(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("a,b\n1,2\n")
+
+        assert isinstance(create_reader(str(path)), CSVReader)
+
+    def test_unknown_extension_falls_back_to_csv(self, tmp_path):
+        path = tmp_path / "data.txt"
+        path.write_text("a,b\n1,2\n")
+
+        assert isinstance(create_reader(str(path)), CSVReader)
+
+    def test_unknown_extension_sniffs_parquet(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        import pyarrow as pa
+
+        from sqlstream.readers.parquet_reader import ParquetReader
+
+        path = tmp_path / "export.bin"
+        pq.write_table(pa.table({"a": [1, 2]}), str(path))
+
+        assert isinstance(create_reader(str(path)), ParquetReader)
+
+    def test_unknown_extension_sniffs_xml(self, tmp_path):
+        from sqlstream.readers.xml_reader import XMLReader
+
+        path = tmp_path / "feed.dat"
+        path.write_text(
+            '<?xml version="1.0"?>\n<rows><row><a>1</a></row><row><a>2</a></row></rows>\n'
+        )
+
+        assert isinstance(create_reader(str(path)), XMLReader)
+
+    def test_unknown_extension_sniffs_jsonl(self, tmp_path):
+        from sqlstream.readers.jsonl_reader import JSONLReader
+
+        path = tmp_path / "events.log"
+        path.write_text('{"a": 1}\n{"a": 2}\n')
+
+        assert isinstance(create_reader(str(path)), JSONLReader)
+
+    def test_unsupported_format_error(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            create_reader(str(tmp_path / "missing.txt"))
+
+    def test_registered_factory_is_used(self, tmp_path, monkeypatch):
+        from sqlstream.readers import registry
+
+        monkeypatch.setattr(registry, "_REGISTRY", dict(registry._REGISTRY))
+        path = tmp_path / "data.csv"
+        path.write_text("a\n1\n")
+        calls = []
+
+        def factory(source_path, table_hint):
+            calls.append((source_path, table_hint))
+            return CSVReader(source_path)
+
+        register("csv", factory)
+
+        assert get_reader_factory("csv") is factory
+        create_reader(f"{path}#csv:0")
+        assert calls == [(str(path), 0)]
+
+    def test_unregistered_format(self):
+        with pytest.raises(ValueError, match="No reader registered"):
+            get_reader_factory("nope")
+
+    def test_reader_class_is_memoized(self, tmp_path):
+        from sqlstream.readers import registry
+
+        path = tmp_path / "data.csv"
+        path.write_text("a\n1\n")
+
+        create_reader(str(path))
+        hits = registry._reader_class.cache_info().hits
+        reader = create_reader(str(path))
+
+        assert isinstance(reader, CSVReader)
+        assert registry._reader_class.cache_info().hits == hits + 1
@@ -0,0 +1,74 @@
+"""
+Tests for the SQL lexer used to discover table sources
+"""
+
+from sqlstream.sql.lexer import find_table_sources, substitute_tokens, tokenize
+
+
+class TestTokenize:
+    """Test tokenization"""
+
+    def test_drops_comments(self):
+        """Test line and block comments are skipped"""
+        tokens = list(tokenize("SELECT a -- note\nFROM /* x */ t"))
+
+        assert [text for _, text in tokens] == ["SELECT", "a", "FROM", "t"]
+
+    def test_string_literals_kept_whole(self):
+        """Test quoted strings (with escaped quotes) are single tokens"""
+        tokens = list(tokenize("SELECT 'it''s, (here)' FROM t"))
+
+        assert tokens[1] == ("string", "'it''s, (here)'")
+
+
+class TestSubstituteTokens:
+    """Test rewriting tokens in place"""
+
+    def test_keeps_comments_and_spacing(self):
+        """Test only tokens are rewritten; comments and whitespace are untouched"""
+        sql = "SELECT  a -- a\nFROM /* a */ t"
+
+        result = substitute_tokens(sql, lambda kind, text: "b" if text == "a" else text)
+
+        assert result == "SELECT  b -- a\nFROM /* a */ t"
+
+
+class TestFindTableSources:
+    """Test table source discovery"""
+
+    def test_quoted_and_unquoted(self):
+        """Test sources are reported in order with their quoting"""
+        sql = "SELECT * FROM 'a.csv' JOIN data/b.parquet ON a.id = b.id"
+
+        assert find_table_sources(sql) == [("a.csv", True), ("data/b.parquet", False)]
+
+    def test_fragment_kept(self):
+        """Test URL fragments stay part of the source"""
+        sql = "SELECT * FROM 'https://example.com/page.html#html:1'"
+
+        assert find_table_sources(sql) == [("https://example.com/page.html#html:1", True)]
+
+    def test_ignores_strings_and_comments(self):
+        """Test FROM inside string literals and comments is ignored"""
+        sql = "SELECT 'x FROM y.csv' AS s -- FROM old.csv\nFROM 'new.csv'"
+
+        assert find_table_sources(sql) == [("new.csv", True)]
+
+    def test_subquery_and_cte(self):
+        """Test sources inside subqueries and CTEs are found"""
+        sql = (
+            "WITH big AS (SELECT * FROM 'sales.csv' WHERE amount > 100) "
+            "SELECT * FROM big WHERE id IN (SELECT id FROM 'ids.csv')"
+        )
+
+        assert find_table_sources(sql) == [
+            ("sales.csv", True),
+            ("big", False),
+            ("ids.csv", True),
+        ]
+
+    def test_ignores_function_arguments(self):
+        """Test FROM inside function calls and table functions are skipped"""
+        sql = "SELECT EXTRACT(YEAR FROM o.ts) FROM read_csv('x.csv') o"
+
+        assert find_table_sources(sql) == []
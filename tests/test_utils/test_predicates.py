@@ -0,0 +1,118 @@
+"""
+Tests for compiled WHERE predicates
+"""
+
+import pytest
+
+from sqlstream.sql.ast_nodes import Condition
+from sqlstream.utils.predicates import arrow_mask, compile_condition, compile_conditions
+
+
+class TestCompileCondition:
+    """Test single-condition predicates"""
+
+    @pytest.mark.parametrize(
+        "op, expected",
+        [
+            ("=", [30]),
+            (">", [35]),
+            ("<", [25]),
+            (">=", [30, 35]),
+            ("<=", [25, 30]),
+            ("!=", [25, 35]),
+        ],
+    )
+    def test_comparisons(self, op, expected):
+        """Test each comparison operator"""
+        matches = compile_condition(Condition("age", op, 30))
+        rows = [{"age": 25}, {"age": 30}, {"age": 35}]
+
+        assert [row["age"] for row in rows if matches(row)] == expected
+
+    def test_missing_and_null_never_match(self):
+        """Test missing columns and NULL values are filtered out"""
+        matches = compile_condition(Condition("age", "!=", 30))
+
+        assert not matches({"name": "Alice"})
+        assert not matches({"age": None})
+
+    def test_type_mismatch_does_not_match(self):
+        """Test incomparable values are filtered out instead of raising"""
+        matches = compile_condition(Condition("age", ">", 30))
+
+        assert not matches({"age": "thirty"})
+
+
+class TestCompileConditions:
+    """Test AND'd condition predicates"""
+
+    def test_all_conditions_must_match(self):
+        """Test a row must satisfy every condition"""
+        matches = compile_conditions([Condition("age", ">", 25), Condition("city", "=", "NYC")])
+
+        assert matches({"age": 30, "city": "NYC"})
+        assert not matches({"age": 30, "city": "LA"})
+        assert not matches({"age": 20, "city": "NYC"})
+
+    def test_range_on_one_column(self):
+        """Test several conditions on one column, including NULLs and unknown operators"""
+        matches = compile_conditions(
+            [Condition("age", ">", 25), Condition("age", "LIKE", "3%"), Condition("age", "<", 40)]
+        )
+
+        assert [age for age in (20, 30, 40, None) if matches({"age": age})] == [30]
+        assert not matches({})
+
+    def test_no_conditions_match_everything(self):
+        """Test an empty condition list keeps every row"""
+        assert compile_conditions([])({})
+
+    def test_fused_keeps_single_condition_semantics(self):
+        """Test NULLs, mismatched types and unknown operators behave as in compile_condition"""
+        matches = compile_conditions([Condition("age", ">", 25), Condition("name", "LIKE", "A%")])
+
+        assert matches({"age": 30, "name": "Bob"})
+        assert not matches({"age": 30, "name": None})
+        assert not matches({"age": "thirty", "name": "Bob"})
+
+
+class TestArrowMask:
+    """Test vectorized masks over Arrow data"""
+
+    def test_mask_matches_row_predicates(self):
+        """Test the mask keeps the rows the compiled predicates keep"""
+        pa = pytest.importorskip("pyarrow")
+
+        table = pa.table({"age": [25, None, 35, 30], "city": ["NYC", "LA", "NYC", None]})
+        conditions = [Condition("age", ">=", 30), Condition("city", "=", "NYC")]
+
+        mask, remaining = arrow_mask(table, conditions)
+
+        assert remaining == []
+        assert table.filter(mask).to_pylist() == [{"age": 35, "city": "NYC"}]
+
+    def test_mismatched_conditions_left_for_rows(self):
+        """Test conditions Arrow would evaluate differently are not vectorized"""
+        pa = pytest.importorskip("pyarrow")
+
+        table = pa.table({"age": [25, 35], "name": ["Alice", "Bob"]})
+        conditions = [
+            Condition("age", ">", 30),
+            Condition("age", "=", "35"),
+            Condition("missing", "=", 1),
+            Condition("name", "LIKE", "A%"),
+        ]
+
+        mask, remaining = arrow_mask(table, conditions)
+
+        assert mask.to_pylist() == [False, True]
+        assert remaining == conditions[1:]
+
+    def test_nothing_vectorized(self):
+        """Test no mask is built when no condition can be vectorized"""
+        pa = pytest.importorskip("pyarrow")
+
+        mask, remaining = arrow_mask(pa.table({"age": [1]}), [Condition("age", "=", "1")])
+
+        assert mask is None
+        assert len(remaining) == 1